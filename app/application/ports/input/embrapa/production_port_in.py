@@ -1,13 +1,15 @@
-from typing import Type, List
+from typing import Iterator, Optional, Type
 from app.domain.models.entities.embrapa.production import ProductionEntity
-from pydantic import BaseModel
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
 
 class ProductionPortIn:
     """
     Interface para abstrair os casos de uso relacionados à produção.
     """
 
-    def get_production_data(self, url: str, model: Type[ProductionEntity], page: int, page_size: int) -> List[BaseModel]:
+    def get_production_data(self, url: str, model: Type[ProductionEntity], page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
         """
         Obtém os dados de produção paginados.
 
@@ -15,6 +17,39 @@ class ProductionPortIn:
         :param model: Modelo para mapear os dados.
         :param page: Número da página.
         :param page_size: Tamanho da página.
-        :return: Lista de instâncias do modelo.
+        :param filters: Filtros opcionais da consulta.
+        :param cursor: Cursor `next_cursor` de uma página anterior.
+        :return: Página com as instâncias do modelo e os metadados de paginação.
         """
-        raise NotImplementedError("Este método deve ser implementado por um adapter.")
\ No newline at end of file
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_production_version(self, url: str) -> Optional[str]:
+        """
+        Obtém a versão dos dados de produção em memória, sem carregá-los.
+
+        :param url: URL da página da Embrapa.
+        :return: Versão do dataset ou None se ele não estiver em memória.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_production_aggregation(self, url: str, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
+        """
+        Obtém os dados de produção agregados.
+
+        :param url: URL da página da Embrapa.
+        :param query: Dimensões, função de agregação, top-N e variação anual.
+        :param filters: Filtros opcionais aplicados antes da agregação.
+        :return: Grupos com o valor agregado e os metadados da agregação.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_production_export(self, url: str, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Exporta os dados de produção completos, em partes.
+
+        :param url: URL da página da Embrapa.
+        :param export_format: 'ndjson', 'csv' ou 'parquet'.
+        :param filters: Filtros opcionais aplicados antes da exportação.
+        :return: Iterador com os bytes do arquivo exportado.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
@@ -20,6 +20,15 @@ class JWTAuthPortIn:
         Decorator para validação de token JWT e permissões.
 
         :param endpoint_permission: Permissão necessária para acessar o endpoint.
+        :return: Claims do token.
         :raises Exception: Se o token for inválido ou o usuário não tiver permissão.
         """
-        raise NotImplementedError("Este método deve ser implementado por um adapter.")
\ No newline at end of file
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def invalidate_user_tokens(self, login: str):
+        """
+        Invalida as permissões gravadas nos tokens já emitidos para o usuário (apenas no processo atual).
+
+        :param login: Login do usuário cujas permissões mudaram.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
@@ -1,10 +1,102 @@
+from typing import Iterable, Optional
+from datetime import datetime
 import pandas as pd
+from app.domain.models.entities.dataprocessing.cache_manifest import CacheManifest
+from app.shared.util.file_lock import FileLock
 
 class CachePortOut:
     """
     Interface para abstrair os casos de uso relacionados ao cache.
     """
 
+    def save_dataset_to_cache(
+        self,
+        url: str,
+        df: pd.DataFrame,
+        sep: str = ";",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source_checksum: Optional[str] = None,
+        source_changed_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Salva um DataFrame no cache, no formato configurado.
+
+        :param url: URL do CSV.
+        :param df: DataFrame a ser salvo.
+        :param sep: Delimitador usado quando o formato é CSV.
+        :param etag: Cabeçalho `ETag` do arquivo de origem, se houver.
+        :param last_modified: Cabeçalho `Last-Modified` do arquivo de origem, se houver.
+        :param source_checksum: SHA-256 dos bytes baixados da origem.
+        :param source_changed_at: Data da última mudança dos bytes da origem.
+        :return: Caminho completo do arquivo salvo.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def save_dataset_chunks_to_cache(
+        self,
+        url: str,
+        chunks: Iterable[pd.DataFrame],
+        sep: str = ";",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source_checksum: Optional[str] = None,
+        source_changed_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Salva no cache um dataset recebido em partes, gravando cada parte assim que ela chega.
+
+        :param url: URL do CSV.
+        :param chunks: Partes do dataset, todas com as mesmas colunas.
+        :param sep: Delimitador usado quando o formato é CSV.
+        :param etag: Cabeçalho `ETag` do arquivo de origem, se houver.
+        :param last_modified: Cabeçalho `Last-Modified` do arquivo de origem, se houver.
+        :param source_checksum: SHA-256 dos bytes baixados da origem.
+        :param source_changed_at: Data da última mudança dos bytes da origem.
+        :return: Caminho completo do arquivo salvo.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def touch_cache(self, file_path: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Renova o cache sem regravar os dados, quando a origem não mudou.
+
+        :param file_path: Caminho do arquivo em cache.
+        :param etag: Novo cabeçalho `ETag` do arquivo de origem, se houver.
+        :param last_modified: Novo cabeçalho `Last-Modified` do arquivo de origem, se houver.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def read_dataset_from_cache(self, file_path: str, sep: str = ";") -> pd.DataFrame:
+        """
+        Lê um arquivo do cache em qualquer formato suportado, conferindo-o com o manifesto.
+
+        :param file_path: Caminho do arquivo.
+        :param sep: Delimitador usado quando o formato é CSV.
+        :return: DataFrame com os dados do arquivo.
+        :raises CorruptedCacheError: Se o arquivo não corresponder ao manifesto.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def migrate_cache(self, url: str, sep: str = ";") -> Optional[str]:
+        """
+        Converte para o formato configurado um cache válido gravado em outro formato.
+
+        :param url: URL do CSV.
+        :param sep: Delimitador usado quando algum dos formatos é CSV.
+        :return: Caminho do arquivo migrado ou None se não houver o que migrar.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_cache_file_path(self, url: str) -> str:
+        """
+        Retorna o caminho do arquivo no cache, no formato configurado, com base na URL.
+
+        :param url: URL do CSV.
+        :return: Caminho completo do arquivo no cache.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
     def save_csv_to_cache(self, url: str, df: pd.DataFrame, sep: str = ";") -> str:
         """
         Salva um DataFrame como um arquivo CSV no cache.
@@ -16,6 +108,35 @@ class CachePortOut:
         """
         raise NotImplementedError("Este método deve ser implementado por um adapter.")
 
+    def read_csv_from_cache(self, file_path: str, sep: str = ";") -> pd.DataFrame:
+        """
+        Lê um arquivo CSV do cache, conferindo-o com o manifesto.
+
+        :param file_path: Caminho do arquivo.
+        :param sep: Delimitador do CSV (padrão: ";").
+        :return: DataFrame com os dados do arquivo.
+        :raises CorruptedCacheError: Se o arquivo não corresponder ao manifesto.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_cache_manifest(self, file_path: str) -> Optional[CacheManifest]:
+        """
+        Lê o manifesto de um arquivo em cache.
+
+        :param file_path: Caminho do arquivo em cache.
+        :return: Manifesto ou None se ausente, ilegível ou de outra versão do esquema.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def is_cache_valid(self, file_path: str) -> bool:
+        """
+        Verifica de forma barata se o arquivo em cache é confiável.
+
+        :param file_path: Caminho do arquivo.
+        :return: True se o arquivo puder ser usado, False caso contrário.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
     def get_csv_file_path(self, url: str) -> str:
         """
         Retorna o caminho do arquivo CSV no cache com base na URL.
@@ -42,4 +163,48 @@ class CachePortOut:
         :param max_days: Dias máximos permitidos antes do cache expirar.
         :return: True se o cache expirou, False caso contrário.
         """
-        raise NotImplementedError("Este método deve ser implementado por um adapter.")
\ No newline at end of file
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_cache_mtime(self, file_path: str) -> float:
+        """
+        Retorna a data de modificação do arquivo em cache, usada como versão do dataset.
+
+        :param file_path: Caminho do arquivo.
+        :return: Timestamp da última modificação do arquivo.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_cache_lock(self, url: str) -> FileLock:
+        """
+        Retorna o lock de arquivo que coordena a atualização do cache da URL entre processos.
+
+        :param url: URL do CSV.
+        :return: Lock de arquivo ao lado do arquivo em cache.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_download_link(self, url: str) -> Optional[str]:
+        """
+        Retorna o link de download do CSV resolvido anteriormente para a página.
+
+        :param url: URL da página da Embrapa.
+        :return: URL do CSV ou None se ausente ou expirado.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def save_download_link(self, url: str, download_url: str) -> None:
+        """
+        Persiste o link de download do CSV resolvido para a página.
+
+        :param url: URL da página da Embrapa.
+        :param download_url: URL do CSV encontrada na página.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def invalidate_download_link(self, url: str) -> None:
+        """
+        Descarta o link de download persistido para a página.
+
+        :param url: URL da página da Embrapa.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
@@ -1,4 +1,5 @@
-from typing import List, Type, Optional
+from typing import BinaryIO, Iterator, Type, Optional, Union
+import pandas as pd
 from enum import Enum
 from pydantic import BaseModel
 
@@ -9,20 +10,69 @@ class CSVPortOut:
 
     def process_csv(
         self,
-        file_path: str,
+        file_path: Union[str, BinaryIO],
         model: Type[BaseModel],
         category_enum: Optional[Type[Enum]] = None,
         value_name_column: str = "production",
         delimiter: str = ";"
-    ) -> List[BaseModel]:
+    ) -> pd.DataFrame:
         """
-        Processa os dados de um arquivo CSV e retorna uma lista de instâncias do BaseModel.
+        Processa os dados de um arquivo CSV e retorna um DataFrame validado contra o BaseModel.
 
-        :param file_path: Caminho do arquivo CSV.
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
         :param model: O BaseModel para mapear os dados.
         :param category_enum: Enum opcional para filtrar categorias.
         :param value_name_column: Nome da coluna de valores (padrão: "production").
         :param delimiter: Delimitador do CSV (padrão: ";").
-        :return: Lista de instâncias do BaseModel.
+        :return: DataFrame com as colunas do BaseModel e apenas as linhas válidas.
         """
-        raise NotImplementedError("Este método deve ser implementado por um adapter.")
\ No newline at end of file
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def process_csv_in_pool(
+        self,
+        file_path: Union[str, BinaryIO],
+        model: Type[BaseModel],
+        category_enum: Optional[Type[Enum]] = None,
+        value_name_column: str = "production",
+        delimiter: str = ";"
+    ) -> pd.DataFrame:
+        """
+        Processa os dados de um arquivo CSV em um processo separado, permitindo
+        que vários CSVs sejam processados em paralelo em núcleos diferentes.
+
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
+        :param model: O BaseModel para mapear os dados.
+        :param category_enum: Enum opcional para filtrar categorias.
+        :param value_name_column: Nome da coluna de valores (padrão: "production").
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :return: DataFrame com as colunas do BaseModel e apenas as linhas válidas.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def shutdown_pool(self) -> None:
+        """
+        Encerra os processos usados por `process_csv_in_pool`, liberando a memória deles.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def process_csv_in_chunks(
+        self,
+        file_path: Union[str, BinaryIO],
+        model: Type[BaseModel],
+        category_enum: Optional[Type[Enum]] = None,
+        value_name_column: str = "production",
+        delimiter: str = ";",
+        chunk_rows: int = 500
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Processa os dados de um arquivo CSV em partes, mantendo apenas uma parte em memória por vez.
+
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
+        :param model: O BaseModel para mapear os dados.
+        :param category_enum: Enum opcional para filtrar categorias.
+        :param value_name_column: Nome da coluna de valores (padrão: "production").
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :param chunk_rows: Quantidade de linhas do arquivo lidas por parte.
+        :return: Iterador de DataFrames com as colunas do BaseModel e apenas as linhas válidas.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
@@ -0,0 +1,53 @@
+from typing import Optional, Type
+from pydantic import BaseModel
+import pandas as pd
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
+
+class DatasetCachePortOut:
+    """
+    Interface para abstrair o cache em memória dos datasets já processados.
+    """
+
+    def get_dataset(self, url: str, model: Type[BaseModel], mtime: float) -> Optional[pd.DataFrame]:
+        """
+        Retorna o dataset em memória, se existir e corresponder à versão do arquivo em cache.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param mtime: Data de modificação do arquivo em cache.
+        :return: DataFrame em memória ou None se não houver entrada válida.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def put_dataset(self, url: str, model: Type[BaseModel], mtime: float, df: pd.DataFrame) -> None:
+        """
+        Armazena um dataset processado em memória.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param mtime: Data de modificação do arquivo em cache que originou o dataset.
+        :param df: DataFrame a ser armazenado.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_dataset_version(self, url: str, model: Type[BaseModel], mtime: float) -> Optional[str]:
+        """
+        Retorna a versão (hash do conteúdo) do dataset em memória, sem carregá-lo.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param mtime: Data de modificação do arquivo em cache.
+        :return: Versão do dataset ou None se não houver entrada válida em memória.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_dataset_index(self, url: str, model: Type[BaseModel], df: pd.DataFrame) -> DatasetIndex:
+        """
+        Retorna os índices do dataset, construídos quando ele foi carregado em memória.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param df: DataFrame retornado para a consulta.
+        :return: Índices do DataFrame.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
@@ -1,7 +1,10 @@
-from typing import Optional, Type
+from typing import Dict, Iterable, Optional, Type
+from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel
 import pandas as pd
+from app.domain.models.entities.embrapa.embrapa_dataset import EmbrapaDataset
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
 
 class EmbrapaPortOut:
     """
@@ -16,4 +19,64 @@ class EmbrapaPortOut:
         :param delimiter: Delimitador do CSV (padrão: ";").
         :return: Caminho do arquivo CSV processado.
         """
-        raise NotImplementedError("Este método deve ser implementado por um adapter.")
\ No newline at end of file
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def refresh_csv_data(self, url: str, model: Type[BaseModel], category_enum: Optional[Type[Enum]] = None, value_name_column: str = "production", delimiter: str = ";") -> pd.DataFrame:
+        """
+        Baixa, processa e grava no cache a versão atual do CSV da Embrapa.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo para mapear os dados do CSV.
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :return: DataFrame com os dados atualizados.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def refresh_datasets(self, datasets: Iterable[EmbrapaDataset]) -> Dict[str, pd.DataFrame]:
+        """
+        Atualiza vários datasets em paralelo.
+
+        :param datasets: Datasets da Embrapa a serem atualizados.
+        :return: DataFrames atualizados, indexados pelo nome do dataset (apenas os que tiveram sucesso).
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_dataset_version(self, url: str, model: Type[BaseModel]) -> Optional[str]:
+        """
+        Retorna a versão do dataset em memória, sem carregá-lo.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :return: Versão do dataset ou None se ele não estiver em memória.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_dataset_index(self, url: str, model: Type[BaseModel], df: pd.DataFrame) -> DatasetIndex:
+        """
+        Retorna os índices (ano, país, produto, categoria, controle) do dataset obtido em `get_csv_data`.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param df: DataFrame retornado por `get_csv_data`.
+        :return: Índices do DataFrame.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_last_changed_upstream(self, url: str) -> Optional[datetime]:
+        """
+        Retorna quando o CSV da URL mudou pela última vez na Embrapa.
+
+        :param url: URL da página da Embrapa.
+        :return: Data da última mudança ou None se desconhecida.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def get_cache_age(self, url: str, delimiter: str = ";") -> Optional[float]:
+        """
+        Retorna há quantos segundos o dataset da URL foi gravado no cache.
+
+        :param url: URL da página da Embrapa.
+        :param delimiter: Delimitador do CSV, usado se o cache precisar ser migrado de formato.
+        :return: Idade do cache em segundos ou None se não houver cópia em cache.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
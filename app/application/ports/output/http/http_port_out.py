@@ -0,0 +1,18 @@
+from typing import Dict, Optional
+import requests
+
+class HttpPortOut:
+    """
+    Interface para abstrair as requisições HTTP a serviços externos.
+    """
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Faz uma requisição GET reaproveitando as conexões abertas.
+
+        :param url: URL a ser requisitada.
+        :param headers: Cabeçalhos adicionais (ex.: `If-None-Match`).
+        :return: Resposta HTTP.
+        :raises requests.RequestException: Em caso de falha de conexão ou timeout.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
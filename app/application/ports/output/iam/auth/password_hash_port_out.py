@@ -0,0 +1,32 @@
+class PasswordHashPortOut:
+    """
+    Interface para abstrair o hash e a verificação de senhas.
+    """
+
+    def hash_password(self, password: str) -> str:
+        """
+        Gera o hash da senha.
+
+        :param password: Senha em texto puro.
+        :return: Hash da senha, com o algoritmo e o custo usados.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        """
+        Confere a senha com o hash armazenado.
+
+        :param password: Senha em texto puro.
+        :param password_hash: Hash armazenado.
+        :return: True se a senha corresponder ao hash.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Indica se o hash foi gerado com parâmetros diferentes dos atuais.
+
+        :param password_hash: Hash armazenado.
+        :return: True se o hash deve ser gerado novamente.
+        """
+        raise NotImplementedError("Este método deve ser implementado por um adapter.")
@@ -27,4 +27,12 @@ class LocalDBPortOut:
         :param login: The login of the user to be retrieved.
         :return: UserEntity instance containing user data.
         """
-        raise NotImplementedError("Method not implemented.")
\ No newline at end of file
+        raise NotImplementedError("Method not implemented.")
+
+    def update_password(self, login: str, password_hash: str):
+        """
+        Replace the stored password hash of a user.
+        :param login: The login of the user.
+        :param password_hash: The new password hash.
+        """
+        raise NotImplementedError("Method not implemented.")
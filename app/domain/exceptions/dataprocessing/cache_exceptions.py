@@ -0,0 +1,2 @@
+class CorruptedCacheError(Exception):
+    pass
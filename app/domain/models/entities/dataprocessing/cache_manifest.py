@@ -0,0 +1,20 @@
+from typing import Optional
+from pydantic import BaseModel
+from datetime import datetime
+
+class CacheManifest(BaseModel):
+    url: str
+    format: str = "csv"
+    schema_version: int
+    row_count: int
+    size: int
+    checksum: str
+    # Identificador dos dados, gravado também nos metadados do arquivo Feather
+    content_id: Optional[str] = None
+    fetched_at: datetime
+    # Validadores HTTP do arquivo de origem, usados nas requisições condicionais
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Checksum dos bytes baixados da origem e data da última mudança desses bytes
+    source_checksum: Optional[str] = None
+    source_changed_at: Optional[datetime] = None
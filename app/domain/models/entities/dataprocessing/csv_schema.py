@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import List
+
+class CSVSchema(BaseModel):
+    """
+    Esquema declarativo das colunas de um CSV da Embrapa.
+
+    As colunas são indicadas pela posição no arquivo, pois os nomes variam entre
+    os arquivos (ex.: 'id' e 'Id'). As colunas não listadas são colunas de ano.
+    """
+    id_columns: List[int] = [0]
+    text_columns: List[int] = []
+    null_markers: List[str] = ["nd", "*"]
+    decimal: str = ","
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List
+
+class RejectedRow(BaseModel):
+    row: int
+    data: Dict[str, Any]
+    errors: List[str]
+
+class CSVValidationReport(BaseModel):
+    model: str
+    total_rows: int
+    accepted_rows: int
+    rejected_rows: List[RejectedRow] = []
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+class DownloadLink(BaseModel):
+    url: str
+    download_url: str
+    resolved_at: datetime
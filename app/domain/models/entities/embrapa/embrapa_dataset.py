@@ -0,0 +1,75 @@
+from typing import Dict, Optional, Type
+from enum import Enum
+from pydantic import BaseModel
+from app.domain.models.entities.embrapa.production import ProductionEntity, ProductionCategoryEnum
+from app.domain.models.entities.embrapa.processing import ProcessingEntity, ProcessingCategoryEnum
+from app.domain.models.entities.embrapa.marketing import MarketingEntity, MarketingCategoryEnum
+from app.domain.models.entities.embrapa.importation import ImportationEntity
+from app.domain.models.entities.embrapa.exportation import ExportationEntity
+from app.shared.config import settings
+
+class EmbrapaDataset(BaseModel):
+    """
+    Descrição de um dataset da Embrapa e dos parâmetros usados para processá-lo.
+    """
+    name: str
+    option: str
+    model: Type[BaseModel]
+    category_enum: Optional[Type[Enum]] = None
+    value_name_column: str
+    delimiter: str = ";"
+
+    @property
+    def url(self) -> str:
+        """
+        URL da página da Embrapa que contém o link de download do dataset.
+        """
+        return f"{settings.EMBRAPA_BASE_URL}/index.php?opcao={self.option}"
+
+PRODUCTION_DATASET = EmbrapaDataset(
+    name="production",
+    option="opt_02",
+    model=ProductionEntity,
+    category_enum=ProductionCategoryEnum,
+    value_name_column="production",
+    delimiter=";"
+)
+
+PROCESSING_DATASET = EmbrapaDataset(
+    name="processing",
+    option="opt_03",
+    model=ProcessingEntity,
+    category_enum=ProcessingCategoryEnum,
+    value_name_column="processing",
+    delimiter=";"
+)
+
+MARKETING_DATASET = EmbrapaDataset(
+    name="marketing",
+    option="opt_04",
+    model=MarketingEntity,
+    category_enum=MarketingCategoryEnum,
+    value_name_column="marketing",
+    delimiter=";"
+)
+
+IMPORTATION_DATASET = EmbrapaDataset(
+    name="importation",
+    option="opt_05",
+    model=ImportationEntity,
+    value_name_column="importation",
+    delimiter="\t"
+)
+
+EXPORTATION_DATASET = EmbrapaDataset(
+    name="exportation",
+    option="opt_06",
+    model=ExportationEntity,
+    value_name_column="exportation",
+    delimiter="\t"
+)
+
+EMBRAPA_DATASETS: Dict[str, EmbrapaDataset] = {
+    dataset.name: dataset
+    for dataset in (PRODUCTION_DATASET, PROCESSING_DATASET, MARKETING_DATASET, IMPORTATION_DATASET, EXPORTATION_DATASET)
+}
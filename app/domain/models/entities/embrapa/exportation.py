@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from app.domain.models.entities.dataprocessing.csv_schema import CSVSchema
 from typing import ClassVar
 
 class ExportationEntity(BaseModel):
@@ -11,4 +12,6 @@ class ExportationEntity(BaseModel):
     schema_equivalence: ClassVar[dict[str, str]] = {
         "Id": "id",
         "país": "country"
-    }
\ No newline at end of file
+    }
+
+    csv_schema: ClassVar[CSVSchema] = CSVSchema(id_columns=[0], text_columns=[1])
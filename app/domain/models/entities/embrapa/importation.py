@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from app.domain.models.entities.dataprocessing.csv_schema import CSVSchema
 from typing import ClassVar
 
 class ImportationEntity(BaseModel):
@@ -10,4 +11,6 @@ class ImportationEntity(BaseModel):
 
     schema_equivalence: ClassVar[dict[str, str]] = {
         "país": "country",
-    }
\ No newline at end of file
+    }
+
+    csv_schema: ClassVar[CSVSchema] = CSVSchema(id_columns=[0], text_columns=[1])
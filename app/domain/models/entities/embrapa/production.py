@@ -1,5 +1,6 @@
 from typing import Optional, ClassVar
 from pydantic import BaseModel, Field, model_validator
+from app.domain.models.entities.dataprocessing.csv_schema import CSVSchema
 from enum import Enum
 from app.shared.util.util import Util
 
@@ -33,4 +34,5 @@ class ProductionEntity(BaseModel):
     schema_equivalence: ClassVar[dict[str, str]] = {
             "produto": "product"
         }
-        
\ No newline at end of file
+
+    csv_schema: ClassVar[CSVSchema] = CSVSchema(id_columns=[0], text_columns=[1, 2])
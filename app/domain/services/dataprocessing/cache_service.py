@@ -1,28 +1,340 @@
 import os
+import io
 import hashlib
+import logging
+import tempfile
+import uuid
+from functools import lru_cache
 import pandas as pd
+from typing import BinaryIO, Iterable, Optional, Tuple
+from pydantic import ValidationError
 from app.shared.config import settings
-from datetime import datetime, timedelta
+from app.shared.util.file_lock import FileLock
+from app.domain.models.entities.dataprocessing.cache_manifest import CacheManifest
+from app.domain.models.entities.dataprocessing.download_link import DownloadLink
+from app.domain.exceptions.dataprocessing.cache_exceptions import CorruptedCacheError
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+# Extensão dos arquivos em cache para cada formato suportado
+CACHE_FORMAT_EXTENSIONS = {"csv": ".csv", "feather": ".feather", "parquet": ".parquet"}
+
+# Chave, nos metadados do esquema Arrow, do `content_id` do manifesto
+CONTENT_ID_METADATA_KEY = b"cache_content_id"
 
 class CacheService:
     """
     Serviço para manipulação de cache.
+
+    Cada arquivo em cache é acompanhado de um manifesto (`<md5>.manifest.json`)
+    com a quantidade de linhas, o checksum, a versão do esquema e a data da busca.
+    Arquivo e manifesto são gravados de forma atômica (arquivo temporário, fsync
+    e `os.replace`), de modo que leitores nunca enxergam um arquivo pela metade.
+
+    O manifesto é gravado antes do arquivo e toda leitura confere o arquivo com
+    ele (checksum no CSV e no Parquet, `content_id` nos metadados do Feather):
+    entre as duas gravações, ou se o processo cair no meio, o arquivo antigo é
+    recusado como `CorruptedCacheError` em vez de ser servido com o manifesto novo.
+
+    O formato dos arquivos é definido por `CACHE_FORMAT`: `csv`, `feather`
+    (Arrow IPC, sem compressão) ou `parquet`. Os formatos binários exigem
+    o pacote `pyarrow`.
     """
 
-    def save_csv_to_cache(self, url: str, df: pd.DataFrame, sep: str = ";") -> str:
+    # Incrementar quando o formato dos dados gravados em cache mudar
+    SCHEMA_VERSION = 3
+
+    def save_dataset_to_cache(
+        self,
+        url: str,
+        df: pd.DataFrame,
+        sep: str = ";",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source_checksum: Optional[str] = None,
+        source_changed_at: Optional[datetime] = None
+    ) -> str:
         """
-        Salva um DataFrame como um arquivo CSV no cache.
+        Salva um DataFrame no cache, no formato configurado em `CACHE_FORMAT`.
 
         :param url: URL do CSV.
         :param df: DataFrame a ser salvo.
+        :param sep: Delimitador usado quando o formato é CSV.
+        :param etag: Cabeçalho `ETag` do arquivo de origem, se houver.
+        :param last_modified: Cabeçalho `Last-Modified` do arquivo de origem, se houver.
+        :param source_checksum: SHA-256 dos bytes baixados da origem.
+        :param source_changed_at: Data da última mudança dos bytes da origem.
         :return: Caminho completo do arquivo salvo.
         """
-        file_hash = hashlib.md5(url.encode()).hexdigest()
-        file_path = os.path.join(settings.CACHE_FOLDER, f"{file_hash}.csv")
+        cache_format = self.get_cache_format()
+        content_id = uuid.uuid4().hex
+        if cache_format == "csv":
+            content = df.to_csv(index=False, encoding="utf-8", sep=sep).encode("utf-8")
+        else:
+            buffer = io.BytesIO()
+            if cache_format == "feather":
+                import pyarrow as pa
+                from pyarrow import feather
+
+                table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+                table = table.replace_schema_metadata(self._with_content_id(table.schema, content_id).metadata)
+                # Sem compressão para que a leitura possa mapear o arquivo em memória
+                feather.write_feather(table, buffer, compression="uncompressed")
+            else:
+                df.to_parquet(buffer, index=False)
+            content = buffer.getvalue()
+
+        return self._save_content(
+            url=url,
+            df=df,
+            content=content,
+            cache_format=cache_format,
+            content_id=content_id,
+            etag=etag,
+            last_modified=last_modified,
+            source_checksum=source_checksum,
+            source_changed_at=source_changed_at
+        )
+
+    def save_dataset_chunks_to_cache(
+        self,
+        url: str,
+        chunks: Iterable[pd.DataFrame],
+        sep: str = ";",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source_checksum: Optional[str] = None,
+        source_changed_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Salva no cache um dataset recebido em partes, gravando cada parte assim que ela chega.
+
+        Apenas uma parte fica em memória por vez: o arquivo é montado em um arquivo
+        temporário (CSV com o cabeçalho apenas na primeira parte, ou um único arquivo
+        Arrow/Parquet com o esquema da primeira parte) e só então movido para o destino.
+
+        :param url: URL do CSV.
+        :param chunks: Partes do dataset, todas com as mesmas colunas.
+        :param sep: Delimitador usado quando o formato é CSV.
+        :param etag: Cabeçalho `ETag` do arquivo de origem, se houver.
+        :param last_modified: Cabeçalho `Last-Modified` do arquivo de origem, se houver.
+        :param source_checksum: SHA-256 dos bytes baixados da origem.
+        :param source_changed_at: Data da última mudança dos bytes da origem.
+        :return: Caminho completo do arquivo salvo.
+        """
+        cache_format = self.get_cache_format()
+        file_path = self.get_cache_file_path(url=url, cache_format=cache_format)
         os.makedirs(settings.CACHE_FOLDER, exist_ok=True)
-        df.to_csv(file_path, index=False, encoding="utf-8", sep=sep)
+
+        content_id = uuid.uuid4().hex
+        fd, tmp_path = tempfile.mkstemp(dir=settings.CACHE_FOLDER, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                row_count = self._write_chunks(file=file, chunks=chunks, cache_format=cache_format, sep=sep, content_id=content_id)
+
+            size, checksum = self._hash_file(tmp_path)
+            manifest = CacheManifest(
+                url=url,
+                format=cache_format,
+                schema_version=self.SCHEMA_VERSION,
+                row_count=row_count,
+                size=size,
+                checksum=checksum,
+                content_id=content_id,
+                fetched_at=datetime.now(timezone.utc),
+                etag=etag,
+                last_modified=last_modified,
+                source_checksum=source_checksum,
+                source_changed_at=source_changed_at
+            )
+            # O manifesto vem primeiro: até o arquivo ser trocado, o antigo não confere com ele
+            self._write_atomic(self.get_manifest_file_path(file_path), manifest.model_dump_json().encode("utf-8"))
+            self._commit_file(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
         return file_path
 
+    def touch_cache(self, file_path: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Renova o cache sem regravar os dados, quando a origem não mudou.
+
+        Atualiza a data de modificação do arquivo (que define a expiração), a
+        data da busca registrada no manifesto e, se informados, os validadores HTTP.
+
+        :param file_path: Caminho do arquivo em cache.
+        :param etag: Novo cabeçalho `ETag` do arquivo de origem, se houver.
+        :param last_modified: Novo cabeçalho `Last-Modified` do arquivo de origem, se houver.
+        """
+        manifest = self.get_cache_manifest(file_path)
+        if manifest is None:
+            raise CorruptedCacheError(f"Manifesto ausente ou inválido para '{file_path}'.")
+
+        manifest.fetched_at = datetime.now(timezone.utc)
+        if etag is not None:
+            manifest.etag = etag
+        if last_modified is not None:
+            manifest.last_modified = last_modified
+        self._write_atomic(self.get_manifest_file_path(file_path), manifest.model_dump_json().encode("utf-8"))
+        os.utime(file_path)
+
+    def read_dataset_from_cache(self, file_path: str, sep: str = ";") -> pd.DataFrame:
+        """
+        Lê um arquivo do cache em qualquer um dos formatos suportados, conferindo-o com o manifesto.
+
+        Arquivos Feather são mapeados em memória (o Arrow lê direto do page cache,
+        sem copiar o arquivo para o heap), mas o DataFrame retornado é uma cópia
+        completa das colunas. Em vez do checksum completo, são
+        conferidos o tamanho, a quantidade de linhas e o `content_id` gravado nos
+        metadados do arquivo, que identifica a gravação descrita pelo manifesto.
+
+        :param file_path: Caminho do arquivo.
+        :param sep: Delimitador usado quando o formato é CSV.
+        :return: DataFrame com os dados do arquivo.
+        :raises CorruptedCacheError: Se o arquivo não corresponder ao manifesto.
+        """
+        manifest = self.get_cache_manifest(file_path)
+        if manifest is None:
+            raise CorruptedCacheError(f"Manifesto ausente ou inválido para '{file_path}'.")
+
+        if manifest.format == "csv":
+            return self.read_csv_from_cache(file_path=file_path, sep=sep)
+
+        try:
+            if manifest.format == "feather":
+                if os.path.getsize(file_path) != manifest.size:
+                    raise CorruptedCacheError(f"Tamanho de '{file_path}' não confere com o manifesto.")
+                from pyarrow import feather
+                table = feather.read_table(file_path, memory_map=True)
+                content_id = (table.schema.metadata or {}).get(CONTENT_ID_METADATA_KEY)
+                if manifest.content_id is None or content_id != manifest.content_id.encode("utf-8"):
+                    raise CorruptedCacheError(f"Conteúdo de '{file_path}' não corresponde ao manifesto.")
+                # `to_pandas` copia as colunas (as de texto viram objetos Python); o
+                # `split_blocks`/`self_destruct` não reduziu a memória residente medida
+                df = table.to_pandas()
+            else:
+                content = self._read_verified_content(file_path=file_path, manifest=manifest)
+                df = pd.read_parquet(io.BytesIO(content))
+        except CorruptedCacheError:
+            raise
+        except Exception as e:
+            raise CorruptedCacheError(f"Falha ao ler '{file_path}'.") from e
+
+        if len(df) != manifest.row_count:
+            raise CorruptedCacheError(f"Quantidade de linhas de '{file_path}' não confere com o manifesto.")
+
+        return df
+
+    def migrate_cache(self, url: str, sep: str = ";") -> Optional[str]:
+        """
+        Converte para o formato configurado um cache válido gravado em outro formato.
+
+        A data de modificação e a data da busca originais são preservadas, de modo
+        que a migração não altera a expiração do cache. Usa o lock de arquivo da
+        URL, portanto não deve ser chamado por quem já o detém.
+
+        :param url: URL do CSV.
+        :param sep: Delimitador usado quando algum dos formatos é CSV.
+        :return: Caminho do arquivo migrado ou None se não houver o que migrar.
+        """
+        target_format = self.get_cache_format()
+        with self.get_cache_lock(url=url):
+            # Outro worker pode ter migrado o cache enquanto aguardávamos o lock
+            if self.is_cache_valid(self.get_cache_file_path(url=url, cache_format=target_format)):
+                return None
+
+            for cache_format in CACHE_FORMAT_EXTENSIONS:
+                if cache_format == target_format:
+                    continue
+
+                file_path = self.get_cache_file_path(url=url, cache_format=cache_format)
+                if not self.is_cache_valid(file_path):
+                    continue
+
+                try:
+                    df = self.read_dataset_from_cache(file_path=file_path, sep=sep)
+                except CorruptedCacheError:
+                    continue
+
+                manifest = self.get_cache_manifest(file_path)
+                mtime = self.get_cache_mtime(file_path)
+                new_file_path = self.save_dataset_to_cache(url=url, df=df, sep=sep)
+
+                # Mantém os dados da origem do manifesto antigo, trocando apenas os do arquivo
+                new_manifest = manifest.model_copy(
+                    update=self.get_cache_manifest(new_file_path).model_dump(include={"format", "row_count", "size", "checksum", "content_id"})
+                )
+                self._write_atomic(self.get_manifest_file_path(new_file_path), new_manifest.model_dump_json().encode("utf-8"))
+                os.utime(new_file_path, (mtime, mtime))
+
+                # O manifesto é único por URL e já descreve o novo arquivo
+                os.remove(file_path)
+
+                logger.info("Cache migrado de formato.", extra={"url": url, "from": cache_format, "to": target_format})
+                return new_file_path
+
+        return None
+
+    def get_cache_format(self) -> str:
+        """
+        Retorna o formato de cache configurado, caindo para CSV se `pyarrow` não estiver disponível.
+
+        :return: 'csv', 'feather' ou 'parquet'.
+        """
+        cache_format = settings.CACHE_FORMAT
+        if cache_format not in CACHE_FORMAT_EXTENSIONS:
+            raise ValueError(f"Formato de cache não suportado: '{cache_format}'.")
+
+        if cache_format != "csv" and not _pyarrow_available(cache_format):
+            return "csv"
+        return cache_format
+
+    def get_cache_file_path(self, url: str, cache_format: Optional[str] = None) -> str:
+        """
+        Retorna o caminho do arquivo no cache com base na URL e no formato.
+
+        :param url: URL do CSV.
+        :param cache_format: Formato do arquivo (padrão: formato configurado).
+        :return: Caminho completo do arquivo no cache.
+        """
+        extension = CACHE_FORMAT_EXTENSIONS[cache_format or self.get_cache_format()]
+        file_hash = hashlib.md5(url.encode()).hexdigest()
+        return os.path.join(settings.CACHE_FOLDER, f"{file_hash}{extension}")
+
+    def save_csv_to_cache(self, url: str, df: pd.DataFrame, sep: str = ";") -> str:
+        """
+        Salva um DataFrame como um arquivo CSV no cache.
+
+        :param url: URL do CSV.
+        :param df: DataFrame a ser salvo.
+        :return: Caminho completo do arquivo salvo.
+        """
+        content = df.to_csv(index=False, encoding="utf-8", sep=sep).encode("utf-8")
+        return self._save_content(url=url, df=df, content=content, cache_format="csv")
+
+    def read_csv_from_cache(self, file_path: str, sep: str = ";") -> pd.DataFrame:
+        """
+        Lê um arquivo CSV do cache, conferindo-o com o manifesto.
+
+        :param file_path: Caminho do arquivo.
+        :param sep: Delimitador do CSV (padrão: ";").
+        :return: DataFrame com os dados do arquivo.
+        :raises CorruptedCacheError: Se o arquivo não corresponder ao manifesto.
+        """
+        manifest = self.get_cache_manifest(file_path)
+        if manifest is None:
+            raise CorruptedCacheError(f"Manifesto ausente ou inválido para '{file_path}'.")
+
+        content = self._read_verified_content(file_path=file_path, manifest=manifest)
+        df = pd.read_csv(io.BytesIO(content), delimiter=sep)
+        if len(df) != manifest.row_count:
+            raise CorruptedCacheError(f"Quantidade de linhas de '{file_path}' não confere com o manifesto.")
+
+        return df
+
     def get_csv_file_path(self, url: str) -> str:
         """
         Retorna o caminho do arquivo CSV no cache com base na URL.
@@ -30,8 +342,33 @@ class CacheService:
         :param url: URL do CSV.
         :return: Caminho completo do arquivo no cache.
         """
-        file_hash = hashlib.md5(url.encode()).hexdigest()
-        return os.path.join(settings.CACHE_FOLDER, f"{file_hash}.csv")
+        return self.get_cache_file_path(url=url, cache_format="csv")
+
+    def get_manifest_file_path(self, file_path: str) -> str:
+        """
+        Retorna o caminho do manifesto de um arquivo em cache.
+
+        :param file_path: Caminho do arquivo em cache.
+        :return: Caminho do manifesto.
+        """
+        return os.path.splitext(file_path)[0] + ".manifest.json"
+
+    def get_cache_manifest(self, file_path: str) -> Optional[CacheManifest]:
+        """
+        Lê o manifesto de um arquivo em cache.
+
+        :param file_path: Caminho do arquivo em cache.
+        :return: Manifesto ou None se ausente, ilegível ou de outra versão do esquema.
+        """
+        try:
+            with open(self.get_manifest_file_path(file_path), "rb") as file:
+                manifest = CacheManifest.model_validate_json(file.read())
+        except (OSError, ValidationError):
+            return None
+
+        if manifest.schema_version != self.SCHEMA_VERSION:
+            return None
+        return manifest
 
     def is_file_in_cache(self, file_path: str) -> bool:
         """
@@ -42,7 +379,25 @@ class CacheService:
         """
         return os.path.exists(file_path)
 
-    
+    def is_cache_valid(self, file_path: str) -> bool:
+        """
+        Verifica de forma barata se o arquivo em cache é confiável: o manifesto
+        existe, é da versão atual do esquema e o tamanho do arquivo confere.
+
+        :param file_path: Caminho do arquivo.
+        :return: True se o arquivo puder ser usado, False caso contrário.
+        """
+        manifest = self.get_cache_manifest(file_path)
+        if manifest is None:
+            return False
+
+        if os.path.splitext(file_path)[1] != CACHE_FORMAT_EXTENSIONS.get(manifest.format):
+            return False
+
+        try:
+            return os.path.getsize(file_path) == manifest.size
+        except OSError:
+            return False
 
     def is_cache_expired(self, file_path: str, max_days: int = 30) -> bool:
         """
@@ -59,3 +414,251 @@ class CacheService:
         expiration_time = datetime.now() - timedelta(days=settings.CACHE_MAX_DAYS)
         
         return file_mod_time < expiration_time
+
+    def get_cache_mtime(self, file_path: str) -> float:
+        """
+        Retorna a data de modificação do arquivo em cache, usada como versão do dataset.
+
+        :param file_path: Caminho do arquivo.
+        :return: Timestamp da última modificação do arquivo.
+        """
+        return os.path.getmtime(file_path)
+
+    def get_cache_lock(self, url: str) -> FileLock:
+        """
+        Retorna o lock de arquivo que coordena a atualização do cache da URL entre processos.
+
+        :param url: URL do CSV.
+        :return: Lock de arquivo ao lado do arquivo em cache.
+        """
+        file_hash = hashlib.md5(url.encode()).hexdigest()
+        return FileLock(os.path.join(settings.CACHE_FOLDER, f"{file_hash}.lock"))
+
+    def get_download_link(self, url: str) -> Optional[str]:
+        """
+        Retorna o link de download do CSV resolvido anteriormente para a página.
+
+        :param url: URL da página da Embrapa.
+        :return: URL do CSV ou None se ausente, ilegível ou mais antiga que `DOWNLOAD_LINK_TTL_SECONDS`.
+        """
+        try:
+            with open(self._get_download_link_file_path(url), "rb") as file:
+                link = DownloadLink.model_validate_json(file.read())
+        except (OSError, ValidationError):
+            return None
+
+        if link.url != url:
+            return None
+        if datetime.now(timezone.utc) - link.resolved_at > timedelta(seconds=settings.DOWNLOAD_LINK_TTL_SECONDS):
+            return None
+        return link.download_url
+
+    def save_download_link(self, url: str, download_url: str) -> None:
+        """
+        Persiste o link de download do CSV resolvido para a página.
+
+        :param url: URL da página da Embrapa.
+        :param download_url: URL do CSV encontrada na página.
+        """
+        os.makedirs(settings.CACHE_FOLDER, exist_ok=True)
+        link = DownloadLink(url=url, download_url=download_url, resolved_at=datetime.now(timezone.utc))
+        self._write_atomic(self._get_download_link_file_path(url), link.model_dump_json().encode("utf-8"))
+
+    def invalidate_download_link(self, url: str) -> None:
+        """
+        Descarta o link de download persistido para a página.
+
+        :param url: URL da página da Embrapa.
+        """
+        try:
+            os.remove(self._get_download_link_file_path(url))
+        except FileNotFoundError:
+            pass
+
+    def _get_download_link_file_path(self, url: str) -> str:
+        """
+        Retorna o caminho do arquivo com o link de download resolvido para a página.
+        """
+        file_hash = hashlib.md5(url.encode()).hexdigest()
+        return os.path.join(settings.CACHE_FOLDER, f"{file_hash}.link.json")
+
+    def _save_content(
+        self,
+        url: str,
+        df: pd.DataFrame,
+        content: bytes,
+        cache_format: str,
+        content_id: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source_checksum: Optional[str] = None,
+        source_changed_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Grava no cache o manifesto e, em seguida, o conteúdo serializado que ele descreve.
+        """
+        file_path = self.get_cache_file_path(url=url, cache_format=cache_format)
+        os.makedirs(settings.CACHE_FOLDER, exist_ok=True)
+
+        manifest = CacheManifest(
+            url=url,
+            format=cache_format,
+            schema_version=self.SCHEMA_VERSION,
+            row_count=len(df),
+            size=len(content),
+            checksum=hashlib.sha256(content).hexdigest(),
+            content_id=content_id,
+            fetched_at=datetime.now(timezone.utc),
+            etag=etag,
+            last_modified=last_modified,
+            source_checksum=source_checksum,
+            source_changed_at=source_changed_at
+        )
+
+        # O manifesto vem primeiro: até o arquivo ser trocado, o antigo não confere com ele
+        self._write_atomic(self.get_manifest_file_path(file_path), manifest.model_dump_json().encode("utf-8"))
+        self._write_atomic(file_path, content)
+        return file_path
+
+    def _write_chunks(self, file: BinaryIO, chunks: Iterable[pd.DataFrame], cache_format: str, sep: str, content_id: Optional[str] = None) -> int:
+        """
+        Grava as partes no arquivo aberto, no formato informado, e retorna o total de linhas.
+
+        No Feather, o `content_id` do manifesto vai nos metadados do esquema.
+        """
+        row_count = 0
+        if cache_format == "csv":
+            for chunk in chunks:
+                file.write(chunk.to_csv(index=False, header=row_count == 0, encoding="utf-8", sep=sep).encode("utf-8"))
+                row_count += len(chunk)
+            return row_count
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = None
+        writer = None
+        try:
+            for chunk in chunks:
+                if schema is None:
+                    schema = self._get_chunk_schema(chunk)
+                    if cache_format == "feather":
+                        # Sem compressão para que a leitura possa mapear o arquivo em memória
+                        schema = self._with_content_id(schema, content_id)
+                        writer = pa.ipc.new_file(file, schema)
+                    else:
+                        writer = pq.ParquetWriter(file, schema)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                row_count += len(chunk)
+
+            # Nenhuma parte: grava um arquivo vazio, mas válido
+            if writer is None:
+                empty = pa.Table.from_pandas(pd.DataFrame(), preserve_index=False)
+                if cache_format == "feather":
+                    writer = pa.ipc.new_file(file, self._with_content_id(empty.schema, content_id))
+                else:
+                    writer = pq.ParquetWriter(file, empty.schema)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return row_count
+
+    @staticmethod
+    def _get_chunk_schema(chunk: pd.DataFrame):
+        """
+        Deduz da primeira parte o esquema Arrow de todo o arquivo.
+
+        Colunas sem nenhum valor na primeira parte seriam deduzidas como nulas;
+        como só podem ser colunas de texto, passam a ser `string`.
+        """
+        import pyarrow as pa
+
+        schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+        for index, field in enumerate(schema):
+            if pa.types.is_null(field.type):
+                schema = schema.set(index, field.with_type(pa.string()))
+        return schema
+
+    @staticmethod
+    def _with_content_id(schema, content_id: Optional[str]):
+        """
+        Retorna o esquema Arrow com o `content_id` do manifesto nos metadados.
+        """
+        if content_id is None:
+            return schema
+        return schema.with_metadata({**(schema.metadata or {}), CONTENT_ID_METADATA_KEY: content_id.encode("utf-8")})
+
+    @staticmethod
+    def _hash_file(file_path: str) -> Tuple[int, str]:
+        """
+        Calcula o tamanho e o SHA-256 do arquivo, lendo-o em blocos.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+                size += len(block)
+        return size, digest.hexdigest()
+
+    def _read_verified_content(self, file_path: str, manifest: CacheManifest) -> bytes:
+        """
+        Lê o conteúdo do arquivo e confere tamanho e checksum com o manifesto.
+        """
+        try:
+            with open(file_path, "rb") as file:
+                content = file.read()
+        except OSError as e:
+            raise CorruptedCacheError(f"Falha ao ler '{file_path}'.") from e
+
+        if len(content) != manifest.size or hashlib.sha256(content).hexdigest() != manifest.checksum:
+            raise CorruptedCacheError(f"Checksum de '{file_path}' não confere com o manifesto.")
+        return content
+
+    def _write_atomic(self, file_path: str, content: bytes) -> None:
+        """
+        Grava o conteúdo em um arquivo temporário no mesmo diretório e o move para o destino.
+        """
+        directory = os.path.dirname(file_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            self._commit_file(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _commit_file(self, tmp_path: str, file_path: str) -> None:
+        """
+        Persiste o arquivo temporário (fsync) e o move para o destino no mesmo diretório.
+        """
+        fd = os.open(tmp_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, file_path)
+
+        # Garante que a troca de nomes também seja persistida
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(os.path.dirname(file_path) or ".", os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+@lru_cache(maxsize=None)
+def _pyarrow_available(cache_format: str) -> bool:
+    """
+    Verifica (uma única vez) se o `pyarrow` está instalado, avisando quando não estiver.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        logger.warning("pyarrow não está instalado; usando cache em CSV.", extra={"cache_format": cache_format})
+        return False
+    return True
@@ -1,39 +1,271 @@
-from typing import List, Type, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Type, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from enum import Enum
+from functools import lru_cache
+import logging
+import multiprocessing
+import threading
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from collections import defaultdict
+from app.domain.models.entities.dataprocessing.csv_validation_report import CSVValidationReport, RejectedRow
+from app.domain.models.entities.dataprocessing.csv_schema import CSVSchema
+from app.shared.config import settings
+
+logger = logging.getLogger(__name__)
 
 class CSVService:
     """
     Serviço para manipulação de dados de arquivos CSV.
     """
 
+    # Pool de processos compartilhado pelo processo, criado no primeiro uso
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _process_pool_lock = threading.Lock()
+
     def process_csv_data(
         self,
-        file_path: str,
+        file_path: Union[str, BinaryIO],
         model: Type[BaseModel],
         category_enum: Optional[Type[Enum]] = None,
         value_name_column: str = "production",
         delimiter: str = ";"
-    ) -> List[BaseModel]:
+    ) -> pd.DataFrame:
         """
-        Processa os dados de um arquivo CSV e retorna uma lista de instâncias do BaseModel.
+        Processa os dados de um arquivo CSV e retorna um DataFrame validado contra o BaseModel.
 
-        :param file_path: Caminho do arquivo CSV.
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
         :param model: O BaseModel para mapear os dados.
         :param category_enum: Enum opcional para filtrar categorias.
         :param value_name_column: Nome da coluna de valores (padrão: "production").
         :param delimiter: Delimitador do CSV (padrão: ";").
-        :return: Lista de instâncias do BaseModel.
+        :return: DataFrame com as colunas do BaseModel e apenas as linhas válidas.
         """
-        # Lê o arquivo CSV
-        df = pd.read_csv(filepath_or_buffer=file_path, delimiter=delimiter, encoding='utf-8')
+        # Lê o arquivo CSV já com os tipos definidos pelo esquema do modelo
+        df = self.read_csv(file_path=file_path, model=model, delimiter=delimiter)
         df = self.translate_column_names(df=df, model=model)
     
         df = self.preprocess_data(df, model, category_enum, value_name_column)
         return df
+
+    def iter_csv_data_chunks(
+        self,
+        file_path: Union[str, BinaryIO],
+        model: Type[BaseModel],
+        category_enum: Optional[Type[Enum]] = None,
+        value_name_column: str = "production",
+        delimiter: str = ";",
+        chunk_rows: int = 500
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Processa o CSV em partes, devolvendo cada parte já no formato longo e validada.
+
+        Todas as etapas do processamento atuam linha a linha do arquivo, então cada
+        parte é independente das demais e o pico de memória depende de `chunk_rows`,
+        não do tamanho do arquivo. As partes saem na ordem do arquivo (e, dentro de
+        cada parte, agrupadas por ano).
+
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
+        :param model: O BaseModel para mapear os dados.
+        :param category_enum: Enum opcional para filtrar categorias.
+        :param value_name_column: Nome da coluna de valores (padrão: "production").
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :param chunk_rows: Quantidade de linhas do arquivo lidas por parte.
+        :return: Iterador de DataFrames com as colunas do BaseModel e apenas as linhas válidas.
+        """
+        for df in self.read_csv_chunks(file_path=file_path, model=model, delimiter=delimiter, chunk_rows=chunk_rows):
+            df = self.translate_column_names(df=df, model=model)
+            yield self.preprocess_data(df, model, category_enum, value_name_column)
     
+    def process_csv_data_in_pool(
+        self,
+        file_path: Union[str, BinaryIO],
+        model: Type[BaseModel],
+        category_enum: Optional[Type[Enum]] = None,
+        value_name_column: str = "production",
+        delimiter: str = ";"
+    ) -> pd.DataFrame:
+        """
+        Processa os dados de um arquivo CSV em um processo do pool, liberando o GIL do processo atual.
+
+        O resultado volta do processo filho como um dicionário de arrays NumPy por
+        coluna, bem mais compacto de serializar do que uma lista de modelos. Se o
+        pool estiver desabilitado (`CSV_PROCESS_POOL_SIZE=0`), o processamento é
+        feito na própria thread.
+
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
+        :param model: O BaseModel para mapear os dados.
+        :param category_enum: Enum opcional para filtrar categorias.
+        :param value_name_column: Nome da coluna de valores (padrão: "production").
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :return: DataFrame com as colunas do BaseModel e apenas as linhas válidas.
+        """
+        process_pool = self._get_process_pool()
+        if process_pool is None:
+            return self.process_csv_data(
+                file_path=file_path,
+                model=model,
+                category_enum=category_enum,
+                value_name_column=value_name_column,
+                delimiter=delimiter
+            )
+
+        try:
+            columns = process_pool.submit(
+                _process_csv_to_columns,
+                file_path=file_path,
+                model=model,
+                category_enum=category_enum,
+                value_name_column=value_name_column,
+                delimiter=delimiter
+            ).result()
+        except BrokenProcessPool:
+            # Um processo filho morreu: descarta o pool (recriado na próxima chamada) e processa aqui
+            logger.exception("Pool de processos do CSV interrompido.", extra={"file_path": file_path})
+            self._discard_process_pool(process_pool)
+            return self.process_csv_data(
+                file_path=file_path,
+                model=model,
+                category_enum=category_enum,
+                value_name_column=value_name_column,
+                delimiter=delimiter
+            )
+
+        return pd.DataFrame(columns, copy=False)
+
+    @classmethod
+    def _get_process_pool(cls) -> Optional[ProcessPoolExecutor]:
+        """
+        Retorna o pool de processos, criando-o no primeiro uso.
+
+        Os processos são iniciados com `spawn`, pois o processo atual tem
+        threads (servidor, pools) que não sobreviveriam a um `fork`.
+        """
+        if settings.CSV_PROCESS_POOL_SIZE <= 0:
+            return None
+
+        with cls._process_pool_lock:
+            if cls._process_pool is None:
+                cls._process_pool = ProcessPoolExecutor(
+                    max_workers=settings.CSV_PROCESS_POOL_SIZE,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return cls._process_pool
+
+    @classmethod
+    def shutdown_process_pool(cls) -> None:
+        """
+        Encerra o pool de processos, se existir (um novo é criado no próximo uso).
+        """
+        with cls._process_pool_lock:
+            process_pool, cls._process_pool = cls._process_pool, None
+        if process_pool is not None:
+            process_pool.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    def _discard_process_pool(cls, process_pool: ProcessPoolExecutor) -> None:
+        """
+        Descarta o pool de processos informado, se ele ainda for o pool atual.
+        """
+        with cls._process_pool_lock:
+            if cls._process_pool is process_pool:
+                cls._process_pool = None
+        process_pool.shutdown(wait=False, cancel_futures=True)
+
+    def read_csv(self, file_path: Union[str, BinaryIO], model: Type[BaseModel], delimiter: str = ";") -> pd.DataFrame:
+        """
+        Lê o CSV em uma única passada tipada, guiada pelo esquema declarado no modelo.
+
+        Os marcadores de nulo, a vírgula decimal e a limpeza das colunas de texto
+        são tratados pelo próprio parser, evitando cópias do DataFrame após a leitura.
+
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
+        :param model: O BaseModel cujo `csv_schema` descreve as colunas.
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :return: DataFrame com as colunas de ano já numéricas.
+        """
+        schema: CSVSchema = getattr(model, "csv_schema", CSVSchema())
+
+        df = pd.read_csv(filepath_or_buffer=file_path, **self._read_csv_options(schema=schema, delimiter=delimiter))
+        return self._normalize_columns(df=df, schema=schema)
+
+    def read_csv_chunks(
+        self,
+        file_path: Union[str, BinaryIO],
+        model: Type[BaseModel],
+        delimiter: str = ";",
+        chunk_rows: int = 500
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lê o CSV em partes de `chunk_rows` linhas, com a mesma leitura tipada de `read_csv`.
+
+        :param file_path: Caminho, URL ou buffer do arquivo CSV.
+        :param model: O BaseModel cujo `csv_schema` descreve as colunas.
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :param chunk_rows: Quantidade de linhas lidas por parte.
+        :return: Iterador de DataFrames com as colunas de ano já numéricas.
+        """
+        schema: CSVSchema = getattr(model, "csv_schema", CSVSchema())
+
+        with pd.read_csv(
+            filepath_or_buffer=file_path,
+            chunksize=chunk_rows,
+            **self._read_csv_options(schema=schema, delimiter=delimiter)
+        ) as reader:
+            for df in reader:
+                yield self._normalize_columns(df=df, schema=schema)
+
+    def _read_csv_options(self, schema: CSVSchema, delimiter: str) -> Dict[str, Any]:
+        """
+        Monta os parâmetros do `pd.read_csv` a partir do esquema do modelo.
+        """
+        return {
+            "delimiter": delimiter,
+            "encoding": 'utf-8',
+            "dtype": {position: "Int64" for position in schema.id_columns},
+            "converters": {position: self._clean_text for position in schema.text_columns},
+            # Só os marcadores do esquema são nulos: células vazias valem 0 (ver `_normalize_columns`)
+            "na_values": schema.null_markers,
+            "keep_default_na": False,
+            "decimal": schema.decimal,
+            "skipinitialspace": True,
+        }
+
+    @staticmethod
+    def _normalize_columns(df: pd.DataFrame, schema: CSVSchema) -> pd.DataFrame:
+        """
+        Ajusta os nomes das colunas e converte para número as colunas de ano lidas como texto.
+
+        Células vazias valem 0, como no preenchimento original (`fillna(0)`);
+        apenas os marcadores de nulo do esquema (ex.: 'nd') ficam nulos.
+        """
+        # Remove espaços extras dos nomes das colunas
+        df.columns = df.columns.str.strip()
+
+        for position in schema.id_columns:
+            col = df.columns[position]
+            df[col] = df[col].fillna(0)
+
+        # Colunas de ano com células vazias ou valores fora do esperado chegam como texto
+        info_positions = set(schema.id_columns) | set(schema.text_columns)
+        for position, col in enumerate(df.columns):
+            if position not in info_positions and df[col].dtype == object:
+                values = df[col].str.replace(',', '.', regex=False).replace('', '0')
+                df[col] = pd.to_numeric(values, errors='coerce')
+
+        return df
+
+    @staticmethod
+    def _clean_text(value: str) -> str:
+        """
+        Remove espaços extras e parênteses de uma célula de texto (vazia, vale "0").
+        """
+        if not value:
+            return "0"
+        return value.strip().replace('(', '').replace(')', '')
+
     def translate_column_names(self, df: pd.DataFrame, model: Type[BaseModel]) -> pd.DataFrame:
         """
         Traduz os nomes das colunas do DataFrame para o schema do BaseModel.
@@ -52,19 +284,10 @@ class CSVService:
         model: Type[BaseModel],
         category_enum: Optional[Enum] = None,
         value_name_column: str = "production"
-    ) -> List[BaseModel]:
+    ) -> pd.DataFrame:
         """
-        Realiza o tratamento inicial dos dados do DataFrame e retorna uma lista de instâncias do BaseModel.
+        Realiza o tratamento inicial dos dados do DataFrame e retorna as linhas válidas para o BaseModel.
         """
-        # Remove espaços extras dos nomes das colunas
-        df.columns = df.columns.str.strip()
-
-        # Remove espaços extras de todas as células
-        df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-
-        # Substitui valores nulos por 0 inicialmente
-        df.fillna(0, inplace=True)
-
         # Conta quantas colunas compartilham o mesmo prefixo antes do `.`
         column_groups = defaultdict(list)
 
@@ -72,72 +295,140 @@ class CSVService:
             base_name = col.split('.')[0]  # Pega o nome base da coluna
             column_groups[base_name].append(col)
 
-        # Agora agrupe e some os grupos com mais de uma coluna
-        for base_name, cols in column_groups.items():
-            if len(cols) > 1:
-                df[base_name] = df[cols].sum(axis=1)
-                df.drop(columns=[col for col in cols if col != base_name], inplace=True)
+        # Agora agrupe e some os grupos com mais de uma coluna, montando o DataFrame uma única vez
+        if any(len(cols) > 1 for cols in column_groups.values()):
+            df = pd.DataFrame(
+                {
+                    base_name: df[cols].sum(axis=1, min_count=1) if len(cols) > 1 else df[cols[0]]
+                    for base_name, cols in column_groups.items()
+                },
+                index=df.index
+            )
 
         # Remove linhas onde todas as colunas numéricas (anos) estão vazias ou zero
         numeric_columns = df.select_dtypes(include=["number"]).columns
         if not numeric_columns.empty:
             df = df[df[numeric_columns].sum(axis=1) > 0]
 
-        # Remove linhas onde qualquer célula contém um valor igual a algum valor da Enum
-        '''if category_enum:
-            enum_values = set(item.value.upper() for item in category_enum)
-            rows_to_remove = df.apply(lambda row: any(str(cell).upper() in enum_values for cell in row), axis=1)
-            df = df[~rows_to_remove]
-        '''
         if 'control' in df.columns:
-            df = df[df['control'].astype(str).str.contains('_')]
-
-        # Trata colunas de ano
-        colunas_years = [col for col in df.columns if str(col).isdigit()]
-        for col in colunas_years:
-            df[col] = df[col].replace({'nd': None, '*': None}) 
-            df[col] = df[col].astype(str).str.replace(',', '.', regex=False)
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-
-        for col in df.columns:
-            if col not in colunas_years:
-                df[col] = df[col].astype(str).str.replace('(', '', regex=False)
-                df[col] = df[col].astype(str).str.replace(')', '', regex=False)
+            df = df[df['control'].astype(str).str.contains('_', regex=False)]
 
         # Aplica transformação melt
+        colunas_years = [col for col in df.columns if str(col).isdigit()]
         colunas_info = [col for col in df.columns if col not in colunas_years]
         df = df.melt(id_vars=colunas_info, value_vars=colunas_years, var_name='year', value_name=value_name_column)
 
         # Remove linhas com NaN na coluna que vai pro campo numérico no Pydantic
         df = df[df[value_name_column].notna()]
-        df = df[df['year'].notna()]
-        # Alternativamente, para definir como 0.0 (cuidado: só se fizer sentido!)
-        df = df[:].replace({'(':'', ')': ''})
 
-        # Gera o field_map automaticamente
-        model_fields = model.model_fields.keys()
         df.columns = df.columns.str.lower()  # se quiser padronizar
-        field_map = {field: field for field in model_fields if field in df.columns}
 
+        # Converte as colunas para os tipos do modelo e deriva a categoria em lote
+        df = self.coerce_columns(df=df, model=model, category_enum=category_enum)
+
+        valid_df, report = self.validate_dataframe(df=df, model=model)
+        if report.rejected_rows:
+            logger.warning(
+                "Linhas rejeitadas na validação do CSV.",
+                extra={"validation_report": report.model_dump()}
+            )
+
+        return valid_df
+
+    def coerce_columns(
+        self,
+        df: pd.DataFrame,
+        model: Type[BaseModel],
+        category_enum: Optional[Type[Enum]] = None
+    ) -> pd.DataFrame:
+        """
+        Converte coluna a coluna os dados para os tipos declarados no modelo.
+
+        A coluna 'category' é derivada em lote a partir do prefixo de 'control',
+        com a mesma regra de `Util.extract_prefix`. Prefixos fora da Enum ficam
+        nulos e são tratados pelo validador do modelo.
 
-        # Converte o DataFrame em uma lista de BaseModel
-        base_model_list = []
-        for _, row in df.iterrows():
-            data = {}
-            for model_field, df_field in field_map.items():
-                value = row.get(df_field)
+        :param df: DataFrame já no formato longo (após o melt).
+        :param model: O BaseModel cujos campos definem as colunas e os tipos.
+        :param category_enum: Enum opcional usado para derivar a categoria.
+        :return: DataFrame apenas com as colunas do modelo, na ordem dos campos.
+        """
+        data = {}
+        for field_name, field_info in model.model_fields.items():
+            if field_name == "category" and category_enum is not None and "control" in df.columns:
+                # Calcula a categoria apenas uma vez por valor distinto de 'control'
+                codes, controls = pd.factorize(df["control"].astype(str))
+                prefixes = controls.str.split("_", n=1).str[0].where(controls.str.contains("_", regex=False), controls.str[:1])
+                categories = {item.name: item.value for item in category_enum}
+                category_values = np.array([categories.get(prefix) for prefix in prefixes.str.upper()], dtype=object)
+                data[field_name] = np.where(codes >= 0, category_values[codes], None)
+                continue
+
+            if field_name not in df.columns:
+                continue
+
+            column = df[field_name]
+            if field_info.annotation in (int, float):
+                data[field_name] = pd.to_numeric(column, errors="coerce")
+            else:
+                data[field_name] = column.astype(str).where(column.notna())
+
+        return pd.DataFrame(data, index=df.index)
 
-                # Tratamento de NaN para campos numéricos
-                if pd.isna(value):
-                    value = None
+    def validate_dataframe(self, df: pd.DataFrame, model: Type[BaseModel]) -> Tuple[pd.DataFrame, CSVValidationReport]:
+        """
+        Valida todas as linhas do DataFrame em lote contra o modelo.
+
+        :param df: DataFrame com as colunas do modelo.
+        :param model: O BaseModel usado na validação.
+        :return: Tupla com o DataFrame das linhas válidas e o relatório de validação.
+        """
+        columns = list(df.columns)
+        records = [dict(zip(columns, values)) for values in zip(*(df[column].tolist() for column in columns))]
+        rejected = defaultdict(list)
 
-                data[model_field] = value
+        try:
+            _list_adapter(model).validate_python(records)
+        except ValidationError as e:
+            for error in e.errors():
+                position = error["loc"][0]
+                field = ".".join(str(loc) for loc in error["loc"][1:])
+                rejected[position].append(f"{field}: {error['msg']}" if field else error["msg"])
 
-            try:
-                base_model_list.append(model(**data))
-            except Exception as e:
-                # Log opcional, você pode remover ou levantar uma exceção personalizada se preferir
-                print(f"Erro ao criar instância do modelo: {e}\nDados: {data}")
+        report = CSVValidationReport(
+            model=model.__name__,
+            total_rows=len(records),
+            accepted_rows=len(records) - len(rejected),
+            rejected_rows=[
+                RejectedRow(row=position, data=records[position], errors=errors)
+                for position, errors in sorted(rejected.items())
+            ]
+        )
 
+        if rejected:
+            mask = np.ones(len(df), dtype=bool)
+            mask[list(rejected)] = False
+            df = df[mask]
 
-        return base_model_list
+        # Com as linhas inválidas removidas, os números ficam com o tipo declarado no modelo
+        # (o mesmo em qualquer parte do arquivo, quando o CSV é processado em partes)
+        numeric_columns = {
+            field_name: "int64" if field_info.annotation is int else "float64"
+            for field_name, field_info in model.model_fields.items()
+            if field_info.annotation in (int, float) and field_name in df.columns
+        }
+        return df.astype(numeric_columns).reset_index(drop=True), report
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Retorna (e memoriza) o TypeAdapter de lista para o modelo.
+    """
+    return TypeAdapter(List[model])
+
+def _process_csv_to_columns(**kwargs) -> Dict[str, np.ndarray]:
+    """
+    Processa o CSV dentro de um processo do pool e devolve as colunas como arrays NumPy.
+    """
+    df = CSVService().process_csv_data(**kwargs)
+    return {column: df[column].to_numpy() for column in df.columns}
@@ -0,0 +1,121 @@
+from typing import Optional, Type, Tuple
+from collections import OrderedDict
+import threading
+import pandas as pd
+from pydantic import BaseModel
+from app.shared.config import settings
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
+
+class DatasetCacheService:
+    """
+    Cache em memória (por processo) dos datasets já processados e validados.
+
+    As entradas são indexadas por URL e modelo, invalidadas quando a data de
+    modificação do arquivo em cache muda e removidas pela política LRU quando
+    o limite de entradas ou de bytes é excedido. Junto de cada dataset fica o
+    seu `DatasetIndex`, construído uma única vez no carregamento.
+    """
+
+    # Estado compartilhado por todas as instâncias do processo
+    _entries: "OrderedDict[Tuple[str, Type[BaseModel]], Tuple[float, pd.DataFrame, int, DatasetIndex]]" = OrderedDict()
+    _total_bytes: int = 0
+    _lock = threading.Lock()
+
+    def get_dataset(self, url: str, model: Type[BaseModel], mtime: float) -> Optional[pd.DataFrame]:
+        """
+        Retorna o dataset em memória, se existir e corresponder à versão do arquivo em cache.
+
+        O DataFrame retornado é compartilhado entre requisições e não deve ser alterado.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param mtime: Data de modificação do arquivo em cache.
+        :return: DataFrame em memória ou None se não houver entrada válida.
+        """
+        key = (url, model)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            entry_mtime, df, _, _ = entry
+            if entry_mtime != mtime:
+                # Arquivo em disco foi atualizado: a entrada em memória é obsoleta
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return df
+
+    def put_dataset(self, url: str, model: Type[BaseModel], mtime: float, df: pd.DataFrame) -> None:
+        """
+        Armazena um dataset processado em memória, aplicando a política de remoção LRU.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param mtime: Data de modificação do arquivo em cache que originou o dataset.
+        :param df: DataFrame a ser armazenado.
+        """
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > settings.DATASET_CACHE_MAX_BYTES:
+            # Dataset maior que o orçamento total: não vale a pena mantê-lo em memória
+            return
+
+        # Índices construídos fora do lock; contam no orçamento de memória
+        index = DatasetIndex(df)
+        size += index.nbytes
+
+        key = (url, model)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (mtime, df, size, index)
+            DatasetCacheService._total_bytes += size
+
+            while (
+                len(self._entries) > settings.DATASET_CACHE_MAX_ENTRIES
+                or self._total_bytes > settings.DATASET_CACHE_MAX_BYTES
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def get_dataset_version(self, url: str, model: Type[BaseModel], mtime: float) -> Optional[str]:
+        """
+        Retorna a versão (hash do conteúdo) do dataset em memória, sem carregá-lo.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param mtime: Data de modificação do arquivo em cache.
+        :return: Versão do dataset ou None se não houver entrada válida em memória.
+        """
+        with self._lock:
+            entry = self._entries.get((url, model))
+        if entry is None or entry[0] != mtime:
+            return None
+        return entry[3].version
+
+    def get_dataset_index(self, url: str, model: Type[BaseModel], df: pd.DataFrame) -> DatasetIndex:
+        """
+        Retorna os índices do dataset, reaproveitando os construídos no carregamento.
+
+        Se o DataFrame não for o que está em memória (por exemplo, um dataset maior
+        que o orçamento do cache), os índices são construídos na hora.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param df: DataFrame retornado para a consulta.
+        :return: Índices do DataFrame.
+        """
+        with self._lock:
+            entry = self._entries.get((url, model))
+        if entry is not None and entry[1] is df:
+            return entry[3]
+        return DatasetIndex(df)
+
+    def _remove(self, key: Tuple[str, Type[BaseModel]]) -> None:
+        """
+        Remove uma entrada e atualiza o total de bytes. Deve ser chamado com o lock adquirido.
+        """
+        _, _, size, _ = self._entries.pop(key)
+        DatasetCacheService._total_bytes -= size
@@ -0,0 +1,232 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from app.shared.config import settings
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+class DatasetIndex:
+    """
+    Índices de um dataset já processado, construídos uma única vez quando ele é carregado.
+
+    - `year`: posições ordenadas por ano, para buscas por intervalo com `searchsorted`;
+    - `country`, `product`, `cultivate` e `category`: mapa valor -> posições (sem
+      diferenciar maiúsculas de minúsculas);
+    - `control`: valores ordenados, para buscas por prefixo com `searchsorted`;
+    - `(year, id)`: ordem estável de paginação, com as chaves ordenadas para
+      retomar a leitura a partir de uma chave (paginação por cursor).
+
+    Uma consulta parte do filtro mais seletivo e confere os demais apenas nas
+    posições candidatas, de modo que o custo acompanha o tamanho do resultado e
+    não o do dataset. As posições retornadas seguem a ordem original do DataFrame.
+
+    O índice também guarda resultados derivados desta versão do dataset (como
+    agregações), descartados junto com ele quando o dataset é atualizado, e a
+    própria versão (`version`), um hash do conteúdo.
+    """
+
+    HASH_COLUMNS = ("country", "product", "cultivate", "category")
+    PREFIX_COLUMN = "control"
+    SORT_COLUMNS = ("year", "id")
+
+    def __init__(self, df: pd.DataFrame):
+        self.row_count = len(df)
+
+        # Anos: ordem estável para manter a ordem original entre anos iguais
+        self._sorted_years = None
+        if "year" in df.columns:
+            years = df["year"].to_numpy()
+            self._year_order = np.argsort(years, kind="stable")
+            self._sorted_years = years[self._year_order]
+            self._year_rank = self._rank(self._year_order)
+
+        # Colunas de texto: código de cada linha e posições de cada código
+        self._codes: Dict[str, np.ndarray] = {}
+        self._code_of: Dict[str, Dict[str, int]] = {}
+        self._positions: Dict[str, Dict[int, np.ndarray]] = {}
+        for column in self.HASH_COLUMNS:
+            if column not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[column].str.strip().str.casefold())
+            self._codes[column] = codes
+            self._code_of[column] = {key: code for code, key in enumerate(uniques)}
+            self._positions[column] = pd.Series(np.arange(self.row_count)).groupby(codes).indices
+
+        # Prefixo do controle: valores ordenados e a posição de cada linha nessa ordem
+        self._control_keys = None
+        if self.PREFIX_COLUMN in df.columns:
+            keys = df[self.PREFIX_COLUMN].fillna("").str.casefold().to_numpy(dtype=object)
+            self._control_order = np.argsort(keys, kind="stable")
+            self._control_keys = keys[self._control_order]
+            self._control_rank = self._rank(self._control_order)
+
+        # Ordem de paginação: posições nessa ordem, chaves ordenadas e a posição de cada linha
+        sort_values = [df[column].to_numpy() for column in self.SORT_COLUMNS if column in df.columns]
+        self._key_order = np.lexsort(sort_values[::-1]) if sort_values else np.arange(self.row_count)
+        self._sorted_keys = [values[self._key_order] for values in sort_values]
+        self._key_rank = self._rank(self._key_order)
+
+        self.version = hashlib.blake2b(
+            pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes(),
+            digest_size=8
+        ).hexdigest()
+
+        self._memo: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memória aproximada ocupada pelos índices, em bytes.
+        """
+        arrays = [getattr(self, name, None) for name in ("_year_order", "_sorted_years", "_year_rank", "_control_order", "_control_keys", "_control_rank", "_key_order", "_key_rank")]
+        arrays += self._sorted_keys
+        arrays += list(self._codes.values())
+        arrays += [positions for groups in self._positions.values() for positions in groups.values()]
+        return sum(array.nbytes for array in arrays if array is not None)
+
+    def lookup(self, filters: FilterDTO) -> Optional[np.ndarray]:
+        """
+        Retorna as posições das linhas que atendem a todos os filtros.
+
+        Filtros sobre colunas que o dataset não possui são ignorados.
+
+        :param filters: Filtros da consulta.
+        :return: Posições em ordem crescente ou None se nenhum filtro se aplicar.
+        """
+        # Cada filtro: (quantidade de candidatos, candidatos, conferência de outras posições)
+        predicates: List[Tuple[int, Callable[[], np.ndarray], Callable[[np.ndarray], np.ndarray]]] = []
+
+        if self._sorted_years is not None and (filters.year_from is not None or filters.year_to is not None):
+            low = 0 if filters.year_from is None else int(np.searchsorted(self._sorted_years, filters.year_from, side="left"))
+            high = self.row_count if filters.year_to is None else int(np.searchsorted(self._sorted_years, filters.year_to, side="right"))
+            predicates.append(self._range_predicate(self._year_order, self._year_rank, low, high))
+
+        for column in self.HASH_COLUMNS:
+            value = getattr(filters, column)
+            if value is None or column not in self._codes:
+                continue
+            code = self._code_of[column].get(value.strip().casefold())
+            if code is None:
+                return _EMPTY
+            predicates.append(self._code_predicate(self._codes[column], self._positions[column][code], code))
+
+        if filters.control is not None and self._control_keys is not None:
+            prefix = filters.control.strip().casefold()
+            low = int(np.searchsorted(self._control_keys, prefix, side="left"))
+            high = int(np.searchsorted(self._control_keys, prefix + "\U0010ffff", side="left"))
+            predicates.append(self._range_predicate(self._control_order, self._control_rank, low, high))
+
+        if not predicates:
+            return None
+
+        # Parte do filtro mais seletivo e confere os demais apenas nos candidatos
+        predicates.sort(key=lambda predicate: predicate[0])
+        rows = predicates[0][1]()
+        for _, _, check in predicates[1:]:
+            if not len(rows):
+                break
+            rows = rows[check(rows)]
+        return rows
+
+    def sort_ranks(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Converte posições do DataFrame em posições na ordem de paginação `(year, id)`.
+
+        :param positions: Posições das linhas (por exemplo, o resultado de `lookup`).
+        :return: Posições na ordem de paginação, em ordem crescente.
+        """
+        return np.sort(self._key_rank[positions])
+
+    def rows(self, ranks: np.ndarray) -> np.ndarray:
+        """
+        Converte posições na ordem de paginação em posições do DataFrame.
+
+        :param ranks: Posições na ordem de paginação.
+        :return: Posições das linhas no DataFrame.
+        """
+        return self._key_order[ranks]
+
+    def sort_key(self, rank: int) -> List[int]:
+        """
+        Retorna a chave `(year, id)` da linha na posição informada da ordem de paginação.
+
+        :param rank: Posição na ordem de paginação.
+        :return: Valores das colunas de ordenação.
+        """
+        return [int(keys[rank]) for keys in self._sorted_keys]
+
+    def seek(self, key: Sequence[int]) -> int:
+        """
+        Retorna quantas linhas têm chave de ordenação menor ou igual a `key`, em O(log n).
+
+        A chave não precisa existir no dataset: a leitura continua na primeira
+        chave maior, o que mantém a paginação consistente após atualizações.
+
+        :param key: Valores das colunas de ordenação (ex.: `[2020, 15]`).
+        :return: Posição, na ordem de paginação, da primeira linha após a chave.
+        """
+        low, high = 0, self.row_count
+        for keys, value in zip(self._sorted_keys, key):
+            segment = keys[low:high]
+            low, high = low + int(np.searchsorted(segment, value, side="left")), low + int(np.searchsorted(segment, value, side="right"))
+            if low == high:
+                break
+        return high
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Retorna o resultado memorizado para a chave, calculando-o na primeira vez.
+
+        O cálculo roda fora do lock; em caso de corrida, o primeiro resultado gravado prevalece.
+        Apenas os `AGGREGATION_MEMO_MAX_ENTRIES` resultados mais recentes são mantidos.
+
+        :param key: Chave do resultado (por exemplo, os parâmetros da agregação).
+        :param compute: Função que calcula o resultado.
+        :return: Resultado memorizado, que não deve ser alterado.
+        """
+        with self._memo_lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+        value = compute()
+
+        with self._memo_lock:
+            value = self._memo.setdefault(key, value)
+            self._memo.move_to_end(key)
+            while len(self._memo) > settings.AGGREGATION_MEMO_MAX_ENTRIES:
+                self._memo.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _range_predicate(order: np.ndarray, rank: np.ndarray, low: int, high: int):
+        """
+        Filtro de uma faixa `[low, high)` de um índice ordenado, cuja posição de cada linha está em `rank`.
+        """
+        high = max(high, low)
+        return (
+            high - low,
+            lambda: np.sort(order[low:high]),
+            lambda rows: (rank[rows] >= low) & (rank[rows] < high)
+        )
+
+    @staticmethod
+    def _code_predicate(codes: np.ndarray, positions: np.ndarray, code: int):
+        """
+        Filtro de igualdade sobre uma coluna codificada.
+        """
+        return len(positions), lambda: positions, lambda rows: codes[rows] == code
+
+    @staticmethod
+    def _rank(order: np.ndarray) -> np.ndarray:
+        """
+        Inverte uma ordenação: retorna a posição de cada linha dentro de `order`.
+        """
+        rank = np.empty(len(order), dtype=np.intp)
+        rank[order] = np.arange(len(order))
+        return rank
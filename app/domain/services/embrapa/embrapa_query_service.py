@@ -0,0 +1,347 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+from datetime import datetime
+import io
+import math
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException
+from app.application.ports.output.embrapa.embrapa_port_out import EmbrapaPortOut
+from app.domain.models.entities.embrapa.embrapa_dataset import EmbrapaDataset
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
+from app.shared.util.page_cursor import PageCursor
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
+from app.shared.config import settings
+
+class EmbrapaQueryService:
+    """
+    Serviço base para consultas paginadas sobre os datasets da Embrapa.
+    """
+
+    def __init__(self, embrapa_port: EmbrapaPortOut):
+        self.embrapa_port = embrapa_port
+
+    def get_version(self, url: str, dataset: EmbrapaDataset) -> Optional[str]:
+        """
+        Retorna a versão do dataset em memória, sem carregá-lo.
+
+        :param url: URL da página da Embrapa.
+        :param dataset: Descrição do dataset da Embrapa.
+        :return: Versão do dataset ou None se ele não estiver em memória.
+        """
+        return self.embrapa_port.get_dataset_version(url=url, model=dataset.model)
+
+    def get_page(self, url: str, dataset: EmbrapaDataset, page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
+        """
+        Obtém uma página do dataset, instanciando o modelo apenas para as linhas retornadas.
+
+        As linhas seguem a ordem estável `(year, id)`. Os filtros são resolvidos
+        pelos índices construídos no carregamento do dataset, sem percorrer todas
+        as linhas. Com `cursor`, a página começa logo após a última chave entregue
+        (em O(page_size), mesmo em páginas profundas) e não se desloca se o
+        dataset for atualizado no meio da leitura; nesse caso a página vem com
+        `dataset_changed`, pois as linhas novas anteriores à chave não são entregues.
+
+        :param url: URL da página da Embrapa.
+        :param dataset: Descrição do dataset da Embrapa.
+        :param page: Número da página (ignorado quando há `cursor`).
+        :param page_size: Tamanho da página.
+        :param filters: Filtros opcionais (ano, país, produto, cultivar, categoria e prefixo do controle).
+        :param cursor: Cursor `next_cursor` de uma página anterior.
+        :return: Página com os itens e os metadados de paginação.
+        :raises HTTPException: Se o cursor for inválido.
+        """
+        csv_data = self.embrapa_port.get_csv_data(
+            url=url,
+            model=dataset.model,
+            category_enum=dataset.category_enum,
+            value_name_column=dataset.value_name_column,
+            delimiter=dataset.delimiter
+        )
+        index = self.embrapa_port.get_dataset_index(url=url, model=dataset.model, df=csv_data)
+
+        # Linhas que atendem aos filtros, na ordem de paginação (None para todas)
+        ranks = None
+        if filters is not None and filters.model_dump(exclude_none=True):
+            filters_key = filters.model_dump_json(exclude_none=True)
+            ranks = index.memoize(("filter", filters_key), lambda: self._get_filter_ranks(index=index, filters=filters))
+        total = index.row_count if ranks is None else len(ranks)
+
+        dataset_changed = False
+        if cursor is not None:
+            try:
+                page_cursor = PageCursor.decode(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail="Cursor inválido.") from e
+            # A chave, e não a posição, define o início: se o dataset mudou desde
+            # o cursor (outra versão), a leitura continua na próxima chave existente
+            start = index.seek(page_cursor.key)
+            dataset_changed = page_cursor.version != index.version
+            if ranks is not None:
+                start = int(np.searchsorted(ranks, start, side="left"))
+        else:
+            start = (page - 1) * page_size
+
+        end = min(start + page_size, total)
+        page_ranks = np.arange(start, end) if ranks is None else ranks[start:end]
+
+        next_cursor = None
+        if end < total and len(page_ranks):
+            next_cursor = PageCursor(version=index.version, key=index.sort_key(page_ranks[-1])).encode()
+
+        return self.paginate(
+            df=csv_data,
+            model=dataset.model,
+            positions=index.rows(page_ranks),
+            total=total,
+            page=start // page_size + 1,
+            page_size=page_size,
+            last_changed_upstream=self.embrapa_port.get_last_changed_upstream(url=url),
+            next_cursor=next_cursor,
+            dataset_changed=dataset_changed
+        )
+
+    @staticmethod
+    def _get_filter_ranks(index: DatasetIndex, filters: FilterDTO) -> Optional[np.ndarray]:
+        """
+        Resolve os filtros no índice e devolve as linhas na ordem de paginação.
+        """
+        positions = index.lookup(filters)
+        return None if positions is None else index.sort_ranks(positions)
+
+    def export(self, url: str, dataset: EmbrapaDataset, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Exporta o dataset completo (ou filtrado), na ordem `(year, id)`, em partes.
+
+        O dataset é carregado antes do retorno; a serialização acontece à medida
+        que o iterador é consumido, `EXPORT_CHUNK_ROWS` linhas por vez, de modo
+        que a memória usada não cresce com o tamanho da exportação.
+
+        :param url: URL da página da Embrapa.
+        :param dataset: Descrição do dataset da Embrapa.
+        :param export_format: 'ndjson', 'csv' ou 'parquet'.
+        :param filters: Filtros opcionais aplicados antes da exportação.
+        :return: Iterador com os bytes do arquivo exportado.
+        """
+        csv_data = self.embrapa_port.get_csv_data(
+            url=url,
+            model=dataset.model,
+            category_enum=dataset.category_enum,
+            value_name_column=dataset.value_name_column,
+            delimiter=dataset.delimiter
+        )
+        index = self.embrapa_port.get_dataset_index(url=url, model=dataset.model, df=csv_data)
+
+        ranks = None
+        if filters is not None and filters.model_dump(exclude_none=True):
+            filters_key = filters.model_dump_json(exclude_none=True)
+            ranks = index.memoize(("filter", filters_key), lambda: self._get_filter_ranks(index=index, filters=filters))
+        if ranks is None:
+            ranks = np.arange(index.row_count)
+
+        chunks = (
+            csv_data.iloc[index.rows(ranks[start:start + settings.EXPORT_CHUNK_ROWS])]
+            for start in range(0, len(ranks), settings.EXPORT_CHUNK_ROWS)
+        )
+        if export_format == "csv":
+            return self._iter_csv(chunks)
+        if export_format == "parquet":
+            return self._iter_parquet(chunks, df=csv_data)
+        return self._iter_ndjson(chunks)
+
+    @staticmethod
+    def _iter_ndjson(chunks: Iterator[pd.DataFrame]) -> Iterator[bytes]:
+        """
+        Serializa as partes como JSON, um objeto por linha.
+        """
+        for chunk in chunks:
+            yield chunk.to_json(orient="records", lines=True, force_ascii=False).rstrip("\n").encode("utf-8") + b"\n"
+
+    @staticmethod
+    def _iter_csv(chunks: Iterator[pd.DataFrame]) -> Iterator[bytes]:
+        """
+        Serializa as partes como CSV, com o cabeçalho apenas na primeira.
+        """
+        header = True
+        for chunk in chunks:
+            yield chunk.to_csv(index=False, header=header).encode("utf-8")
+            header = False
+
+    @staticmethod
+    def _iter_parquet(chunks: Iterator[pd.DataFrame], df: pd.DataFrame) -> Iterator[bytes]:
+        """
+        Serializa as partes como um único arquivo Parquet, um row group por parte.
+
+        O esquema é deduzido do dataset completo (sem copiar os dados) e os bytes
+        de cada row group são entregues assim que ele é gravado.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        sink = _DrainableSink()
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        with pq.ParquetWriter(sink, schema) as writer:
+            for chunk in chunks:
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                yield sink.drain()
+        yield sink.drain()
+
+    def get_aggregation(self, url: str, dataset: EmbrapaDataset, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
+        """
+        Agrega a coluna de valores do dataset pelas dimensões pedidas.
+
+        O resultado é memorizado nos índices da versão atual do dataset: consultas
+        repetidas não recalculam o agrupamento até que o dataset seja atualizado.
+
+        :param url: URL da página da Embrapa.
+        :param dataset: Descrição do dataset da Embrapa.
+        :param query: Dimensões, função de agregação, top-N e variação anual.
+        :param filters: Filtros opcionais aplicados antes da agregação.
+        :return: Grupos com o valor agregado e os metadados da agregação.
+        :raises HTTPException: Se as dimensões pedidas não existirem no dataset.
+        """
+        csv_data = self.embrapa_port.get_csv_data(
+            url=url,
+            model=dataset.model,
+            category_enum=dataset.category_enum,
+            value_name_column=dataset.value_name_column,
+            delimiter=dataset.delimiter
+        )
+
+        group_by = list(dict.fromkeys(query.group_by))
+        dimensions = [column for column in csv_data.columns if column not in ("id", dataset.value_name_column)]
+        invalid = [column for column in group_by if column not in dimensions]
+        if not group_by or invalid:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Dimensões inválidas para agrupamento: {invalid}. Use: {dimensions}."
+            )
+        if query.yoy and "year" not in group_by:
+            raise HTTPException(
+                status_code=400,
+                detail="A variação anual (yoy) exige o agrupamento por 'year'."
+            )
+
+        index = self.embrapa_port.get_dataset_index(url=url, model=dataset.model, df=csv_data)
+        filters_key = filters.model_dump_json(exclude_none=True) if filters is not None else "{}"
+        key = ("aggregation", tuple(group_by), query.agg, query.top, query.yoy, filters_key)
+
+        def compute() -> Tuple[List[Dict[str, Any]], int]:
+            positions = index.lookup(filters) if filters is not None else None
+            df = csv_data if positions is None else csv_data.iloc[positions]
+            return self.aggregate(
+                df=df,
+                value_column=dataset.value_name_column,
+                group_by=group_by,
+                agg=query.agg,
+                top=query.top,
+                yoy=query.yoy
+            )
+
+        items, total = index.memoize(key, compute)
+
+        return AggregationDTO(
+            group_by=group_by,
+            agg=query.agg,
+            value_column=dataset.value_name_column,
+            items=items,
+            total=total,
+            last_changed_upstream=self.embrapa_port.get_last_changed_upstream(url=url)
+        )
+
+    @staticmethod
+    def aggregate(df: pd.DataFrame, value_column: str, group_by: List[str], agg: str = "sum", top: Optional[int] = None, yoy: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Agrupa o DataFrame de forma vetorizada e calcula o valor agregado de cada grupo.
+
+        :param df: DataFrame com as linhas a agregar.
+        :param value_column: Coluna de valores.
+        :param group_by: Dimensões do agrupamento.
+        :param agg: Função de agregação ('sum', 'mean', 'min' ou 'max').
+        :param top: Se informado, mantém apenas os N grupos de maior valor.
+        :param yoy: Se verdadeiro, inclui a variação em relação ao ano anterior do mesmo grupo
+            (`yoy`, absoluta, e `yoy_pct`, percentual); exige 'year' em `group_by`.
+        :return: Grupos (ordenados pelas dimensões ou, com `top`, pelo valor) e a quantidade total de grupos.
+        """
+        result = df.groupby(group_by, sort=True, dropna=False)[value_column].agg(agg).reset_index(name="value")
+
+        if yoy:
+            # Compara com o mesmo grupo no ano anterior (anos ausentes ficam sem variação)
+            previous = result.assign(year=result["year"] + 1).rename(columns={"value": "previous"})
+            result = result.merge(previous, on=group_by, how="left")
+            result["yoy"] = result["value"] - result["previous"]
+            result["yoy_pct"] = (result["yoy"] / result["previous"].abs() * 100).replace([np.inf, -np.inf], np.nan)
+            result = result.drop(columns="previous")
+
+        total = len(result)
+        if top is not None:
+            result = result.nlargest(top, "value", keep="first")
+
+        items = result.astype(object).where(result.notna(), None).to_dict(orient="records")
+        return items, total
+
+    @staticmethod
+    def paginate(df: pd.DataFrame, model: Type[BaseModel], positions: np.ndarray, total: int, page: int, page_size: int, last_changed_upstream: Optional[datetime] = None, next_cursor: Optional[str] = None, dataset_changed: bool = False) -> PageDTO:
+        """
+        Converte no modelo apenas as linhas da página.
+
+        :param df: DataFrame com o dataset completo.
+        :param model: Modelo para mapear os dados.
+        :param positions: Posições, no DataFrame, das linhas da página.
+        :param total: Quantidade total de linhas (após os filtros).
+        :param page: Número da página.
+        :param page_size: Tamanho da página.
+        :param last_changed_upstream: Data da última mudança dos dados na Embrapa.
+        :param next_cursor: Cursor da próxima página, se houver.
+        :param dataset_changed: Se o dataset mudou desde a página do cursor recebido.
+        :return: Página com os itens e os metadados de paginação.
+        """
+        rows = df.iloc[positions]
+        fields = [field_name for field_name in model.model_fields if field_name in rows.columns]
+        # Monta os registros a partir das colunas (bem mais rápido que `to_dict(orient="records")`)
+        # e valida a página inteira em uma única chamada, em vez de um modelo por linha
+        items = [dict(zip(fields, values)) for values in zip(*(rows[field_name].tolist() for field_name in fields))]
+
+        return PageDTO[model].model_validate({
+            "items": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "pages": math.ceil(total / page_size),
+            "last_changed_upstream": last_changed_upstream,
+            "next_cursor": next_cursor,
+            "dataset_changed": dataset_changed,
+        })
+
+class _DrainableSink(io.RawIOBase):
+    """
+    Destino de escrita que acumula os bytes até serem retirados com `drain`.
+
+    A posição (`tell`) continua contando os bytes já retirados, como exige o
+    `ParquetWriter` para registrar os offsets no rodapé do arquivo.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """
+        Retira e retorna os bytes acumulados.
+        """
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
@@ -1,14 +1,38 @@
-from typing import Type, Optional
+from typing import Dict, Iterable, Type, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import hashlib
+import html
+import io
+import re
 import pandas as pd
 from app.application.ports.output.dataprocessing.cache_port_out import CachePortOut
 from app.application.ports.output.dataprocessing.csv_port_out import CSVPortOut
+from app.application.ports.output.dataprocessing.dataset_cache_port_out import DatasetCachePortOut
+from app.application.ports.output.http.http_port_out import HttpPortOut
+from app.domain.models.entities.dataprocessing.cache_manifest import CacheManifest
 from pydantic import BaseModel
 import requests
 from starlette.exceptions import HTTPException
 from bs4 import BeautifulSoup
 from enum import Enum
 from app.shared.config import settings
+from app.shared.util.single_flight import SingleFlight
+from app.domain.exceptions.dataprocessing.cache_exceptions import CorruptedCacheError
+from app.domain.models.entities.embrapa.embrapa_dataset import EmbrapaDataset
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
 import pybreaker
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Caminho rápido para encontrar o link de download sem montar a árvore do HTML
+_DOWNLOAD_LINK_PATTERN = re.compile(r"""<a\b([^>]*\bclass=["'][^"']*\bfooter_content\b[^"']*["'][^>]*)>(.*?)</a>""", re.IGNORECASE | re.DOTALL)
+_HREF_PATTERN = re.compile(r"""\bhref=["']([^"']+)["']""", re.IGNORECASE)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
 
 class EmbrapaService:
     """
@@ -20,75 +44,477 @@ class EmbrapaService:
         reset_timeout=settings.BREAKER_RESET_TIMEOUT
     )
 
-    def __init__(self, cache_port: CachePortOut, csv_port: CSVPortOut):
+    # Atualizações em segundo plano em andamento no processo
+    _refreshing_urls = set()
+    _refreshing_lock = threading.Lock()
+
+    # Agrupa as atualizações concorrentes da mesma URL dentro do processo
+    _single_flight = SingleFlight()
+
+    def __init__(self, cache_port: CachePortOut, csv_port: CSVPortOut, dataset_cache_port: DatasetCachePortOut, http_port: HttpPortOut):
         self.cache_port = cache_port
         self.csv_port = csv_port
+        self.dataset_cache_port = dataset_cache_port
+        self.http_port = http_port
 
     def get_csv_data(self, url: str, model: Type[BaseModel], category_enum: Optional[Type[Enum]] = None, value_name_column: str = "production", delimiter: str = ";") -> pd.DataFrame:
         """
         Obtém e processa os dados do arquivo CSV da Embrapa.
 
+        Um cache expirado continua sendo servido enquanto uma atualização é feita
+        em segundo plano (stale-while-revalidate). A busca na Embrapa só ocorre no
+        caminho da requisição quando ainda não existe nenhuma cópia em cache.
+
         :param url: URL da página da Embrapa.
         :param model: Modelo para mapear os dados do CSV.
         :param delimiter: Delimitador do CSV (padrão: ";").
-        :return: DataFrame com os dados do CSV.
-        """
-        # Verifica se o arquivo está no cache
-        
-        cached_file_path = self.cache_port.get_csv_file_path(url=url)
-        if self.cache_port.is_file_in_cache(cached_file_path) and self.cache_port.is_cache_expired(cached_file_path) is False:
-            # Processa o arquivo CSV diretamente do cache
-            return pd.read_csv(
-                filepath_or_buffer=cached_file_path,
-                delimiter=delimiter
-            )
+        :return: DataFrame com os dados do CSV (compartilhado, não deve ser alterado).
+        """
+        # Caminho quente: o dataset em memória ainda corresponde ao arquivo em cache
+        cached_file_path = self.cache_port.get_cache_file_path(url=url)
+        try:
+            mtime = self.cache_port.get_cache_mtime(cached_file_path)
+        except OSError:
+            mtime = None
+        df = self.dataset_cache_port.get_dataset(url=url, model=model, mtime=mtime) if mtime is not None else None
 
-        # Faz o download do CSV
-        csv_url = self.download_csv(url=url)
-        
-        result = self.csv_port.process_csv(
-            file_path=csv_url,
+        # Só em uma falta o manifesto é conferido e o arquivo lido
+        if df is None and self._get_valid_cached_file_path(url=url, delimiter=delimiter) is not None:
+            try:
+                df = self._load_cached_dataset(url=url, model=model, cached_file_path=cached_file_path, delimiter=delimiter)
+            except CorruptedCacheError:
+                logger.warning("Cache inválido, buscando novamente na Embrapa.", extra={"url": url})
+
+        if df is not None:
+            if self.cache_port.is_cache_expired(cached_file_path):
+                # Serve a cópia antiga e atualiza sem bloquear a requisição
+                self.refresh_csv_data_in_background(
+                    url=url,
+                    model=model,
+                    category_enum=category_enum,
+                    value_name_column=value_name_column,
+                    delimiter=delimiter
+                )
+            return df
+
+        return self.refresh_csv_data(
+            url=url,
             model=model,
             category_enum=category_enum,
             value_name_column=value_name_column,
             delimiter=delimiter
         )
 
-        # Salva o arquivo no cache
-        df = pd.DataFrame([item.model_dump() for item in result])
-        self.cache_port.save_csv_to_cache(url=url, df=df, sep=delimiter)
+    def refresh_csv_data(self, url: str, model: Type[BaseModel], category_enum: Optional[Type[Enum]] = None, value_name_column: str = "production", delimiter: str = ";") -> pd.DataFrame:
+        """
+        Baixa, processa e grava no cache a versão atual do CSV da Embrapa.
 
-        return df
-    
-    def download_csv(self, url: str) -> str:
-        try:
-            # Chamada protegida com circuit breaker
-            response = self.embrapa_breaker.call(requests.get, url, timeout=10)
-            
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Falha ao acessar a página da Embrapa."
+        Chamadas concorrentes para a mesma URL são agrupadas: dentro do processo
+        compartilham uma única execução e, entre processos, um lock de arquivo ao
+        lado do cache garante que apenas um worker busque a Embrapa. Quem aguardou
+        o lock reaproveita o arquivo gravado pelo outro worker.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo para mapear os dados do CSV.
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :return: DataFrame com os dados atualizados.
+        """
+        def refresh() -> pd.DataFrame:
+            requested_at = time.time()
+            with self.cache_port.get_cache_lock(url=url):
+                cached_file_path = self.cache_port.get_cache_file_path(url=url)
+                if (
+                    self.cache_port.is_cache_valid(cached_file_path)
+                    and self.cache_port.get_cache_mtime(cached_file_path) >= requested_at
+                ):
+                    # Outro worker atualizou o cache enquanto aguardávamos o lock
+                    try:
+                        return self._load_cached_dataset(url=url, model=model, cached_file_path=cached_file_path, delimiter=delimiter)
+                    except CorruptedCacheError:
+                        logger.warning("Cache inválido, buscando novamente na Embrapa.", extra={"url": url})
+
+                return self._fetch_csv_data(
+                    url=url,
+                    model=model,
+                    category_enum=category_enum,
+                    value_name_column=value_name_column,
+                    delimiter=delimiter
                 )
 
-            html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            link_tag = soup.find("a", href=True, text=None, class_="footer_content")
+        return self._single_flight.do(url, refresh)
+
+    def refresh_datasets(self, datasets: Iterable[EmbrapaDataset]) -> Dict[str, pd.DataFrame]:
+        """
+        Atualiza vários datasets em paralelo.
+
+        Cada dataset é atualizado por `refresh_csv_data` em sua própria thread; como
+        o processamento dos CSVs acontece no pool de processos, a carga completa do
+        catálogo escala com a quantidade de núcleos. A falha de um dataset não
+        impede a atualização dos demais.
 
-            if not link_tag or not link_tag.find("span", string=lambda s: s and "DOWNLOAD" in s.upper()):
-                raise HTTPException(
-                    status_code=404,
-                    detail="Download link não encontrado."
+        :param datasets: Datasets da Embrapa a serem atualizados.
+        :return: DataFrames atualizados, indexados pelo nome do dataset (apenas os que tiveram sucesso).
+        """
+        datasets = list(datasets)
+        if not datasets:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(datasets), thread_name_prefix="embrapa-batch") as executor:
+            futures = {
+                dataset.name: executor.submit(
+                    self.refresh_csv_data,
+                    url=dataset.url,
+                    model=dataset.model,
+                    category_enum=dataset.category_enum,
+                    value_name_column=dataset.value_name_column,
+                    delimiter=dataset.delimiter
                 )
+                for dataset in datasets
+            }
+
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception:
+                logger.exception("Falha ao atualizar o dataset da Embrapa.", extra={"dataset": name})
+        return results
+
+    def refresh_csv_data_in_background(self, url: str, model: Type[BaseModel], category_enum: Optional[Type[Enum]] = None, value_name_column: str = "production", delimiter: str = ";") -> bool:
+        """
+        Dispara a atualização do CSV em uma thread, se ainda não houver uma em andamento para a URL.
 
-            download_url = link_tag["href"]
-            if download_url.startswith("/"):
-                download_url = "http://vitibrasil.cnpuv.embrapa.br" + download_url
-            elif not download_url.startswith("http"):
-                download_url = "http://vitibrasil.cnpuv.embrapa.br/" + download_url.lstrip("/")
+        :param url: URL da página da Embrapa.
+        :param model: Modelo para mapear os dados do CSV.
+        :param delimiter: Delimitador do CSV (padrão: ";").
+        :return: True se uma nova atualização foi disparada, False caso contrário.
+        """
+        with self._refreshing_lock:
+            if url in self._refreshing_urls:
+                return False
+            self._refreshing_urls.add(url)
 
+        def refresh():
+            try:
+                self.refresh_csv_data(
+                    url=url,
+                    model=model,
+                    category_enum=category_enum,
+                    value_name_column=value_name_column,
+                    delimiter=delimiter
+                )
+            except Exception:
+                logger.exception("Falha ao atualizar o cache em segundo plano.", extra={"url": url})
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing_urls.discard(url)
+
+        threading.Thread(target=refresh, name=f"embrapa-refresh-{url}", daemon=True).start()
+        return True
+
+    def _fetch_csv_data(self, url: str, model: Type[BaseModel], category_enum: Optional[Type[Enum]] = None, value_name_column: str = "production", delimiter: str = ";") -> pd.DataFrame:
+        """
+        Baixa e processa o CSV da Embrapa e grava o resultado no cache.
+
+        Se já houver uma cópia válida em cache, o download é condicional
+        (`If-None-Match`/`If-Modified-Since`): quando a Embrapa responde 304, o
+        cache é apenas renovado e o CSV não é processado novamente.
+        """
+        csv_url = self.resolve_download_url(url=url)
+
+        cached_file_path = self.cache_port.get_cache_file_path(url=url)
+        manifest = self.cache_port.get_cache_manifest(cached_file_path) if self.cache_port.is_cache_valid(cached_file_path) else None
+        response = self._http_get(csv_url, headers=self._get_conditional_headers(manifest))
+
+        if response.status_code == 404:
+            # O link guardado pode ter mudado: descarta-o (para não ser reutilizado se a
+            # página também falhar) e resolve novamente a partir da página
+            logger.info("Link de download não encontrado, resolvendo novamente.", extra={"url": url, "csv_url": csv_url})
+            self.cache_port.invalidate_download_link(url=url)
+            csv_url = self.resolve_download_url(url=url)
+            response = self._http_get(csv_url, headers=self._get_conditional_headers(manifest))
+
+        if response.status_code == 304 and manifest is not None:
+            try:
+                return self._renew_cached_dataset(url=url, model=model, cached_file_path=cached_file_path, delimiter=delimiter)
+            except CorruptedCacheError:
+                logger.warning("Cache inválido, buscando novamente na Embrapa.", extra={"url": url})
+                response = self._http_get(csv_url)
+
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=503,
+                detail="Falha ao baixar o CSV da Embrapa."
+            )
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        # A Embrapa republica os mesmos arquivos: bytes idênticos não são processados de novo
+        source_checksum = hashlib.sha256(response.content).hexdigest()
+        if manifest is not None and manifest.source_checksum == source_checksum:
+            try:
+                return self._renew_cached_dataset(
+                    url=url,
+                    model=model,
+                    cached_file_path=cached_file_path,
+                    delimiter=delimiter,
+                    etag=etag,
+                    last_modified=last_modified
+                )
+            except CorruptedCacheError:
+                logger.warning("Cache inválido, processando novamente o CSV.", extra={"url": url})
+
+        source_changed_at = self._parse_http_date(last_modified) or datetime.now(timezone.utc)
+
+        if settings.CSV_STREAMING_CHUNK_ROWS > 0:
+            # Cada parte é processada e gravada no cache antes da próxima ser lida;
+            # o dataset completo é então lido do cache (mapeado em memória, no Feather)
+            saved_file_path = self.cache_port.save_dataset_chunks_to_cache(
+                url=url,
+                chunks=self.csv_port.process_csv_in_chunks(
+                    file_path=io.BytesIO(response.content),
+                    model=model,
+                    category_enum=category_enum,
+                    value_name_column=value_name_column,
+                    delimiter=delimiter,
+                    chunk_rows=settings.CSV_STREAMING_CHUNK_ROWS
+                ),
+                sep=delimiter,
+                etag=etag,
+                last_modified=last_modified,
+                source_checksum=source_checksum,
+                source_changed_at=source_changed_at
+            )
+            df = self.cache_port.read_dataset_from_cache(file_path=saved_file_path, sep=delimiter)
+        else:
+            # O processamento é CPU puro e roda em um processo separado
+            df = self.csv_port.process_csv_in_pool(
+                file_path=io.BytesIO(response.content),
+                model=model,
+                category_enum=category_enum,
+                value_name_column=value_name_column,
+                delimiter=delimiter
+            )
+
+            # Salva o arquivo no cache, junto com os validadores HTTP da origem
+            saved_file_path = self.cache_port.save_dataset_to_cache(
+                url=url,
+                df=df,
+                sep=delimiter,
+                etag=etag,
+                last_modified=last_modified,
+                source_checksum=source_checksum,
+                source_changed_at=source_changed_at
+            )
+
+        self.dataset_cache_port.put_dataset(
+            url=url,
+            model=model,
+            mtime=self.cache_port.get_cache_mtime(saved_file_path),
+            df=df
+        )
+
+        return df
+
+    def _renew_cached_dataset(self, url: str, model: Type[BaseModel], cached_file_path: str, delimiter: str = ";", etag: Optional[str] = None, last_modified: Optional[str] = None) -> pd.DataFrame:
+        """
+        Renova o cache de um CSV que não mudou na Embrapa, sem processá-lo novamente.
+
+        :raises CorruptedCacheError: Se o arquivo em cache não corresponder ao manifesto.
+        """
+        df = self._load_cached_dataset(url=url, model=model, cached_file_path=cached_file_path, delimiter=delimiter)
+        self.cache_port.touch_cache(cached_file_path, etag=etag, last_modified=last_modified)
+        self.dataset_cache_port.put_dataset(
+            url=url,
+            model=model,
+            mtime=self.cache_port.get_cache_mtime(cached_file_path),
+            df=df
+        )
+        return df
+
+    @staticmethod
+    def _parse_http_date(value: Optional[str]) -> Optional[datetime]:
+        """
+        Converte uma data no formato HTTP (ex.: `Last-Modified`), retornando None se inválida.
+        """
+        if not value:
+            return None
+        try:
+            return parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_conditional_headers(manifest: Optional[CacheManifest]) -> Dict[str, str]:
+        """
+        Monta os cabeçalhos da requisição condicional a partir do manifesto do cache.
+        """
+        headers = {}
+        if manifest is not None:
+            if manifest.etag:
+                headers["If-None-Match"] = manifest.etag
+            if manifest.last_modified:
+                headers["If-Modified-Since"] = manifest.last_modified
+        return headers
+
+    def _load_cached_dataset(self, url: str, model: Type[BaseModel], cached_file_path: str, delimiter: str = ";") -> pd.DataFrame:
+        """
+        Carrega o dataset do cache, reaproveitando a cópia em memória enquanto o arquivo não mudar.
+
+        :raises CorruptedCacheError: Se o arquivo em cache não corresponder ao manifesto.
+        """
+        mtime = self.cache_port.get_cache_mtime(cached_file_path)
+        df = self.dataset_cache_port.get_dataset(url=url, model=model, mtime=mtime)
+        if df is not None:
+            return df
+
+        # Lê o arquivo diretamente do cache, conferindo-o com o manifesto
+        df = self.cache_port.read_dataset_from_cache(file_path=cached_file_path, sep=delimiter)
+        self.dataset_cache_port.put_dataset(url=url, model=model, mtime=mtime, df=df)
+        return df
+
+    def _get_valid_cached_file_path(self, url: str, delimiter: str = ";") -> Optional[str]:
+        """
+        Retorna o caminho do cache no formato configurado, se ele for válido, migrando
+        antes uma cópia válida gravada em outro formato (por exemplo, CSV de versões anteriores).
+        """
+        cached_file_path = self.cache_port.get_cache_file_path(url=url)
+        if self.cache_port.is_cache_valid(cached_file_path):
+            return cached_file_path
+        if self.cache_port.migrate_cache(url=url, sep=delimiter) is not None:
+            return cached_file_path
+        # Outro worker pode ter migrado o cache enquanto aguardávamos o lock
+        return cached_file_path if self.cache_port.is_cache_valid(cached_file_path) else None
+
+    def get_dataset_version(self, url: str, model: Type[BaseModel]) -> Optional[str]:
+        """
+        Retorna a versão do dataset em memória, se ela ainda corresponder ao arquivo em cache.
+
+        Custa apenas a leitura dos metadados do arquivo: serve para responder a partir
+        de caches de resposta sem carregar o dataset. Um cache expirado retorna None,
+        para que a requisição siga o caminho normal e agende a atualização.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :return: Versão do dataset ou None se ele não estiver em memória.
+        """
+        cached_file_path = self.cache_port.get_cache_file_path(url=url)
+        try:
+            if self.cache_port.is_cache_expired(cached_file_path):
+                return None
+            mtime = self.cache_port.get_cache_mtime(cached_file_path)
+        except OSError:
+            return None
+        return self.dataset_cache_port.get_dataset_version(url=url, model=model, mtime=mtime)
+
+    def get_dataset_index(self, url: str, model: Type[BaseModel], df: pd.DataFrame) -> DatasetIndex:
+        """
+        Retorna os índices do dataset obtido em `get_csv_data`.
+
+        :param url: URL da página da Embrapa.
+        :param model: Modelo usado para mapear os dados.
+        :param df: DataFrame retornado por `get_csv_data`.
+        :return: Índices do DataFrame.
+        """
+        return self.dataset_cache_port.get_dataset_index(url=url, model=model, df=df)
+
+    def get_last_changed_upstream(self, url: str) -> Optional[datetime]:
+        """
+        Retorna quando o CSV da URL mudou pela última vez na Embrapa.
+
+        :param url: URL da página da Embrapa.
+        :return: Data da última mudança ou None se desconhecida.
+        """
+        manifest = self.cache_port.get_cache_manifest(self.cache_port.get_cache_file_path(url=url))
+        return manifest.source_changed_at if manifest is not None else None
+
+    def get_cache_age(self, url: str, delimiter: str = ";") -> Optional[float]:
+        """
+        Retorna há quantos segundos o dataset da URL foi gravado no cache.
+
+        :param url: URL da página da Embrapa.
+        :param delimiter: Delimitador do CSV, usado se o cache precisar ser migrado de formato.
+        :return: Idade do cache em segundos ou None se não houver cópia em cache.
+        """
+        cached_file_path = self._get_valid_cached_file_path(url=url, delimiter=delimiter)
+        if cached_file_path is None:
+            return None
+        return time.time() - self.cache_port.get_cache_mtime(cached_file_path)
+    
+    def resolve_download_url(self, url: str) -> str:
+        """
+        Retorna o link de download do CSV, consultando a página da Embrapa apenas
+        quando o link guardado no cache estiver ausente ou expirado.
+
+        :param url: URL da página da Embrapa.
+        :return: URL absoluta do CSV.
+        """
+        download_url = self.cache_port.get_download_link(url=url)
+        if download_url is not None:
             return download_url
 
+        download_url = self.download_csv(url=url)
+        self.cache_port.save_download_link(url=url, download_url=download_url)
+        return download_url
+
+    def download_csv(self, url: str) -> str:
+        """
+        Encontra, na página da Embrapa, o link de download do CSV.
+
+        :param url: URL da página da Embrapa.
+        :return: URL absoluta do CSV.
+        """
+        response = self._http_get(url)
+
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=503,
+                detail="Falha ao acessar a página da Embrapa."
+            )
+
+        download_url = self._extract_download_url(response.text)
+        if download_url is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Download link não encontrado."
+            )
+
+        if download_url.startswith("/"):
+            download_url = settings.EMBRAPA_BASE_URL + download_url
+        elif not download_url.startswith("http"):
+            download_url = settings.EMBRAPA_BASE_URL + "/" + download_url.lstrip("/")
+
+        return download_url
+
+    @staticmethod
+    def _extract_download_url(html_content: str) -> Optional[str]:
+        """
+        Extrai o href do link `a.footer_content` de download da página.
+
+        Tenta primeiro uma expressão regular; o parse completo com o BeautifulSoup
+        só é feito quando a página não tem o formato esperado.
+        """
+        for match in _DOWNLOAD_LINK_PATTERN.finditer(html_content):
+            attributes, content = match.groups()
+            href = _HREF_PATTERN.search(attributes)
+            if href and "DOWNLOAD" in _TAG_PATTERN.sub("", content).upper():
+                return html.unescape(href.group(1))
+
+        soup = BeautifulSoup(html_content, 'html.parser')
+        link_tag = soup.find("a", href=True, text=None, class_="footer_content")
+
+        if not link_tag or not link_tag.find("span", string=lambda s: s and "DOWNLOAD" in s.upper()):
+            return None
+        return link_tag["href"]
+
+    def _http_get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Faz uma requisição GET à Embrapa pela sessão HTTP compartilhada, protegida pelo circuit breaker.
+        """
+        try:
+            # Chamada protegida com circuit breaker
+            return self.embrapa_breaker.call(self.http_port.get, url, headers=headers)
         except pybreaker.CircuitBreakerError:
             raise HTTPException(
                 status_code=503,
@@ -98,4 +524,4 @@ class EmbrapaService:
             raise HTTPException(
                 status_code=502,
                 detail=f"Erro ao conectar ao serviço da Embrapa: {str(e)}"
-            )
\ No newline at end of file
+            )
@@ -1,33 +1,56 @@
-from typing import List
-from app.application.ports.output.embrapa.embrapa_port_out import EmbrapaPortOut
-from pydantic import BaseModel
-from app.domain.models.entities.embrapa.marketing import MarketingEntity, MarketingCategoryEnum
+from app.domain.services.embrapa.embrapa_query_service import EmbrapaQueryService
+from typing import Iterator, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
+from app.domain.models.entities.embrapa.embrapa_dataset import MARKETING_DATASET
 
-class MarketingService:
+class MarketingService(EmbrapaQueryService):
     """
-    Serviço para lógica de negócio relacionada à produção.
+    Serviço para lógica de negócio relacionada à comercialização.
     """
 
-    def __init__(self, embrapa_port: EmbrapaPortOut):
-        self.embrapa_port = embrapa_port
-
-    def get_marketing_data(self, url: str, page: int, page_size: int) -> List[BaseModel]:
+    def get_marketing_data(self, url: str, page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
         """
-        Obtém os dados de produção paginados.
+        Obtém os dados de comercialização paginados.
 
         :param url: URL da página da Embrapa.
         :param model: Modelo para mapear os dados.
         :param page: Número da página.
         :param page_size: Tamanho da página.
-        :return: Lista de instâncias do modelo.
+        :param filters: Filtros opcionais da consulta.
+        :param cursor: Cursor `next_cursor` de uma página anterior.
+        :return: Página com as instâncias do modelo e os metadados de paginação.
+        """
+        return self.get_page(url=url, dataset=MARKETING_DATASET, page=page, page_size=page_size, filters=filters, cursor=cursor)
+
+    def get_marketing_version(self, url: str) -> Optional[str]:
+        """
+        Obtém a versão dos dados de comercialização em memória, sem carregá-los.
+
+        :param url: URL da página da Embrapa.
+        :return: Versão do dataset ou None se ele não estiver em memória.
+        """
+        return self.get_version(url=url, dataset=MARKETING_DATASET)
+
+    def get_marketing_aggregation(self, url: str, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
         """
-        # Faz o download do CSV usando o portOut da Embrapa
-        csv_data = self.embrapa_port.get_csv_data(url=url, model=MarketingEntity, category_enum=MarketingCategoryEnum, value_name_column="marketing", delimiter=";")
+        Obtém os dados de comercialização agregados.
 
-        # Processa os dados (simulação de lógica de processamento)
-        processed_data = [MarketingEntity(**row) for row in csv_data.to_dict(orient="records")]
+        :param url: URL da página da Embrapa.
+        :param query: Dimensões, função de agregação, top-N e variação anual.
+        :param filters: Filtros opcionais aplicados antes da agregação.
+        :return: Grupos com o valor agregado e os metadados da agregação.
+        """
+        return self.get_aggregation(url=url, dataset=MARKETING_DATASET, query=query, filters=filters)
 
-        # Paginação
-        start = (page - 1) * page_size
-        end = start + page_size
-        return processed_data[start:end]
\ No newline at end of file
+    def get_marketing_export(self, url: str, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Exporta os dados de comercialização completos, em partes.
+
+        :param url: URL da página da Embrapa.
+        :param export_format: 'ndjson', 'csv' ou 'parquet'.
+        :param filters: Filtros opcionais aplicados antes da exportação.
+        :return: Iterador com os bytes do arquivo exportado.
+        """
+        return self.export(url=url, dataset=MARKETING_DATASET, export_format=export_format, filters=filters)
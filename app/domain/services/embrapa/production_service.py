@@ -1,17 +1,16 @@
-from typing import List
-from app.application.ports.output.embrapa.embrapa_port_out import EmbrapaPortOut
-from pydantic import BaseModel
-from app.domain.models.entities.embrapa.production import ProductionEntity, ProductionCategoryEnum
+from app.domain.services.embrapa.embrapa_query_service import EmbrapaQueryService
+from typing import Iterator, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
+from app.domain.models.entities.embrapa.embrapa_dataset import PRODUCTION_DATASET
 
-class ProductionService:
+class ProductionService(EmbrapaQueryService):
     """
     Serviço para lógica de negócio relacionada à produção.
     """
 
-    def __init__(self, embrapa_port: EmbrapaPortOut):
-        self.embrapa_port = embrapa_port
-
-    def get_production_data(self, url: str, page: int, page_size: int) -> List[BaseModel]:
+    def get_production_data(self, url: str, page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
         """
         Obtém os dados de produção paginados.
 
@@ -19,15 +18,39 @@ class ProductionService:
         :param model: Modelo para mapear os dados.
         :param page: Número da página.
         :param page_size: Tamanho da página.
-        :return: Lista de instâncias do modelo.
+        :param filters: Filtros opcionais da consulta.
+        :param cursor: Cursor `next_cursor` de uma página anterior.
+        :return: Página com as instâncias do modelo e os metadados de paginação.
+        """
+        return self.get_page(url=url, dataset=PRODUCTION_DATASET, page=page, page_size=page_size, filters=filters, cursor=cursor)
+
+    def get_production_version(self, url: str) -> Optional[str]:
+        """
+        Obtém a versão dos dados de produção em memória, sem carregá-los.
+
+        :param url: URL da página da Embrapa.
+        :return: Versão do dataset ou None se ele não estiver em memória.
+        """
+        return self.get_version(url=url, dataset=PRODUCTION_DATASET)
+
+    def get_production_aggregation(self, url: str, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
         """
-        # Faz o download do CSV usando o portOut da Embrapa
-        csv_data = self.embrapa_port.get_csv_data(url=url, model=ProductionEntity, category_enum=ProductionCategoryEnum, value_name_column="production", delimiter=";")
+        Obtém os dados de produção agregados.
 
-        # Processa os dados (simulação de lógica de processamento)
-        processed_data = [ProductionEntity(**row) for row in csv_data.to_dict(orient="records")]
+        :param url: URL da página da Embrapa.
+        :param query: Dimensões, função de agregação, top-N e variação anual.
+        :param filters: Filtros opcionais aplicados antes da agregação.
+        :return: Grupos com o valor agregado e os metadados da agregação.
+        """
+        return self.get_aggregation(url=url, dataset=PRODUCTION_DATASET, query=query, filters=filters)
 
-        # Paginação
-        start = (page - 1) * page_size
-        end = start + page_size
-        return processed_data[start:end]
\ No newline at end of file
+    def get_production_export(self, url: str, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Exporta os dados de produção completos, em partes.
+
+        :param url: URL da página da Embrapa.
+        :param export_format: 'ndjson', 'csv' ou 'parquet'.
+        :param filters: Filtros opcionais aplicados antes da exportação.
+        :return: Iterador com os bytes do arquivo exportado.
+        """
+        return self.export(url=url, dataset=PRODUCTION_DATASET, export_format=export_format, filters=filters)
@@ -0,0 +1,94 @@
+from typing import Dict, Iterable, Optional
+import asyncio
+import logging
+import random
+from app.application.ports.output.embrapa.embrapa_port_out import EmbrapaPortOut
+from app.domain.models.entities.embrapa.embrapa_dataset import EmbrapaDataset
+from app.shared.config import settings
+from app.shared.util.bounded_executor import BoundedExecutor
+
+logger = logging.getLogger(__name__)
+
+class RefreshSchedulerService:
+    """
+    Agenda a atualização dos datasets da Embrapa antes que o cache expire.
+
+    A idade de cada dataset é lida do próprio cache, de modo que vários workers
+    enxergam as atualizações feitas uns pelos outros. O jitter espalha as
+    atualizações no tempo para que os workers não busquem a Embrapa juntos.
+    """
+
+    def __init__(self, embrapa_port: EmbrapaPortOut, datasets: Iterable[EmbrapaDataset], executor: BoundedExecutor):
+        self.embrapa_port = embrapa_port
+        self.datasets = list(datasets)
+        self.executor = executor
+        self._task: Optional[asyncio.Task] = None
+        # Jitter sorteado por dataset a cada ciclo de atualização
+        self._jitter: Dict[str, float] = {dataset.name: self._draw_jitter() for dataset in self.datasets}
+
+    async def start(self) -> None:
+        """
+        Inicia o agendador em uma tarefa do event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="embrapa-refresh-scheduler")
+
+    async def stop(self) -> None:
+        """
+        Interrompe o agendador e aguarda o término da tarefa.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def refresh_due_datasets(self) -> None:
+        """
+        Atualiza, em paralelo, os datasets ausentes do cache ou próximos da expiração.
+        """
+        try:
+            # A verificação lê o cache em disco e pode migrá-lo, então também sai do event loop
+            due_datasets = await self.executor.run(lambda: [dataset for dataset in self.datasets if self.is_refresh_due(dataset)])
+            if not due_datasets:
+                return
+
+            refreshed = await self.executor.run(self.embrapa_port.refresh_datasets, due_datasets)
+        except Exception:
+            logger.exception("Falha ao atualizar os datasets da Embrapa.")
+            return
+
+        for name in refreshed:
+            self._jitter[name] = self._draw_jitter()
+
+    def is_refresh_due(self, dataset: EmbrapaDataset) -> bool:
+        """
+        Verifica se o dataset precisa ser atualizado.
+
+        :param dataset: Dataset da Embrapa.
+        :return: True se o dataset não está em cache ou passou do intervalo de atualização.
+        """
+        age = self.embrapa_port.get_cache_age(url=dataset.url, delimiter=dataset.delimiter)
+        if age is None:
+            return True
+
+        interval = settings.REFRESH_INTERVALS.get(dataset.name, settings.REFRESH_INTERVAL_SECONDS)
+        return age >= max(interval - self._jitter[dataset.name], 0)
+
+    async def _run(self) -> None:
+        """
+        Laço principal do agendador.
+        """
+        while True:
+            await self.refresh_due_datasets()
+            await asyncio.sleep(settings.REFRESH_CHECK_INTERVAL_SECONDS + random.uniform(0, settings.REFRESH_CHECK_INTERVAL_SECONDS / 10))
+
+    @staticmethod
+    def _draw_jitter() -> float:
+        """
+        Sorteia quantos segundos antes do intervalo configurado o dataset será atualizado.
+        """
+        return random.uniform(0, settings.REFRESH_JITTER_SECONDS)
@@ -7,22 +7,27 @@ from app.domain.models.entities.iam.user import UserEntity
 from datetime import datetime, timedelta, timezone
 from app.shared.config import settings
 from app.application.ports.output.iam.auth.permissions_port_out import PermissionsPortOut
+from app.shared.util.token_cache import TokenCache
 
 class JWTAuthService:
 
-    def __init__(self, permissions_port_out: PermissionsPortOut):
+    def __init__(self, permissions_port_out: PermissionsPortOut, token_cache: TokenCache):
         """
         Initializes the JWTAuthService with the output port.
         :param permissions_port_out: An instance of PermissionsPortOut to handle user permissions.
+        :param token_cache: Cache of the claims of already verified tokens.
         """
         self.permissions_port_out = permissions_port_out
+        self.token_cache = token_cache
 
     def create_access_token(self, user_data: UserEntity) -> str:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        issued_at = datetime.now(timezone.utc)
+        expire = issued_at + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
         token_data = {
             "sub": user_data.login,
             "permissions": user_data.permissions,
+            "iat": issued_at,
             "exp": expire
         }
 
@@ -34,12 +39,32 @@ class JWTAuthService:
         
         :param token: JWT extraído do header.
         :param endpoint_permission: Permissão exigida.
+        :return: Claims do token.
         """
         
         try:
-            payload = jwt.decode(token, key=settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            self.permissions_port_out.validate_access_permissions(payload.get("sub"), endpoint_permission)
+            payload = self.token_cache.decode(token)
         except jwt.ExpiredSignatureError:
             raise ExpiredTokenException("Token expirado.")
         except jwt.InvalidTokenError:
             raise InvalidTokenException("Token inválido.")
+
+        # As permissões do token só são usadas se não mudaram depois da emissão
+        if settings.AUTH_TRUST_TOKEN_CLAIMS and self.token_cache.is_current(payload):
+            permissions = payload.get("permissions")
+            if not permissions or endpoint_permission not in permissions:
+                raise PermissionDeniedException(f"User '{payload.get('sub')}' has no permissions.")
+        else:
+            self.permissions_port_out.validate_access_permissions(payload.get("sub"), endpoint_permission)
+        return payload
+
+    def invalidate_user_tokens(self, login: str):
+        """
+        Deixa de confiar nas permissões gravadas nos tokens já emitidos para o usuário.
+
+        Vale apenas para este processo: os demais workers continuam usando as
+        claims (com `AUTH_TRUST_TOKEN_CLAIMS`) até o `exp` dos tokens.
+
+        :param login: Login do usuário cujas permissões mudaram.
+        """
+        self.token_cache.invalidate_user(login)
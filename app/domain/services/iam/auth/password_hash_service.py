@@ -0,0 +1,60 @@
+import base64
+import hashlib
+import bcrypt
+
+class PasswordHashService:
+    """
+    Hash de senhas com bcrypt e custo (rounds) configurável.
+
+    A senha passa antes por SHA-256 (em base64), como no `bcrypt_sha256` do
+    passlib: o bcrypt só considera os primeiros 72 bytes da senha e, a partir
+    da versão 5, recusa senhas maiores.
+    """
+
+    def __init__(self, rounds: int):
+        """
+        :param rounds: Custo do bcrypt (log2 do número de iterações, de 4 a 31).
+        """
+        self.rounds = rounds
+
+    def hash_password(self, password: str) -> str:
+        """
+        Gera o hash da senha com o custo atual.
+
+        :param password: Senha em texto puro.
+        :return: Hash no formato `$2b$<rounds>$...`.
+        """
+        return bcrypt.hashpw(self._prepare(password), bcrypt.gensalt(rounds=self.rounds)).decode("ascii")
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        """
+        Confere a senha com o hash armazenado.
+
+        :param password: Senha em texto puro.
+        :param password_hash: Hash armazenado.
+        :return: True se a senha corresponder ao hash.
+        """
+        try:
+            return bcrypt.checkpw(self._prepare(password), password_hash.encode("ascii"))
+        except (ValueError, UnicodeEncodeError):
+            # Hash em formato inválido
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Indica se o hash foi gerado com um custo diferente do atual.
+
+        :param password_hash: Hash armazenado.
+        :return: True se o hash deve ser gerado novamente.
+        """
+        try:
+            return int(password_hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    @staticmethod
+    def _prepare(password: str) -> bytes:
+        """
+        Reduz a senha a 44 bytes (SHA-256 em base64), dentro do limite do bcrypt.
+        """
+        return base64.b64encode(hashlib.sha256(password.encode("utf-8")).digest())
@@ -1,12 +1,14 @@
 from app.application.ports.output.iam.db.local_db_port_out import LocalDBPortOut
+from app.application.ports.output.iam.auth.password_hash_port_out import PasswordHashPortOut
 from app.domain.models.entities.iam.user import UserEntity
 from app.domain.exceptions.iam.permission.permission_exceptions import PermissionDeniedException
 from app.domain.exceptions.iam.db.db_exceptions import UserNotFoundError, InvalidPasswordError
 
 class PermissionsService(LocalDBPortOut):
 
-    def __init__(self, local_db_port: LocalDBPortOut):
+    def __init__(self, local_db_port: LocalDBPortOut, password_hash_port: PasswordHashPortOut):
         self.local_db_port = local_db_port
+        self.password_hash_port = password_hash_port
 
     def validate_user(self, user: UserEntity):
         """
@@ -19,8 +21,12 @@ class PermissionsService(LocalDBPortOut):
         if not user_entity:
             raise UserNotFoundError(f"User '{user.login}' not found.")
         
-        if user.password != user_entity.password:
+        if not self.password_hash_port.verify_password(user.password, user_entity.password):
             raise InvalidPasswordError("Invalid password provided.")
+
+        # Hashes generated with other parameters (e.g. a lower cost) are replaced on login
+        if self.password_hash_port.needs_rehash(user_entity.password):
+            self.local_db_port.update_password(user_entity.login, self.password_hash_port.hash_password(user.password))
         
         return user_entity
 
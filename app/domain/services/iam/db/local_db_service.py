@@ -1,5 +1,5 @@
 from app.domain.models.entities.iam.user import UserEntity
-from app.domain.exceptions.iam.db.db_exceptions import UserAlreadyExistsError, UserNotFoundError, InvalidPasswordError
+from app.domain.exceptions.iam.db.db_exceptions import UserAlreadyExistsError, UserNotFoundError
 
 class LocalDbService:
     """
@@ -35,21 +35,16 @@ class LocalDbService:
     def get_user(self, user: UserEntity) -> UserEntity:
         """
         Retrieves a user from the local database by login.
+
+        The password is not checked here: the stored value is a hash, verified by the permissions service.
         
         :param user: User data containing the login to be retrieved.
-        :return: The user data if found, None otherwise.
+        :return: The user data if found.
+        :raises UserNotFoundError: If the user is not found.
         """
-        try:
-            user_entity = self.db["users"][user.login]
-            if user is None:
-                raise UserNotFoundError(f"User '{user.login}' not found.")
-            if user.password != user_entity.password:
-                raise InvalidPasswordError(f"Invalid password for user '{user.login}'.")
-            return user_entity
-        except UserNotFoundError as e:
-            raise UserNotFoundError(f"User '{user.login}' not found.") from e
-        except InvalidPasswordError as e:
-            raise InvalidPasswordError(f"Invalid password for user '{user.login}'.") from e
+        if user.login not in self.db["users"]:
+            raise UserNotFoundError(f"User '{user.login}' not found.")
+        return self.db["users"][user.login]
         
     def get_user_by_login(self, login: str) -> UserEntity:
         """
@@ -63,5 +58,14 @@ class LocalDbService:
         else:
             raise UserNotFoundError(f"User with login '{login}' not found.")
 
+    def update_password(self, login: str, password_hash: str):
+        """
+        Replaces the stored password hash of a user.
+
+        :param login: The login of the user.
+        :param password_hash: The new password hash.
+        """
+        self.get_user_by_login(login).password = password_hash
+
     def delete_user(self, user_id):
         raise NotImplementedError("Delete user operation is not implemented in LocalDbService.")
\ No newline at end of file
@@ -36,8 +36,9 @@ class LogInService:
 
 
         try:
-            self.permissions_port_out.validate_user(user_data)
-            return self.token_port_in.create_access_token(user_data)
+            # O token leva as permissões cadastradas do usuário
+            user_entity = self.permissions_port_out.validate_user(user_data)
+            return self.token_port_in.create_access_token(user_entity)
         except UserAlreadyExistsError as e:
             raise UserAlreadyExistsError(f"Error registering user: {str(e)}") from e
         except PydanticRequestValidationError as e:
@@ -1,17 +1,20 @@
 from app.domain.models.entities.iam.user import UserEntity
 from app.application.ports.output.iam.sign_up_port_out import SignUpPortOut
+from app.application.ports.output.iam.auth.password_hash_port_out import PasswordHashPortOut
 from app.shared.dto.iam.user_request_dto import UserRequestDTO
 from app.domain.exceptions.iam.db.db_exceptions import UserAlreadyExistsError
 from app.domain.exceptions.iam.model.model_exceptions import PydanticRequestValidationError
 
 class SignUpService:
 
-    def __init__(self, port_out: SignUpPortOut):
+    def __init__(self, port_out: SignUpPortOut, password_hash_port: PasswordHashPortOut):
         """
         Initializes the SignInService with the output port.
         :param port_out: An instance of SingInPortOut to handle user registration.
+        :param password_hash_port: An instance of PasswordHashPortOut to hash the user password.
         """
         self.port_out = port_out
+        self.password_hash_port = password_hash_port
         
 
     def validate_and_register_user(self, user_dto: UserRequestDTO = None):
@@ -24,6 +27,8 @@ class SignUpService:
             raise PydanticRequestValidationError("User data cannot be empty.")
         user = user_dto.model_dump_json()
         user_data = UserEntity.model_validate_json(user)
+        # Only the password hash is stored
+        user_data.password = self.password_hash_port.hash_password(user_data.password)
 
         try:
             self.port_out.register_user(user_data)
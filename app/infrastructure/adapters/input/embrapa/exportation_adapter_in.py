@@ -1,18 +1,38 @@
-from typing import List
 from app.application.ports.input.embrapa.exportation_port_in import ExportationPortIn
 from app.domain.services.embrapa.exportation_service import ExportationService
-from pydantic import BaseModel
+from typing import Iterator, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
 
 class ExportationAdapterIn(ExportationPortIn):
     """
-    Adapter para interagir com o serviço de produção.
+    Adapter para interagir com o serviço de exportação.
     """
 
     def __init__(self, service: ExportationService):
         self.service = service
 
-    def get_exportation_data(self, url: str, page: int, page_size: int) -> List[BaseModel]:
+    def get_exportation_data(self, url: str, page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
         """
-        Implementação da porta para obter os dados de produção paginados.
+        Implementação da porta para obter os dados de exportação paginados.
         """
-        return self.service.get_exportation_data(url=url, page=page, page_size=page_size)
\ No newline at end of file
+        return self.service.get_exportation_data(url=url, page=page, page_size=page_size, filters=filters, cursor=cursor)
+
+    def get_exportation_version(self, url: str) -> Optional[str]:
+        """
+        Implementação da porta para obter a versão dos dados de exportação em memória.
+        """
+        return self.service.get_exportation_version(url=url)
+
+    def get_exportation_aggregation(self, url: str, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
+        """
+        Implementação da porta para obter os dados de exportação agregados.
+        """
+        return self.service.get_exportation_aggregation(url=url, query=query, filters=filters)
+
+    def get_exportation_export(self, url: str, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Implementação da porta para exportar os dados de exportação.
+        """
+        return self.service.get_exportation_export(url=url, export_format=export_format, filters=filters)
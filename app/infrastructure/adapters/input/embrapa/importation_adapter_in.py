@@ -1,18 +1,38 @@
-from typing import List
 from app.application.ports.input.embrapa.importation_port_in import ImportationPortIn
 from app.domain.services.embrapa.importation_service import ImportationService
-from pydantic import BaseModel
+from typing import Iterator, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
 
 class ImportationAdapterIn(ImportationPortIn):
     """
-    Adapter para interagir com o serviço de produção.
+    Adapter para interagir com o serviço de importação.
     """
 
     def __init__(self, service: ImportationService):
         self.service = service
 
-    def get_importation_data(self, url: str, page: int, page_size: int) -> List[BaseModel]:
+    def get_importation_data(self, url: str, page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
         """
-        Implementação da porta para obter os dados de produção paginados.
+        Implementação da porta para obter os dados de importação paginados.
         """
-        return self.service.get_importation_data(url=url, page=page, page_size=page_size)
\ No newline at end of file
+        return self.service.get_importation_data(url=url, page=page, page_size=page_size, filters=filters, cursor=cursor)
+
+    def get_importation_version(self, url: str) -> Optional[str]:
+        """
+        Implementação da porta para obter a versão dos dados de importação em memória.
+        """
+        return self.service.get_importation_version(url=url)
+
+    def get_importation_aggregation(self, url: str, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
+        """
+        Implementação da porta para obter os dados de importação agregados.
+        """
+        return self.service.get_importation_aggregation(url=url, query=query, filters=filters)
+
+    def get_importation_export(self, url: str, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Implementação da porta para exportar os dados de importação.
+        """
+        return self.service.get_importation_export(url=url, export_format=export_format, filters=filters)
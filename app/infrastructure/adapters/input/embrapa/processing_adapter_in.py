@@ -1,18 +1,38 @@
-from typing import List
 from app.application.ports.input.embrapa.processing_port_in import ProcessingPortIn
 from app.domain.services.embrapa.processing_service import ProcessingService
-from pydantic import BaseModel
+from typing import Iterator, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
 
 class ProcessingAdapterIn(ProcessingPortIn):
     """
-    Adapter para interagir com o serviço de produção.
+    Adapter para interagir com o serviço de processamento.
     """
 
     def __init__(self, service: ProcessingService):
         self.service = service
 
-    def get_processing_data(self, url: str, page: int, page_size: int) -> List[BaseModel]:
+    def get_processing_data(self, url: str, page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
         """
-        Implementação da porta para obter os dados de produção paginados.
+        Implementação da porta para obter os dados de processamento paginados.
         """
-        return self.service.get_processing_data(url=url, page=page, page_size=page_size)
\ No newline at end of file
+        return self.service.get_processing_data(url=url, page=page, page_size=page_size, filters=filters, cursor=cursor)
+
+    def get_processing_version(self, url: str) -> Optional[str]:
+        """
+        Implementação da porta para obter a versão dos dados de processamento em memória.
+        """
+        return self.service.get_processing_version(url=url)
+
+    def get_processing_aggregation(self, url: str, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
+        """
+        Implementação da porta para obter os dados de processamento agregados.
+        """
+        return self.service.get_processing_aggregation(url=url, query=query, filters=filters)
+
+    def get_processing_export(self, url: str, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Implementação da porta para exportar os dados de processamento.
+        """
+        return self.service.get_processing_export(url=url, export_format=export_format, filters=filters)
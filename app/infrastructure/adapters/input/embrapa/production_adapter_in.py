@@ -1,7 +1,10 @@
-from typing import Type, List
+from typing import Type
 from app.application.ports.input.embrapa.production_port_in import ProductionPortIn
 from app.domain.services.embrapa.production_service import ProductionService
-from pydantic import BaseModel
+from typing import Iterator, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
 
 class ProductionAdapterIn(ProductionPortIn):
     """
@@ -11,8 +14,26 @@ class ProductionAdapterIn(ProductionPortIn):
     def __init__(self, service: ProductionService):
         self.service = service
 
-    def get_production_data(self, url: str, page: int, page_size: int) -> List[BaseModel]:
+    def get_production_data(self, url: str, page: int, page_size: int, filters: Optional[FilterDTO] = None, cursor: Optional[str] = None) -> PageDTO:
         """
         Implementação da porta para obter os dados de produção paginados.
         """
-        return self.service.get_production_data(url=url, page=page, page_size=page_size)
\ No newline at end of file
+        return self.service.get_production_data(url=url, page=page, page_size=page_size, filters=filters, cursor=cursor)
+
+    def get_production_version(self, url: str) -> Optional[str]:
+        """
+        Implementação da porta para obter a versão dos dados de produção em memória.
+        """
+        return self.service.get_production_version(url=url)
+
+    def get_production_aggregation(self, url: str, query: AggregationQueryDTO, filters: Optional[FilterDTO] = None) -> AggregationDTO:
+        """
+        Implementação da porta para obter os dados de produção agregados.
+        """
+        return self.service.get_production_aggregation(url=url, query=query, filters=filters)
+
+    def get_production_export(self, url: str, export_format: str = "ndjson", filters: Optional[FilterDTO] = None) -> Iterator[bytes]:
+        """
+        Implementação da porta para exportar os dados de produção.
+        """
+        return self.service.get_production_export(url=url, export_format=export_format, filters=filters)
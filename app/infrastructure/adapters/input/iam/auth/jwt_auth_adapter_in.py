@@ -21,4 +21,10 @@ class JWTAuthAdapterIn(JWTAuthPortIn):
         """
         Decorator para validação de token JWT e permissões.
         """
-        return self.service.validate_token(token, endpoint_permission)
\ No newline at end of file
+        return self.service.validate_token(token, endpoint_permission)
+
+    def invalidate_user_tokens(self, login: str):
+        """
+        Invalida as permissões gravadas nos tokens já emitidos para o usuário (apenas no processo atual).
+        """
+        return self.service.invalidate_user_tokens(login)
@@ -1,6 +1,10 @@
 from app.application.ports.output.dataprocessing.cache_port_out import CachePortOut
 from app.domain.services.dataprocessing.cache_service import CacheService
+from typing import Iterable, Optional
+from datetime import datetime
 import pandas as pd
+from app.domain.models.entities.dataprocessing.cache_manifest import CacheManifest
+from app.shared.util.file_lock import FileLock
 
 class CacheAdapterOut(CachePortOut):
     """
@@ -10,12 +14,100 @@ class CacheAdapterOut(CachePortOut):
     def __init__(self, service: CacheService):
         self.service = service
 
+    def save_dataset_to_cache(
+        self,
+        url: str,
+        df: pd.DataFrame,
+        sep: str = ";",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source_checksum: Optional[str] = None,
+        source_changed_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Salva um DataFrame no cache, no formato configurado.
+        """
+        return self.service.save_dataset_to_cache(
+            url=url,
+            df=df,
+            sep=sep,
+            etag=etag,
+            last_modified=last_modified,
+            source_checksum=source_checksum,
+            source_changed_at=source_changed_at
+        )
+
+    def save_dataset_chunks_to_cache(
+        self,
+        url: str,
+        chunks: Iterable[pd.DataFrame],
+        sep: str = ";",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        source_checksum: Optional[str] = None,
+        source_changed_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Salva no cache um dataset recebido em partes.
+        """
+        return self.service.save_dataset_chunks_to_cache(
+            url=url,
+            chunks=chunks,
+            sep=sep,
+            etag=etag,
+            last_modified=last_modified,
+            source_checksum=source_checksum,
+            source_changed_at=source_changed_at
+        )
+
+    def touch_cache(self, file_path: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Renova o cache sem regravar os dados.
+        """
+        self.service.touch_cache(file_path=file_path, etag=etag, last_modified=last_modified)
+
+    def read_dataset_from_cache(self, file_path: str, sep: str = ";") -> pd.DataFrame:
+        """
+        Lê um arquivo do cache em qualquer formato suportado.
+        """
+        return self.service.read_dataset_from_cache(file_path=file_path, sep=sep)
+
+    def migrate_cache(self, url: str, sep: str = ";") -> Optional[str]:
+        """
+        Converte para o formato configurado um cache válido gravado em outro formato.
+        """
+        return self.service.migrate_cache(url=url, sep=sep)
+
+    def get_cache_file_path(self, url: str) -> str:
+        """
+        Retorna o caminho do arquivo no cache, no formato configurado.
+        """
+        return self.service.get_cache_file_path(url=url)
+
     def save_csv_to_cache(self, url: str, df: pd.DataFrame, sep: str = ";") -> str:
         """
         Salva um DataFrame como um arquivo CSV no cache.
         """
         return self.service.save_csv_to_cache(url, df=df, sep=sep)
 
+    def read_csv_from_cache(self, file_path: str, sep: str = ";") -> pd.DataFrame:
+        """
+        Lê um arquivo CSV do cache, conferindo-o com o manifesto.
+        """
+        return self.service.read_csv_from_cache(file_path=file_path, sep=sep)
+
+    def get_cache_manifest(self, file_path: str) -> Optional[CacheManifest]:
+        """
+        Lê o manifesto de um arquivo em cache.
+        """
+        return self.service.get_cache_manifest(file_path=file_path)
+
+    def is_cache_valid(self, file_path: str) -> bool:
+        """
+        Verifica se o arquivo em cache é confiável.
+        """
+        return self.service.is_cache_valid(file_path=file_path)
+
     def get_csv_file_path(self, url: str) -> str:
         """
         Retorna o caminho do arquivo CSV no cache com base na URL.
@@ -32,4 +124,34 @@ class CacheAdapterOut(CachePortOut):
         """
         Verifica se um arquivo em cache tem mais de `max_days` dias.
         """
-        return self.service.is_cache_expired(file_path=file_path, max_days=max_days)
\ No newline at end of file
+        return self.service.is_cache_expired(file_path=file_path, max_days=max_days)
+
+    def get_cache_mtime(self, file_path: str) -> float:
+        """
+        Retorna a data de modificação do arquivo em cache.
+        """
+        return self.service.get_cache_mtime(file_path=file_path)
+
+    def get_cache_lock(self, url: str) -> FileLock:
+        """
+        Retorna o lock de arquivo que coordena a atualização do cache da URL.
+        """
+        return self.service.get_cache_lock(url=url)
+
+    def get_download_link(self, url: str) -> Optional[str]:
+        """
+        Retorna o link de download do CSV resolvido anteriormente para a página.
+        """
+        return self.service.get_download_link(url=url)
+
+    def save_download_link(self, url: str, download_url: str) -> None:
+        """
+        Persiste o link de download do CSV resolvido para a página.
+        """
+        self.service.save_download_link(url=url, download_url=download_url)
+
+    def invalidate_download_link(self, url: str) -> None:
+        """
+        Descarta o link de download persistido para a página.
+        """
+        self.service.invalidate_download_link(url=url)
@@ -1,4 +1,5 @@
-from typing import List, Type, Optional
+from typing import BinaryIO, Iterator, Type, Optional, Union
+import pandas as pd
 from enum import Enum
 from app.application.ports.output.dataprocessing.csv_port_out import CSVPortOut
 from app.domain.services.dataprocessing.csv_service import CSVService
@@ -14,12 +15,12 @@ class CSVAdapterOut(CSVPortOut):
 
     def process_csv(
         self,
-        file_path: str,
+        file_path: Union[str, BinaryIO],
         model: Type[BaseModel],
         category_enum: Optional[Type[Enum]] = None,
         value_name_column: str = "production",
         delimiter: str = ";"
-    ) -> List[BaseModel]:
+    ) -> pd.DataFrame:
         """
         Implementação da porta para processar os dados de um arquivo CSV.
         """
@@ -29,4 +30,50 @@ class CSVAdapterOut(CSVPortOut):
             category_enum=category_enum,
             value_name_column=value_name_column,
             delimiter=delimiter
-        )
\ No newline at end of file
+        )
+
+    def process_csv_in_pool(
+        self,
+        file_path: Union[str, BinaryIO],
+        model: Type[BaseModel],
+        category_enum: Optional[Type[Enum]] = None,
+        value_name_column: str = "production",
+        delimiter: str = ";"
+    ) -> pd.DataFrame:
+        """
+        Implementação da porta para processar os dados de um arquivo CSV em um processo separado.
+        """
+        return self.service.process_csv_data_in_pool(
+            file_path=file_path,
+            model=model,
+            category_enum=category_enum,
+            value_name_column=value_name_column,
+            delimiter=delimiter
+        )
+
+    def shutdown_pool(self) -> None:
+        """
+        Implementação da porta para encerrar o pool de processos do CSV.
+        """
+        self.service.shutdown_process_pool()
+
+    def process_csv_in_chunks(
+        self,
+        file_path: Union[str, BinaryIO],
+        model: Type[BaseModel],
+        category_enum: Optional[Type[Enum]] = None,
+        value_name_column: str = "production",
+        delimiter: str = ";",
+        chunk_rows: int = 500
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Implementação da porta para processar os dados de um arquivo CSV em partes.
+        """
+        return self.service.iter_csv_data_chunks(
+            file_path=file_path,
+            model=model,
+            category_enum=category_enum,
+            value_name_column=value_name_column,
+            delimiter=delimiter,
+            chunk_rows=chunk_rows
+        )
@@ -0,0 +1,38 @@
+from typing import Optional, Type
+from app.application.ports.output.dataprocessing.dataset_cache_port_out import DatasetCachePortOut
+from app.domain.services.dataprocessing.dataset_cache_service import DatasetCacheService
+from pydantic import BaseModel
+import pandas as pd
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
+
+class DatasetCacheAdapterOut(DatasetCachePortOut):
+    """
+    Adapter para interagir com o cache em memória dos datasets.
+    """
+
+    def __init__(self, service: DatasetCacheService):
+        self.service = service
+
+    def get_dataset(self, url: str, model: Type[BaseModel], mtime: float) -> Optional[pd.DataFrame]:
+        """
+        Retorna o dataset em memória, se existir e corresponder à versão do arquivo em cache.
+        """
+        return self.service.get_dataset(url=url, model=model, mtime=mtime)
+
+    def put_dataset(self, url: str, model: Type[BaseModel], mtime: float, df: pd.DataFrame) -> None:
+        """
+        Armazena um dataset processado em memória.
+        """
+        self.service.put_dataset(url=url, model=model, mtime=mtime, df=df)
+
+    def get_dataset_version(self, url: str, model: Type[BaseModel], mtime: float) -> Optional[str]:
+        """
+        Retorna a versão do dataset em memória.
+        """
+        return self.service.get_dataset_version(url=url, model=model, mtime=mtime)
+
+    def get_dataset_index(self, url: str, model: Type[BaseModel], df: pd.DataFrame) -> DatasetIndex:
+        """
+        Retorna os índices do dataset.
+        """
+        return self.service.get_dataset_index(url=url, model=model, df=df)
@@ -1,9 +1,12 @@
 from app.application.ports.output.embrapa.embrapa_port_out import EmbrapaPortOut
 from app.domain.services.embrapa.embrapa_service import EmbrapaService
-from typing import Type, Optional
+from typing import Dict, Iterable, Type, Optional
+from datetime import datetime
 from pydantic import BaseModel
 import pandas as pd
 from enum import Enum
+from app.domain.models.entities.embrapa.embrapa_dataset import EmbrapaDataset
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
 
 class EmbrapaAdapterOut(EmbrapaPortOut):
     """
@@ -22,4 +25,40 @@ class EmbrapaAdapterOut(EmbrapaPortOut):
         :param delimiter: Delimitador do CSV (padrão: ";").
         :return: DataFrame com os dados do CSV.
         """
-        return self.service.get_csv_data(url=url, model=model, category_enum=category_enum, value_name_column=value_name_column, delimiter=delimiter)
\ No newline at end of file
+        return self.service.get_csv_data(url=url, model=model, category_enum=category_enum, value_name_column=value_name_column, delimiter=delimiter)
+
+    def refresh_csv_data(self, url: str, model: Type[BaseModel], category_enum: Optional[Type[Enum]] = None, value_name_column: str = "production", delimiter: str = ";") -> pd.DataFrame:
+        """
+        Implementação da porta para atualizar o CSV da Embrapa no cache.
+        """
+        return self.service.refresh_csv_data(url=url, model=model, category_enum=category_enum, value_name_column=value_name_column, delimiter=delimiter)
+
+    def refresh_datasets(self, datasets: Iterable[EmbrapaDataset]) -> Dict[str, pd.DataFrame]:
+        """
+        Implementação da porta para atualizar vários datasets em paralelo.
+        """
+        return self.service.refresh_datasets(datasets=datasets)
+
+    def get_dataset_version(self, url: str, model: Type[BaseModel]) -> Optional[str]:
+        """
+        Implementação da porta para obter a versão do dataset em memória.
+        """
+        return self.service.get_dataset_version(url=url, model=model)
+
+    def get_dataset_index(self, url: str, model: Type[BaseModel], df: pd.DataFrame) -> DatasetIndex:
+        """
+        Implementação da porta para obter os índices do dataset.
+        """
+        return self.service.get_dataset_index(url=url, model=model, df=df)
+
+    def get_last_changed_upstream(self, url: str) -> Optional[datetime]:
+        """
+        Implementação da porta para obter a data da última mudança do CSV na Embrapa.
+        """
+        return self.service.get_last_changed_upstream(url=url)
+
+    def get_cache_age(self, url: str, delimiter: str = ";") -> Optional[float]:
+        """
+        Implementação da porta para obter a idade do dataset em cache.
+        """
+        return self.service.get_cache_age(url=url, delimiter=delimiter)
@@ -0,0 +1,47 @@
+from typing import Dict, Optional
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from app.application.ports.output.http.http_port_out import HttpPortOut
+from app.shared.config import settings
+
+class HttpAdapterOut(HttpPortOut):
+    """
+    Adapter HTTP baseado em uma `requests.Session` compartilhada pelo processo.
+
+    A sessão mantém um pool de conexões keep-alive por host, evitando um novo
+    handshake TCP a cada chamada à Embrapa.
+    """
+
+    # Sessão compartilhada pelo processo, criada no primeiro uso
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Implementação da porta para fazer uma requisição GET pela sessão compartilhada.
+        """
+        return self._get_session().get(
+            url,
+            headers=headers,
+            timeout=(settings.HTTP_CONNECT_TIMEOUT_SECONDS, settings.HTTP_READ_TIMEOUT_SECONDS)
+        )
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Retorna a sessão compartilhada, criando-a no primeiro uso.
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                # As novas tentativas ficam a cargo do circuit breaker de quem chama
+                adapter = HTTPAdapter(
+                    pool_connections=settings.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+                    max_retries=0
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._session = session
+            return cls._session
@@ -0,0 +1,28 @@
+from app.application.ports.output.iam.auth.password_hash_port_out import PasswordHashPortOut
+from app.domain.services.iam.auth.password_hash_service import PasswordHashService
+
+class PasswordHashAdapterOut(PasswordHashPortOut):
+    """
+    Adapter para o hash de senhas.
+    """
+
+    def __init__(self, service: PasswordHashService):
+        self.service = service
+
+    def hash_password(self, password: str) -> str:
+        """
+        Gera o hash da senha.
+        """
+        return self.service.hash_password(password)
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        """
+        Confere a senha com o hash armazenado.
+        """
+        return self.service.verify_password(password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Indica se o hash foi gerado com parâmetros diferentes dos atuais.
+        """
+        return self.service.needs_rehash(password_hash)
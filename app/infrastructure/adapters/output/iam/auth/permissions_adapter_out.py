@@ -22,7 +22,7 @@ class PermissionsAdapterOut(PermissionsPortOut):
         :raises InvalidPasswordError: If the password is invalid.
         """
         try:
-            self.service.validate_user(user_data)
+            return self.service.validate_user(user_data)
         except UserNotFoundError as e:
             raise UserNotFoundError(f"User not found: {str(e)}") from e
         except InvalidPasswordError as e:
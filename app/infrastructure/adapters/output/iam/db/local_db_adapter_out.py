@@ -21,4 +21,12 @@ class LocalDbAdapterOut(LocalDBPortOut):
         :param user: UserEntity containing user data to be retrieved.
         :return: UserEntity instance containing user data.
         """
-        return self.service.get_user_by_login(user)
\ No newline at end of file
+        return self.service.get_user_by_login(user)
+
+    def update_password(self, login: str, password_hash: str):
+        """
+        Replace the stored password hash of a user.
+        :param login: The login of the user.
+        :param password_hash: The new password hash.
+        """
+        return self.service.update_password(login, password_hash)
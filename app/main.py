@@ -1,6 +1,10 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.shared.config import settings
 from app.shared.middleware import setup_middleware
+from app.shared.exceptions import executor_overloaded_handler
+from app.shared.util.bounded_executor import ExecutorOverloadedError
+from app.shared.dependencies import container
 from app.presentation.production import router as production_router
 from app.presentation.processing import router as processing_router
 from app.presentation.marketing import router as marketing_router
@@ -8,16 +12,36 @@ from app.presentation.importation import router as importation_router
 from app.presentation.exportation import router as exportation_router
 from app.presentation.sign_up import router as sign_up_router
 from app.presentation.log_in import router as log_in_router
+from app.presentation.metrics import router as metrics_router
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Inicia e encerra as tarefas em segundo plano da aplicação.
+    """
+    event_loop_monitor = container.event_loop_monitor
+    await event_loop_monitor.start()
+    refresh_scheduler = container.refresh_scheduler_service
+    if settings.REFRESH_SCHEDULER_ENABLED:
+        await refresh_scheduler.start()
+    yield
+    await refresh_scheduler.stop()
+    await event_loop_monitor.stop()
+    container.csv_adapter_out.shutdown_pool()
 
 # Inicialização do FastAPI
 app = FastAPI(
     title=settings.APP_TITLE,
     version=settings.APP_VERSION,
     description=settings.APP_DESCRIPTION,
+    lifespan=lifespan,
 )
 
 # Configuração de middlewares
-setup_middleware(app)
+setup_middleware(app, container)
+
+# Pools de threads sobrecarregados respondem 503 com Retry-After em qualquer rota
+app.add_exception_handler(ExecutorOverloadedError, executor_overloaded_handler)
 
 # Inclusão dos routers
 app.include_router(log_in_router)
@@ -26,4 +50,5 @@ app.include_router(production_router)
 app.include_router(processing_router)
 app.include_router(marketing_router)
 app.include_router(importation_router)
-app.include_router(exportation_router)
\ No newline at end of file
+app.include_router(exportation_router)
+app.include_router(metrics_router)
\ No newline at end of file
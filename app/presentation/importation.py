@@ -1,7 +1,16 @@
 from fastapi import APIRouter, Query, Depends, Request
-from typing import List
+from fastapi.responses import StreamingResponse
+from functools import partial
+from typing import List, Literal, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
+from app.shared.util.export_response import export_response
+from app.shared.util.response_cache import ResponseCache
 from app.domain.models.entities.embrapa.importation import ImportationEntity
-from app.shared.dependencies import get_importation_adapter_in
+from app.domain.models.entities.embrapa.embrapa_dataset import IMPORTATION_DATASET
+from app.shared.dependencies import get_importation_adapter_in, get_embrapa_executor, get_response_cache
+from app.shared.util.bounded_executor import BoundedExecutor
 from app.application.ports.input.embrapa.importation_port_in import ImportationPortIn
 from app.shared.util.util_token import validate_token_and_get_payload
 from fastapi.security import HTTPBearer
@@ -15,8 +24,11 @@ router = APIRouter(
 @router.get(
     "/",
     summary="Obter dados de importação",
-    response_model=List[ImportationEntity],
+    response_model=PageDTO[ImportationEntity],
     responses={
+        304: {
+            "description": "Não modificado: a resposta corresponde ao ETag enviado em `If-None-Match`.",
+        },
         503: {
             "description": "Erro no serviço da Embrapa.",
             "content": {
@@ -35,12 +47,123 @@ async def get_importation_data(
     request: Request,
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(10, ge=1, le=100, description="Tamanho da página"),
+    cursor: Optional[str] = Query(None, description="Cursor `next_cursor` da página anterior (substitui `page`)"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusivo)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusivo)"),
+    country: Optional[str] = Query(None, description="Filtra pelo país (sem diferenciar maiúsculas de minúsculas)"),
     port_in: ImportationPortIn = Depends(get_importation_adapter_in),
+    executor: BoundedExecutor = Depends(get_embrapa_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
     user_payload: dict = validate_token_and_get_payload(endpoint_permission="info_importation")
 ):
     """
     Endpoint para retornar informações de importação.
     """
-    url = 'http://vitibrasil.cnpuv.embrapa.br/index.php?opcao=opt_05'
-    data = port_in.get_importation_data(url=url, page=page, page_size=page_size)
-    return data
\ No newline at end of file
+    url = IMPORTATION_DATASET.url
+    filters = FilterDTO(year_from=year_from, year_to=year_to, country=country)
+    # O acesso aos dados (HTTP, pandas e disco) é síncrono e roda fora do event loop
+    return await response_cache.serve(
+        request,
+        get_version=partial(executor.run, port_in.get_importation_version, url=url),
+        get_data=partial(executor.run, port_in.get_importation_data, url=url, page=page, page_size=page_size, filters=filters, cursor=cursor)
+    )
+
+@router.get(
+    "/aggregate",
+    summary="Agregar dados de importação",
+    response_model=AggregationDTO,
+    responses={
+        304: {
+            "description": "Não modificado: a resposta corresponde ao ETag enviado em `If-None-Match`.",
+        },
+        200: {
+            "description": "Dados de importação agregados com sucesso.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "group_by": ["year"],
+                        "agg": "sum",
+                        "value_column": "importation",
+                        "items": [
+                            {"year": 2022, "value": 1500, "yoy": 200, "yoy_pct": 15.38},
+                            {"year": 2023, "value": 1300, "yoy": -200, "yoy_pct": -13.33}
+                        ],
+                        "total": 2,
+                        "last_changed_upstream": "2025-03-10T12:00:00Z"
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "Dimensão de agrupamento inválida.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Dimensões inválidas para agrupamento: ['id']."
+                    }
+                }
+            },
+        },
+    },
+)
+async def get_importation_aggregation(
+    request: Request,
+    group_by: List[str] = Query(["year"], description="Dimensões do agrupamento (year, country)"),
+    agg: Literal["sum", "mean", "min", "max"] = Query("sum", description="Função de agregação"),
+    top: Optional[int] = Query(None, ge=1, description="Retorna apenas os N grupos de maior valor"),
+    yoy: bool = Query(False, description="Inclui a variação em relação ao ano anterior (exige agrupar por year)"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusivo)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusivo)"),
+    country: Optional[str] = Query(None, description="Filtra pelo país (sem diferenciar maiúsculas de minúsculas)"),
+    port_in: ImportationPortIn = Depends(get_importation_adapter_in),
+    executor: BoundedExecutor = Depends(get_embrapa_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    user_payload: dict = validate_token_and_get_payload(endpoint_permission="info_importation")
+):
+    """
+    Endpoint para retornar informações de importação agregadas.
+    """
+    url = IMPORTATION_DATASET.url
+    query = AggregationQueryDTO(group_by=group_by, agg=agg, top=top, yoy=yoy)
+    filters = FilterDTO(year_from=year_from, year_to=year_to, country=country)
+    # A agregação (pandas) é síncrona e roda fora do event loop
+    return await response_cache.serve(
+        request,
+        get_version=partial(executor.run, port_in.get_importation_version, url=url),
+        get_data=partial(executor.run, port_in.get_importation_aggregation, url=url, query=query, filters=filters)
+    )
+
+@router.get(
+    "/export",
+    summary="Exportar todos os dados de importação",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Arquivo com os dados de importação, gerado em streaming.",
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+                "application/vnd.apache.parquet": {}
+            },
+        },
+    },
+)
+async def get_importation_export(
+    request: Request,
+    export_format: Literal["ndjson", "csv", "parquet"] = Query("ndjson", alias="format", description="Formato do arquivo"),
+    gzip: bool = Query(False, description="Comprime a resposta com gzip"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusivo)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusivo)"),
+    country: Optional[str] = Query(None, description="Filtra pelo país (sem diferenciar maiúsculas de minúsculas)"),
+    port_in: ImportationPortIn = Depends(get_importation_adapter_in),
+    executor: BoundedExecutor = Depends(get_embrapa_executor),
+    user_payload: dict = validate_token_and_get_payload(endpoint_permission="info_importation")
+):
+    """
+    Endpoint para exportar todos os dados de importação de uma vez, sem paginação.
+    """
+    url = IMPORTATION_DATASET.url
+    filters = FilterDTO(year_from=year_from, year_to=year_to, country=country)
+    # Carrega o dataset fora do event loop; a serialização acontece durante o envio
+    chunks = await executor.run(port_in.get_importation_export, url=url, export_format=export_format, filters=filters)
+    return export_response(chunks, export_format=export_format, filename=IMPORTATION_DATASET.name, compress=gzip)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from app.application.ports.input.iam.log_in_port_in import LogInPortIn
-from app.shared.dependencies import get_log_in_adapter_in
+from app.shared.dependencies import get_log_in_adapter_in, get_password_executor
+from app.shared.util.bounded_executor import BoundedExecutor
 from app.shared.dto.iam.user_request_log_in_dto import UserRequestLoginDTO
 from app.shared.exceptions import HttpExpiredTokenException, HttpInvalidTokenException, HttpPermissionDeniedException, HttpInvalidPasswordError, HttpUserNotFoundError
 from app.domain.exceptions.iam.db.db_exceptions import UserNotFoundError, InvalidPasswordError
@@ -34,14 +35,20 @@ router = APIRouter(
             "description": "Permissão negada.",
             "content": {"application/json": {"example": {"detail": "Permissão negada."}}},
         },
+        503: {
+            "description": "Muitas requisições aguardando o hash de senhas; tente de novo após o `Retry-After`.",
+            "content": {"application/json": {"example": {"detail": "Servidor sobrecarregado. Tente novamente mais tarde."}}},
+        },
     },
 )
 async def info_production(
     port_in: LogInPortIn = Depends(get_log_in_adapter_in),
+    executor: BoundedExecutor = Depends(get_password_executor),
     user: UserRequestLoginDTO = None
 ):
     try:
-        return port_in.log_in(user)
+        # A verificação do hash da senha (bcrypt) é cara e roda fora do event loop
+        return await executor.run(port_in.log_in, user)
     except UserNotFoundError as e:
         raise HttpUserNotFoundError() from e
     except InvalidPasswordError as e:
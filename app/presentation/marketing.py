@@ -1,11 +1,20 @@
 from fastapi import APIRouter, Query, Depends, Request
-from typing import List
+from fastapi.responses import StreamingResponse
+from functools import partial
+from typing import List, Literal, Optional
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.aggregation_dto import AggregationDTO, AggregationQueryDTO
+from app.shared.util.export_response import export_response
+from app.shared.util.response_cache import ResponseCache
 from app.domain.models.entities.embrapa.marketing import MarketingEntity
+from app.domain.models.entities.embrapa.embrapa_dataset import MARKETING_DATASET
 from fastapi.security import HTTPBearer
 from app.application.ports.input.embrapa.marketing_port_in import MarketingPortIn
 from app.shared.util.util_token import validate_token_and_get_payload
 
-from app.shared.dependencies import get_marketing_adapter_in
+from app.shared.dependencies import get_marketing_adapter_in, get_embrapa_executor, get_response_cache
+from app.shared.util.bounded_executor import BoundedExecutor
 
 router = APIRouter(
     prefix="/info/marketing",
@@ -16,8 +25,11 @@ router = APIRouter(
 @router.get(
     "/",
     summary="Obter dados de marketing",
-    response_model=List[MarketingEntity],
+    response_model=PageDTO[MarketingEntity],
     responses={
+        304: {
+            "description": "Não modificado: a resposta corresponde ao ETag enviado em `If-None-Match`.",
+        },
         503: {
             "description": "Erro no serviço da Embrapa.",
             "content": {
@@ -36,12 +48,129 @@ async def get_marketing_data(
     request: Request,
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(10, ge=1, le=100, description="Tamanho da página"),
+    cursor: Optional[str] = Query(None, description="Cursor `next_cursor` da página anterior (substitui `page`)"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusivo)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusivo)"),
+    product: Optional[str] = Query(None, description="Filtra pelo produto (sem diferenciar maiúsculas de minúsculas)"),
+    category: Optional[str] = Query(None, description="Filtra pela categoria (ex.: Vinho de Mesa)"),
+    control: Optional[str] = Query(None, description="Filtra pelo prefixo do controle (ex.: VM_)"),
     port_in: MarketingPortIn = Depends(get_marketing_adapter_in),
+    executor: BoundedExecutor = Depends(get_embrapa_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
     user_payload: dict = validate_token_and_get_payload(endpoint_permission="info_marketing")
 ):
     """
     Endpoint para retornar informações de marketing.
     """
-    url = 'http://vitibrasil.cnpuv.embrapa.br/index.php?opcao=opt_04'
-    data = port_in.get_marketing_data(url=url, page=page, page_size=page_size)
-    return data
\ No newline at end of file
+    url = MARKETING_DATASET.url
+    filters = FilterDTO(year_from=year_from, year_to=year_to, product=product, category=category, control=control)
+    # O acesso aos dados (HTTP, pandas e disco) é síncrono e roda fora do event loop
+    return await response_cache.serve(
+        request,
+        get_version=partial(executor.run, port_in.get_marketing_version, url=url),
+        get_data=partial(executor.run, port_in.get_marketing_data, url=url, page=page, page_size=page_size, filters=filters, cursor=cursor)
+    )
+
+@router.get(
+    "/aggregate",
+    summary="Agregar dados de comercialização",
+    response_model=AggregationDTO,
+    responses={
+        304: {
+            "description": "Não modificado: a resposta corresponde ao ETag enviado em `If-None-Match`.",
+        },
+        200: {
+            "description": "Dados de comercialização agregados com sucesso.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "group_by": ["year"],
+                        "agg": "sum",
+                        "value_column": "marketing",
+                        "items": [
+                            {"year": 2022, "value": 1500, "yoy": 200, "yoy_pct": 15.38},
+                            {"year": 2023, "value": 1300, "yoy": -200, "yoy_pct": -13.33}
+                        ],
+                        "total": 2,
+                        "last_changed_upstream": "2025-03-10T12:00:00Z"
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "Dimensão de agrupamento inválida.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Dimensões inválidas para agrupamento: ['id']."
+                    }
+                }
+            },
+        },
+    },
+)
+async def get_marketing_aggregation(
+    request: Request,
+    group_by: List[str] = Query(["year"], description="Dimensões do agrupamento (year, control, product, category)"),
+    agg: Literal["sum", "mean", "min", "max"] = Query("sum", description="Função de agregação"),
+    top: Optional[int] = Query(None, ge=1, description="Retorna apenas os N grupos de maior valor"),
+    yoy: bool = Query(False, description="Inclui a variação em relação ao ano anterior (exige agrupar por year)"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusivo)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusivo)"),
+    product: Optional[str] = Query(None, description="Filtra pelo produto (sem diferenciar maiúsculas de minúsculas)"),
+    category: Optional[str] = Query(None, description="Filtra pela categoria (ex.: Vinho de Mesa)"),
+    control: Optional[str] = Query(None, description="Filtra pelo prefixo do controle (ex.: VM_)"),
+    port_in: MarketingPortIn = Depends(get_marketing_adapter_in),
+    executor: BoundedExecutor = Depends(get_embrapa_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    user_payload: dict = validate_token_and_get_payload(endpoint_permission="info_marketing")
+):
+    """
+    Endpoint para retornar informações de comercialização agregadas.
+    """
+    url = MARKETING_DATASET.url
+    query = AggregationQueryDTO(group_by=group_by, agg=agg, top=top, yoy=yoy)
+    filters = FilterDTO(year_from=year_from, year_to=year_to, product=product, category=category, control=control)
+    # A agregação (pandas) é síncrona e roda fora do event loop
+    return await response_cache.serve(
+        request,
+        get_version=partial(executor.run, port_in.get_marketing_version, url=url),
+        get_data=partial(executor.run, port_in.get_marketing_aggregation, url=url, query=query, filters=filters)
+    )
+
+@router.get(
+    "/export",
+    summary="Exportar todos os dados de comercialização",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Arquivo com os dados de comercialização, gerado em streaming.",
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+                "application/vnd.apache.parquet": {}
+            },
+        },
+    },
+)
+async def get_marketing_export(
+    request: Request,
+    export_format: Literal["ndjson", "csv", "parquet"] = Query("ndjson", alias="format", description="Formato do arquivo"),
+    gzip: bool = Query(False, description="Comprime a resposta com gzip"),
+    year_from: Optional[int] = Query(None, description="Ano inicial (inclusivo)"),
+    year_to: Optional[int] = Query(None, description="Ano final (inclusivo)"),
+    product: Optional[str] = Query(None, description="Filtra pelo produto (sem diferenciar maiúsculas de minúsculas)"),
+    category: Optional[str] = Query(None, description="Filtra pela categoria (ex.: Vinho de Mesa)"),
+    control: Optional[str] = Query(None, description="Filtra pelo prefixo do controle (ex.: VM_)"),
+    port_in: MarketingPortIn = Depends(get_marketing_adapter_in),
+    executor: BoundedExecutor = Depends(get_embrapa_executor),
+    user_payload: dict = validate_token_and_get_payload(endpoint_permission="info_marketing")
+):
+    """
+    Endpoint para exportar todos os dados de comercialização de uma vez, sem paginação.
+    """
+    url = MARKETING_DATASET.url
+    filters = FilterDTO(year_from=year_from, year_to=year_to, product=product, category=category, control=control)
+    # Carrega o dataset fora do event loop; a serialização acontece durante o envio
+    chunks = await executor.run(port_in.get_marketing_export, url=url, export_format=export_format, filters=filters)
+    return export_response(chunks, export_format=export_format, filename=MARKETING_DATASET.name, compress=gzip)
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from app.shared.dependencies import get_embrapa_executor, get_password_executor, get_event_loop_monitor, get_response_cache, get_token_cache
+from app.shared.dto.metrics.metrics_dto import MetricsDTO
+from app.shared.util.bounded_executor import BoundedExecutor
+from app.shared.util.event_loop_monitor import EventLoopMonitor
+from app.shared.util.response_cache import ResponseCache
+from app.shared.util.token_cache import TokenCache
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Monitoramento"],
+)
+
+@router.get(
+    "/",
+    summary="Obter métricas do processo",
+    description="Retorna o lag do event loop, a ocupação dos pools de threads (dados da Embrapa e hash de senhas) e o uso dos caches de respostas e de tokens.",
+    response_model=MetricsDTO,
+)
+async def get_metrics(
+    monitor: EventLoopMonitor = Depends(get_event_loop_monitor),
+    executor: BoundedExecutor = Depends(get_embrapa_executor),
+    password_executor: BoundedExecutor = Depends(get_password_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    token_cache: TokenCache = Depends(get_token_cache),
+):
+    return MetricsDTO(event_loop=monitor.stats(), embrapa_pool=executor.stats(), password_pool=password_executor.stats(), response_cache=response_cache.stats(), token_cache=token_cache.stats())
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from app.application.ports.input.iam.sign_up_port_in import SignUpPortIn
-from app.shared.dependencies import get_sign_up_adapter_in
+from app.shared.dependencies import get_sign_up_adapter_in, get_password_executor
+from app.shared.util.bounded_executor import BoundedExecutor
 from app.shared.dto.iam.user_request_dto import UserRequestDTO
 from app.shared.exceptions import HttpUserAlreadyExistsError, HttpPydanticRequestValidationError
 from app.domain.exceptions.iam.db.db_exceptions import UserAlreadyExistsError
@@ -25,14 +26,20 @@ router = APIRouter(
             "description": "Usuário já cadastrado.",
             "content": {"application/json": {"example": {"detail": "Usuário já existe."}}},
         },
+        503: {
+            "description": "Muitas requisições aguardando o hash de senhas; tente de novo após o `Retry-After`.",
+            "content": {"application/json": {"example": {"detail": "Servidor sobrecarregado. Tente novamente mais tarde."}}},
+        },
     },
 )
 async def info_production(
     port_in: SignUpPortIn = Depends(get_sign_up_adapter_in),
+    executor: BoundedExecutor = Depends(get_password_executor),
     user: UserRequestDTO = None
 ):
     try:
-        port_in.new_user(user)
+        # O hash da senha (bcrypt) é caro e roda fora do event loop
+        await executor.run(port_in.new_user, user)
     except UserAlreadyExistsError as e:
         raise HttpUserAlreadyExistsError() from e
     except PydanticRequestValidationError as e:
@@ -18,9 +18,96 @@ class Settings:
     SECRET_KEY = os.getenv("SECRET_KEY", "default_secret_key")
     ALGORITHM = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+    # Cache das claims dos tokens já verificados (por processo), nunca além do exp do token
+    AUTH_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", 10000))
+    AUTH_TOKEN_CACHE_TTL_SECONDS = int(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", 300))
+    # Autoriza pelas permissões gravadas no token, sem consultar o cadastro de usuários: uma
+    # mudança de permissões só vale para os tokens já emitidos quando eles expiram (a
+    # invalidação de `invalidate_user_tokens` é por processo, não alcança os outros workers)
+    AUTH_TRUST_TOKEN_CLAIMS = os.getenv("AUTH_TRUST_TOKEN_CLAIMS", "false").lower() == "true"
+    # Custo do bcrypt no hash das senhas; hashes com outro custo são refeitos no login
+    PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", 12))
+    # Pool de threads do hash de senhas (cadastro e login), separado do pool da Embrapa
+    PASSWORD_HASH_POOL_SIZE = int(os.getenv("PASSWORD_HASH_POOL_SIZE", os.cpu_count() or 1))
+    PASSWORD_HASH_POOL_MAX_PENDING = int(os.getenv("PASSWORD_HASH_POOL_MAX_PENDING", 16))
+    # Espera máxima por uma thread livre; depois disso (ou com a fila cheia) a requisição recebe 503
+    PASSWORD_HASH_POOL_MAX_WAIT_SECONDS = float(os.getenv("PASSWORD_HASH_POOL_MAX_WAIT_SECONDS", 2))
     CACHE_FOLDER = os.getenv("CACHE_FOLDER", "resources/cache")
     CACHE_MAX_DAYS = int(os.getenv("CACHE_MAX_DAYS", 30))
+    # Formato dos arquivos em cache: csv, feather ou parquet (os binários exigem pyarrow)
+    CACHE_FORMAT = os.getenv("CACHE_FORMAT", "feather").lower()
+
+    # Rate limiting (token bucket): RATE_LIMIT requisições por janela, por usuário (sub do JWT) ou IP
     RATE_LIMIT = int(os.getenv("RATE_LIMIT", 10))
+    RATE_LIMIT_WINDOW_SECONDS = float(os.getenv("RATE_LIMIT_WINDOW_SECONDS", 60))
+    # Limites por prefixo de rota, no formato "/prefixo=limite,..." (ex.: "/user/log-in=5,/info/exportation/export=2")
+    RATE_LIMIT_ROUTES = {
+        prefix.strip(): int(limit)
+        for prefix, limit in (item.split("=", 1) for item in os.getenv("RATE_LIMIT_ROUTES", "").split(",") if item.strip())
+    }
+    # memory (por processo) ou shared (arquivo mapeado em memória, compartilhado pelos workers;
+    # o lock entre processos é tomado no event loop). Com shared, use um caminho absoluto:
+    # um caminho relativo é resolvido a partir do diretório de trabalho de cada worker
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+    RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", 65536))
+    RATE_LIMIT_SHARED_PATH = os.getenv("RATE_LIMIT_SHARED_PATH", "resources/rate_limit.bin")
+
+    # Configuração do cache em memória dos datasets processados
+    DATASET_CACHE_MAX_ENTRIES = int(os.getenv("DATASET_CACHE_MAX_ENTRIES", 16))
+    DATASET_CACHE_MAX_BYTES = int(os.getenv("DATASET_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+    # Agregações memorizadas por versão de cada dataset
+    AGGREGATION_MEMO_MAX_ENTRIES = int(os.getenv("AGGREGATION_MEMO_MAX_ENTRIES", 128))
+
+    # Linhas serializadas por vez na exportação completa dos datasets
+    EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", 5000))
+
+    # Cache das respostas JSON já codificadas (por processo) e cabeçalho Cache-Control
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+    RESPONSE_CACHE_MAX_AGE_SECONDS = int(os.getenv("RESPONSE_CACHE_MAX_AGE_SECONDS", 60))
+
+    # Configuração da fonte de dados da Embrapa
+    EMBRAPA_BASE_URL = os.getenv("EMBRAPA_BASE_URL", "http://vitibrasil.cnpuv.embrapa.br").rstrip("/")
+
+    # Validade do link de download do CSV encontrado na página da Embrapa
+    DOWNLOAD_LINK_TTL_SECONDS = int(os.getenv("DOWNLOAD_LINK_TTL_SECONDS", 7 * 24 * 60 * 60))
+
+    # Configuração da sessão HTTP usada para acessar a Embrapa
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", 4))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 10))
+    HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", 5))
+    HTTP_READ_TIMEOUT_SECONDS = float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", 30))
+
+    # Configuração da atualização em segundo plano dos datasets
+    REFRESH_SCHEDULER_ENABLED = os.getenv("REFRESH_SCHEDULER_ENABLED", "true").lower() == "true"
+    REFRESH_CHECK_INTERVAL_SECONDS = int(os.getenv("REFRESH_CHECK_INTERVAL_SECONDS", 60))
+    REFRESH_JITTER_SECONDS = int(os.getenv("REFRESH_JITTER_SECONDS", 300))
+    REFRESH_INTERVAL_SECONDS = int(os.getenv("REFRESH_INTERVAL_SECONDS", 24 * 60 * 60))
+    REFRESH_INTERVALS = {
+        "production": int(os.getenv("REFRESH_INTERVAL_PRODUCTION", REFRESH_INTERVAL_SECONDS)),
+        "processing": int(os.getenv("REFRESH_INTERVAL_PROCESSING", REFRESH_INTERVAL_SECONDS)),
+        "marketing": int(os.getenv("REFRESH_INTERVAL_MARKETING", REFRESH_INTERVAL_SECONDS)),
+        "importation": int(os.getenv("REFRESH_INTERVAL_IMPORTATION", REFRESH_INTERVAL_SECONDS)),
+        "exportation": int(os.getenv("REFRESH_INTERVAL_EXPORTATION", REFRESH_INTERVAL_SECONDS)),
+    }
+
+    # Configuração do pool de threads que tira do event loop o acesso aos dados da Embrapa
+    EMBRAPA_POOL_SIZE = int(os.getenv("EMBRAPA_POOL_SIZE", 4))
+    EMBRAPA_POOL_MAX_PENDING = int(os.getenv("EMBRAPA_POOL_MAX_PENDING", 64))
+    # 0: sem limite de espera (a primeira busca de um dataset pode demorar); a fila continua limitada
+    EMBRAPA_POOL_MAX_WAIT_SECONDS = float(os.getenv("EMBRAPA_POOL_MAX_WAIT_SECONDS", 0))
+
+    # Processos usados para processar os CSVs (0 processa na própria thread). Cada processo
+    # é um interpretador com pandas (~120 MB) que fica residente em cada worker da API
+    CSV_PROCESS_POOL_SIZE = int(os.getenv("CSV_PROCESS_POOL_SIZE", 0))
+
+    # Linhas do CSV processadas por vez na ingestão em partes (0 processa o arquivo inteiro de uma vez)
+    CSV_STREAMING_CHUNK_ROWS = int(os.getenv("CSV_STREAMING_CHUNK_ROWS", 0))
+
+    # Configuração da medição do lag do event loop
+    EVENT_LOOP_MONITOR_INTERVAL_SECONDS = float(os.getenv("EVENT_LOOP_MONITOR_INTERVAL_SECONDS", 0.5))
+    EVENT_LOOP_LAG_WARNING_SECONDS = float(os.getenv("EVENT_LOOP_LAG_WARNING_SECONDS", 0.2))
 
     # Configuração do Circuit Breaker
     BREAKER_FAIL_MAX = int(os.getenv("BREAKER_FAIL_MAX", 3))
@@ -0,0 +1,141 @@
+from app.domain.services.embrapa.production_service import ProductionService
+from app.infrastructure.adapters.input.embrapa.production_adapter_in import ProductionAdapterIn
+from app.infrastructure.adapters.output.embrapa.embrapa_adapter_out import EmbrapaAdapterOut
+from app.infrastructure.adapters.input.iam.auth.jwt_auth_adapter_in import JWTAuthAdapterIn
+from app.infrastructure.adapters.output.dataprocessing.cache_adapter_out import CacheAdapterOut
+from app.domain.services.embrapa.embrapa_service import EmbrapaService
+from app.domain.services.iam.auth.permissions_service import PermissionsService
+from app.infrastructure.adapters.output.dataprocessing.csv_adapter_out import CSVAdapterOut
+from app.domain.services.dataprocessing.csv_service import CSVService
+from app.domain.services.dataprocessing.cache_service import CacheService
+from app.domain.services.dataprocessing.dataset_cache_service import DatasetCacheService
+from app.infrastructure.adapters.output.dataprocessing.dataset_cache_adapter_out import DatasetCacheAdapterOut
+from app.infrastructure.adapters.output.http.http_adapter_out import HttpAdapterOut
+from app.domain.services.embrapa.processing_service import ProcessingService
+from app.infrastructure.adapters.input.embrapa.processing_adapter_in import ProcessingAdapterIn
+from app.domain.services.embrapa.marketing_service import MarketingService
+from app.infrastructure.adapters.input.embrapa.marketing_adapter_in import MarketingAdapterIn
+from app.domain.services.embrapa.importation_service import ImportationService
+from app.infrastructure.adapters.input.embrapa.importation_adapter_in import ImportationAdapterIn
+from app.domain.services.embrapa.exportation_service import ExportationService
+from app.infrastructure.adapters.input.embrapa.exportation_adapter_in import ExportationAdapterIn
+from app.infrastructure.adapters.input.iam.sign_up_adater_in import SignUpAdapterIn
+from app.domain.services.iam.sign_up_service import SignUpService
+from app.domain.services.iam.db.local_db_service import LocalDbService
+from app.infrastructure.adapters.output.iam.sign_up_adapter_out import SignUpAdapterOut
+from app.infrastructure.adapters.output.iam.db.local_db_adapter_out import LocalDbAdapterOut
+from app.domain.services.iam.auth.jwt_auth_service import JWTAuthService
+from app.domain.services.iam.auth.password_hash_service import PasswordHashService
+from app.infrastructure.adapters.output.iam.auth.password_hash_adapter_out import PasswordHashAdapterOut
+from app.domain.services.iam.log_in_service import LogInService
+from app.infrastructure.adapters.input.iam.log_in_adapter_in import LogInAdapterIn
+from app.domain.services.embrapa.refresh_scheduler_service import RefreshSchedulerService
+from app.domain.models.entities.embrapa.embrapa_dataset import EMBRAPA_DATASETS
+from app.shared.util.bounded_executor import BoundedExecutor
+from app.shared.util.event_loop_monitor import EventLoopMonitor
+from app.shared.util.response_cache import ResponseCache
+from app.shared.util.token_cache import TokenCache
+from app.shared.util.rate_limiter import RateLimiter, RateLimitBackend, MemoryRateLimitBackend, SharedMemoryRateLimitBackend
+from app.shared.config import settings
+
+class Container:
+    """
+    Grafo de dependências da aplicação, montado uma única vez por processo.
+
+    Os serviços e adapters não guardam estado por requisição (o estado
+    compartilhado, como caches e sessões HTTP, fica em atributos de classe ou
+    nos recursos abaixo), então uma instância de cada atende todas as requisições.
+    """
+
+    def __init__(self):
+        # Recursos compartilhados por todas as requisições do processo
+        self.embrapa_executor = BoundedExecutor(
+            max_workers=settings.EMBRAPA_POOL_SIZE,
+            max_pending=settings.EMBRAPA_POOL_MAX_PENDING,
+            max_wait=settings.EMBRAPA_POOL_MAX_WAIT_SECONDS,
+            thread_name_prefix="embrapa"
+        )
+        # O bcrypt libera o GIL: os hashes rodam em paralelo sem ocupar o pool da Embrapa nem o event loop
+        self.password_executor = BoundedExecutor(
+            max_workers=settings.PASSWORD_HASH_POOL_SIZE,
+            max_pending=settings.PASSWORD_HASH_POOL_MAX_PENDING,
+            max_wait=settings.PASSWORD_HASH_POOL_MAX_WAIT_SECONDS,
+            thread_name_prefix="password"
+        )
+        self.event_loop_monitor = EventLoopMonitor(
+            interval=settings.EVENT_LOOP_MONITOR_INTERVAL_SECONDS,
+            warning_threshold=settings.EVENT_LOOP_LAG_WARNING_SECONDS
+        )
+        self.response_cache = ResponseCache(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+            max_age=settings.RESPONSE_CACHE_MAX_AGE_SECONDS
+        )
+        self.token_cache = TokenCache(
+            secret_key=settings.SECRET_KEY,
+            algorithm=settings.ALGORITHM,
+            max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+            ttl=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+            max_token_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        )
+        self.rate_limiter = RateLimiter(
+            backend=self._create_rate_limit_backend(),
+            limit=settings.RATE_LIMIT,
+            window=settings.RATE_LIMIT_WINDOW_SECONDS,
+            route_limits=settings.RATE_LIMIT_ROUTES
+        )
+
+        # Dados da Embrapa
+        self.csv_adapter_out = CSVAdapterOut(service=CSVService())
+        self.cache_adapter_out = CacheAdapterOut(service=CacheService())
+        self.dataset_cache_adapter_out = DatasetCacheAdapterOut(service=DatasetCacheService())
+        self.http_adapter_out = HttpAdapterOut()
+        self.embrapa_service = EmbrapaService(
+            cache_port=self.cache_adapter_out,
+            csv_port=self.csv_adapter_out,
+            dataset_cache_port=self.dataset_cache_adapter_out,
+            http_port=self.http_adapter_out
+        )
+        self.embrapa_adapter = EmbrapaAdapterOut(service=self.embrapa_service)
+        self.refresh_scheduler_service = RefreshSchedulerService(
+            embrapa_port=self.embrapa_adapter,
+            datasets=EMBRAPA_DATASETS.values(),
+            executor=self.embrapa_executor
+        )
+        self.production_service = ProductionService(embrapa_port=self.embrapa_adapter)
+        self.production_adapter_in = ProductionAdapterIn(service=self.production_service)
+        self.processing_service = ProcessingService(embrapa_port=self.embrapa_adapter)
+        self.processing_adapter_in = ProcessingAdapterIn(service=self.processing_service)
+        self.marketing_service = MarketingService(embrapa_port=self.embrapa_adapter)
+        self.marketing_adapter_in = MarketingAdapterIn(service=self.marketing_service)
+        self.importation_service = ImportationService(embrapa_port=self.embrapa_adapter)
+        self.importation_adapter_in = ImportationAdapterIn(service=self.importation_service)
+        self.exportation_service = ExportationService(embrapa_port=self.embrapa_adapter)
+        self.exportation_adapter_in = ExportationAdapterIn(service=self.exportation_service)
+
+        # IAM
+        self.local_db_service = LocalDbService()
+        self.password_hash_adapter_out = PasswordHashAdapterOut(service=PasswordHashService(rounds=settings.PASSWORD_HASH_ROUNDS))
+        self.sign_up_adapter_out = SignUpAdapterOut(service=self.local_db_service)
+        self.sign_up_service = SignUpService(port_out=self.sign_up_adapter_out, password_hash_port=self.password_hash_adapter_out)
+        self.sign_up_adapter_in = SignUpAdapterIn(service=self.sign_up_service)
+        self.local_db_adapter_out = LocalDbAdapterOut(service=self.local_db_service)
+        self.permissions_adapter_out = PermissionsService(local_db_port=self.local_db_adapter_out, password_hash_port=self.password_hash_adapter_out)
+        self.jwt_service = JWTAuthService(permissions_port_out=self.permissions_adapter_out, token_cache=self.token_cache)
+        self.jwt_adapter_in = JWTAuthAdapterIn(service=self.jwt_service)
+        self.log_in_service = LogInService(permissions_port_out=self.permissions_adapter_out, token_port_in=self.jwt_adapter_in)
+        self.log_in_adapter_in = LogInAdapterIn(service=self.log_in_service)
+
+    @staticmethod
+    def _create_rate_limit_backend() -> RateLimitBackend:
+        """
+        Cria o backend do rate limiting configurado em RATE_LIMIT_BACKEND.
+        """
+        # Baldes parados há uma janela inteira já estão cheios e podem ser descartados
+        if settings.RATE_LIMIT_BACKEND == "memory":
+            return MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS, idle_ttl=settings.RATE_LIMIT_WINDOW_SECONDS)
+        return SharedMemoryRateLimitBackend(
+            path=settings.RATE_LIMIT_SHARED_PATH,
+            max_keys=settings.RATE_LIMIT_MAX_KEYS,
+            idle_ttl=settings.RATE_LIMIT_WINDOW_SECONDS
+        )
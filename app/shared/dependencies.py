@@ -3,13 +3,11 @@ from app.infrastructure.adapters.input.embrapa.production_adapter_in import Prod
 from app.infrastructure.adapters.output.embrapa.embrapa_adapter_out import EmbrapaAdapterOut
 from app.infrastructure.adapters.input.iam.auth.jwt_auth_adapter_in import JWTAuthAdapterIn
 from app.infrastructure.adapters.output.dataprocessing.cache_adapter_out import CacheAdapterOut
-from app.application.ports.output.dataprocessing.csv_port_out import CSVPortOut
 from app.domain.services.embrapa.embrapa_service import EmbrapaService
 from app.domain.services.iam.auth.permissions_service import PermissionsService
 from app.infrastructure.adapters.output.dataprocessing.csv_adapter_out import CSVAdapterOut
-from app.domain.services.dataprocessing.csv_service import CSVService
-from app.domain.services.dataprocessing.cache_service import CacheService
-from app.application.ports.output.dataprocessing.cache_port_out import CachePortOut
+from app.infrastructure.adapters.output.dataprocessing.dataset_cache_adapter_out import DatasetCacheAdapterOut
+from app.infrastructure.adapters.output.http.http_adapter_out import HttpAdapterOut
 from app.domain.services.embrapa.processing_service import ProcessingService
 from app.infrastructure.adapters.input.embrapa.processing_adapter_in import ProcessingAdapterIn
 from app.domain.services.embrapa.marketing_service import MarketingService
@@ -21,87 +19,119 @@ from app.infrastructure.adapters.input.embrapa.exportation_adapter_in import Exp
 from app.infrastructure.adapters.input.iam.sign_up_adater_in import SignUpAdapterIn
 from app.domain.services.iam.sign_up_service import SignUpService
 from app.domain.services.iam.db.local_db_service import LocalDbService
-from app.application.ports.output.iam.sign_up_port_out import SignUpPortOut
 from app.infrastructure.adapters.output.iam.sign_up_adapter_out import SignUpAdapterOut
 from app.infrastructure.adapters.output.iam.db.local_db_adapter_out import LocalDbAdapterOut
-from app.application.ports.output.iam.db.local_db_port_out import LocalDBPortOut
 from app.domain.services.iam.auth.jwt_auth_service import JWTAuthService
-from app.application.ports.output.iam.auth.permissions_port_out import PermissionsPortOut
-from app.application.ports.input.iam.auth.jwt_auth_port_in import JWTAuthPortIn
 from app.domain.services.iam.log_in_service import LogInService
 from app.infrastructure.adapters.input.iam.log_in_adapter_in import LogInAdapterIn
+from app.domain.services.embrapa.refresh_scheduler_service import RefreshSchedulerService
+from app.shared.util.bounded_executor import BoundedExecutor
+from app.shared.util.event_loop_monitor import EventLoopMonitor
+from app.shared.util.response_cache import ResponseCache
+from app.shared.util.token_cache import TokenCache
+from app.shared.util.rate_limiter import RateLimiter
+from app.shared.container import Container
 
-from fastapi import Depends
+# Grafo de dependências criado uma vez, na inicialização do processo
+container = Container()
 
-def get_csv_adapter_out() -> CSVAdapterOut:
-    return CSVAdapterOut(service=CSVService())
+# As dependências são assíncronas porque só leem um atributo: as síncronas o FastAPI
+# executaria no pool de threads, uma ida e volta por dependência a cada requisição
+async def get_embrapa_executor() -> BoundedExecutor:
+    return container.embrapa_executor
 
-def get_cache_adapter_out() -> CacheAdapterOut:
-    return CacheAdapterOut(service=CacheService())
+async def get_password_executor() -> BoundedExecutor:
+    return container.password_executor
 
-def get_embrapa_service(cache_port: CachePortOut = Depends(get_cache_adapter_out), csv_port: CSVPortOut = Depends(get_csv_adapter_out)) -> EmbrapaService:
-    return EmbrapaService(cache_port=cache_port, csv_port=csv_port)
+async def get_event_loop_monitor() -> EventLoopMonitor:
+    return container.event_loop_monitor
 
-def get_embrapa_adapter(embrapa_service: EmbrapaService = Depends(get_embrapa_service)) -> EmbrapaAdapterOut:
-    return EmbrapaAdapterOut(service=embrapa_service) 
+async def get_response_cache() -> ResponseCache:
+    return container.response_cache
 
-def get_production_service(embrapa_adapter: EmbrapaAdapterOut = Depends(get_embrapa_adapter)) -> ProductionService:
-    return ProductionService(embrapa_port=embrapa_adapter)
+async def get_rate_limiter() -> RateLimiter:
+    return container.rate_limiter
 
-def get_production_adapter_in(production_service: ProductionService = Depends(get_production_service)) -> ProductionAdapterIn:
-    return ProductionAdapterIn(service=production_service)
+async def get_token_cache() -> TokenCache:
+    return container.token_cache
 
-def get_processing_service(embrapa_adapter: EmbrapaAdapterOut = Depends(get_embrapa_adapter)) -> ProcessingService:
-    return ProcessingService(embrapa_port=embrapa_adapter)
+async def get_csv_adapter_out() -> CSVAdapterOut:
+    return container.csv_adapter_out
 
-def get_processing_adapter_in(processing_service: ProcessingService = Depends(get_processing_service)) -> ProcessingAdapterIn:
-    return ProcessingAdapterIn(service=processing_service)
+async def get_cache_adapter_out() -> CacheAdapterOut:
+    return container.cache_adapter_out
 
-def get_marketing_service(embrapa_adapter: EmbrapaAdapterOut = Depends(get_embrapa_adapter)) -> MarketingService:
-    return MarketingService(embrapa_port=embrapa_adapter)
+async def get_dataset_cache_adapter_out() -> DatasetCacheAdapterOut:
+    return container.dataset_cache_adapter_out
 
-def get_marketing_adapter_in(marketing_service: MarketingService = Depends(get_marketing_service)) -> MarketingAdapterIn:
-    return MarketingAdapterIn(service=marketing_service)
+async def get_http_adapter_out() -> HttpAdapterOut:
+    return container.http_adapter_out
 
-def get_importation_service(embrapa_adapter: EmbrapaAdapterOut = Depends(get_embrapa_adapter)) -> ImportationService:
-    return ImportationService(embrapa_port=embrapa_adapter)
+async def get_embrapa_service() -> EmbrapaService:
+    return container.embrapa_service
 
-def get_importation_adapter_in(importation_service: ImportationService = Depends(get_importation_service)) -> ImportationAdapterIn:
-    return ImportationAdapterIn(service=importation_service)
+async def get_embrapa_adapter() -> EmbrapaAdapterOut:
+    return container.embrapa_adapter
 
-def get_exportation_service(embrapa_adapter: EmbrapaAdapterOut = Depends(get_embrapa_adapter)) -> ExportationService:
-    return ExportationService(embrapa_port=embrapa_adapter)
+async def get_refresh_scheduler_service() -> RefreshSchedulerService:
+    return container.refresh_scheduler_service
 
-def get_exportation_adapter_in(exportation_service: ExportationService = Depends(get_exportation_service)) -> ExportationAdapterIn:
-    return ExportationAdapterIn(service=exportation_service)
+async def get_production_service() -> ProductionService:
+    return container.production_service
 
-def get_local_db_service() -> LocalDbService:
-    return LocalDbService()
+async def get_production_adapter_in() -> ProductionAdapterIn:
+    return container.production_adapter_in
 
-def get_sign_up_adapter_out(service: LocalDbService = Depends(get_local_db_service)) -> SignUpAdapterOut:
-    return SignUpAdapterOut(service=service)
+async def get_processing_service() -> ProcessingService:
+    return container.processing_service
 
-def get_sign_up_service(port_out: SignUpPortOut = Depends(get_sign_up_adapter_out)) -> SignUpService:
-    return SignUpService(port_out=port_out)
+async def get_processing_adapter_in() -> ProcessingAdapterIn:
+    return container.processing_adapter_in
 
-def get_sign_up_adapter_in(service: SignUpService = Depends(get_sign_up_service)) -> SignUpAdapterIn:
-    return SignUpAdapterIn(service=service)
+async def get_marketing_service() -> MarketingService:
+    return container.marketing_service
 
+async def get_marketing_adapter_in() -> MarketingAdapterIn:
+    return container.marketing_adapter_in
 
-def get_local_db_adapter_out(service: LocalDbService = Depends(get_local_db_service)) -> LocalDbAdapterOut:
-    return LocalDbAdapterOut(service=service)
+async def get_importation_service() -> ImportationService:
+    return container.importation_service
 
-def get_permissions_adapter_out(local_db_port: LocalDBPortOut = Depends(get_local_db_adapter_out)) -> PermissionsService:
-    return PermissionsService(local_db_port=local_db_port)
+async def get_importation_adapter_in() -> ImportationAdapterIn:
+    return container.importation_adapter_in
 
-def get_jwt_service(permission_port_out: PermissionsPortOut = Depends(get_permissions_adapter_out)) -> JWTAuthService:
-    return JWTAuthService(permissions_port_out=permission_port_out)
+async def get_exportation_service() -> ExportationService:
+    return container.exportation_service
 
-def get_jwt_adapter_in(service: JWTAuthService = Depends(get_jwt_service)) -> JWTAuthAdapterIn:
-    return JWTAuthAdapterIn(service=service)
+async def get_exportation_adapter_in() -> ExportationAdapterIn:
+    return container.exportation_adapter_in
 
-def get_log_in_service(permissions_port_out: PermissionsPortOut = Depends(get_permissions_adapter_out), token_port_in: JWTAuthPortIn = Depends(get_jwt_adapter_in)) -> LogInService:
-    return LogInService(permissions_port_out=permissions_port_out, token_port_in=token_port_in)
+async def get_local_db_service() -> LocalDbService:
+    return container.local_db_service
 
-def get_log_in_adapter_in(service: LogInService = Depends(get_log_in_service)) -> LogInAdapterIn:
-    return LogInAdapterIn(service=service)
\ No newline at end of file
+async def get_sign_up_adapter_out() -> SignUpAdapterOut:
+    return container.sign_up_adapter_out
+
+async def get_sign_up_service() -> SignUpService:
+    return container.sign_up_service
+
+async def get_sign_up_adapter_in() -> SignUpAdapterIn:
+    return container.sign_up_adapter_in
+
+async def get_local_db_adapter_out() -> LocalDbAdapterOut:
+    return container.local_db_adapter_out
+
+async def get_permissions_adapter_out() -> PermissionsService:
+    return container.permissions_adapter_out
+
+async def get_jwt_service() -> JWTAuthService:
+    return container.jwt_service
+
+async def get_jwt_adapter_in() -> JWTAuthAdapterIn:
+    return container.jwt_adapter_in
+
+async def get_log_in_service() -> LogInService:
+    return container.log_in_service
+
+async def get_log_in_adapter_in() -> LogInAdapterIn:
+    return container.log_in_adapter_in
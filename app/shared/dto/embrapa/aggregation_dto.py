@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+class AggregationQueryDTO(BaseModel):
+    group_by: List[str]
+    agg: Literal["sum", "mean", "min", "max"] = "sum"
+    top: Optional[int] = None
+    yoy: bool = False
+
+class AggregationDTO(BaseModel):
+    group_by: List[str]
+    agg: str
+    value_column: str
+    items: List[Dict[str, Any]]
+    total: int
+    last_changed_upstream: Optional[datetime] = None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class FilterDTO(BaseModel):
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    country: Optional[str] = None
+    product: Optional[str] = None
+    cultivate: Optional[str] = None
+    category: Optional[str] = None
+    control: Optional[str] = None
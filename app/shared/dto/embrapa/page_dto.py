@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+class PageDTO(BaseModel, Generic[T]):
+    items: List[T]
+    total: int
+    page: int
+    page_size: int
+    pages: int
+    last_changed_upstream: Optional[datetime] = None
+    next_cursor: Optional[str] = None
+    # True quando o dataset foi atualizado depois da página que gerou o `cursor` recebido
+    dataset_changed: bool = False
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+class EventLoopMetricsDTO(BaseModel):
+    last_lag_seconds: float
+    max_lag_seconds: float
+    mean_lag_seconds: float
+    samples: int
+
+class PoolMetricsDTO(BaseModel):
+    max_workers: int
+    max_pending: int
+    submitted: int
+    waiting: int
+    rejected: int
+
+class ResponseCacheMetricsDTO(BaseModel):
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+
+class TokenCacheMetricsDTO(BaseModel):
+    entries: int
+    hits: int
+    misses: int
+
+class MetricsDTO(BaseModel):
+    event_loop: EventLoopMetricsDTO
+    embrapa_pool: PoolMetricsDTO
+    password_pool: PoolMetricsDTO
+    response_cache: ResponseCacheMetricsDTO
+    token_cache: TokenCacheMetricsDTO
@@ -1,5 +1,7 @@
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse
 from pydantic import ValidationError
+from app.shared.util.bounded_executor import ExecutorOverloadedError
 
 class HttpEmbrapaServiceUnavailableException(HTTPException):
     def __init__(self):
@@ -64,4 +66,14 @@ class HttpInvalidPasswordError(HTTPException):
         super().__init__(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Senha incorreta."
-        )
\ No newline at end of file
+        )
+
+async def executor_overloaded_handler(request: Request, exc: ExecutorOverloadedError) -> JSONResponse:
+    """
+    Responde 503 com `Retry-After` quando um pool de threads recusa a requisição por sobrecarga.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Servidor sobrecarregado. Tente novamente mais tarde."},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
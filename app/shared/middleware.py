@@ -1,41 +1,121 @@
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from collections import defaultdict
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import math
+import re
 import time
-from app.shared.config import settings  # Importa as configurações globais
+import uuid
+import jwt
+from app.shared.container import Container
+from app.shared.util.rate_limiter import RateLimiter
+from app.shared.util.token_cache import TokenCache
 
-# Configuração do Rate Limiter
-rate_limit_data = defaultdict(lambda: {"count": 0, "timestamp": time.time()})
-
-class RateLimiterMiddleware(BaseHTTPMiddleware):
+class RateLimiterMiddleware:
     """
-    Middleware para limitar o número de requisições por IP.
+    Middleware ASGI para limitar o número de requisições por usuário (ou IP, sem token válido).
     """
-    async def dispatch(self, request: Request, call_next):
-        client_ip = request.client.host
-        current_time = time.time()
-        data = rate_limit_data[client_ip]
 
-        # Reseta o contador se o tempo limite foi excedido
-        if current_time - data["timestamp"] > 60:
-            data["count"] = 0
-            data["timestamp"] = current_time
+    def __init__(self, app: ASGIApp, rate_limiter: RateLimiter, token_cache: TokenCache):
+        self.app = app
+        self.rate_limiter = rate_limiter
+        self.token_cache = token_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Incrementa o contador de requisições
-        data["count"] += 1
+        decision = self.rate_limiter.hit(self._get_client(scope), scope["path"])
 
         # Verifica se o limite foi excedido
-        if data["count"] > settings.RATE_LIMIT:  # Usa o RATE_LIMIT definido em settings
-            raise HTTPException(
+        if not decision.allowed:
+            response = JSONResponse(
                 status_code=429,
-                detail="Limite de requisições excedido. Tente novamente mais tarde."
+                content={"detail": "Limite de requisições excedido. Tente novamente mais tarde."},
+                headers={"Retry-After": str(math.ceil(decision.retry_after))}
             )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _get_client(self, scope: Scope) -> str:
+        """
+        Identifica o cliente pelo `sub` do JWT (com assinatura verificada) ou, sem token válido, pelo IP.
+        """
+        auth = Headers(scope=scope).get("authorization")
+        if auth and auth.startswith("Bearer "):
+            try:
+                login = self.token_cache.decode(auth[len("Bearer "):]).get("sub")
+            except jwt.InvalidTokenError:
+                login = None
+            if login:
+                return f"user:{login}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+class TimingMiddleware:
+    """
+    Middleware ASGI que informa, no cabeçalho `Server-Timing`, o tempo até o início da resposta.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration = (time.perf_counter() - started_at) * 1000
+                MutableHeaders(scope=message).append("Server-Timing", f"app;dur={duration:.1f}")
+            await send(message)
 
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send_with_timing)
 
-def setup_middleware(app):
+class RequestIdMiddleware:
+    """
+    Middleware ASGI que identifica cada requisição pelo cabeçalho `X-Request-ID`.
+
+    O valor enviado pelo cliente (ou pelo proxy) é mantido quando válido; caso
+    contrário um novo é gerado. Ele fica em `request.state.request_id` e volta
+    na resposta.
+    """
+
+    HEADER = "X-Request-ID"
+    _VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(self.HEADER)
+        if not request_id or not self._VALID_REQUEST_ID.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(self.HEADER, request_id)
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+def setup_middleware(app, container: Container):
     """
     Configura os middlewares na aplicação FastAPI.
+
+    O último adicionado é o mais externo: a identificação e a medição de tempo
+    envolvem também as respostas 429 do rate limiting.
     """
-    app.add_middleware(RateLimiterMiddleware)
\ No newline at end of file
+    app.add_middleware(RateLimiterMiddleware, rate_limiter=container.rate_limiter, token_cache=container.token_cache)
+    app.add_middleware(TimingMiddleware)
+    app.add_middleware(RequestIdMiddleware)
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import math
+
+class ExecutorOverloadedError(Exception):
+    """
+    O pool está ocupado e a fila de espera, cheia (ou a espera passou de `max_wait`).
+    """
+
+    def __init__(self, retry_after: int):
+        super().__init__("Pool de threads sobrecarregado.")
+        self.retry_after = retry_after
+
+class BoundedExecutor:
+    """
+    Pool de threads para tirar do event loop o trabalho síncrono (HTTP, pandas, disco).
+
+    No máximo `max_workers` tarefas rodam ao mesmo tempo e no máximo `max_pending`
+    corrotinas esperam vaga (no semáforo, sem bloquear o event loop). Com a fila
+    de espera cheia, ou depois de `max_wait` segundos esperando, a chamada é
+    recusada com `ExecutorOverloadedError` em vez de acumular requisições.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, max_wait: float = 0.0, thread_name_prefix: str = "worker"):
+        """
+        :param max_workers: Quantidade de threads do pool.
+        :param max_pending: Quantidade máxima de chamadas aguardando uma thread livre.
+        :param max_wait: Tempo máximo, em segundos, aguardando uma thread livre (0: sem limite).
+        :param thread_name_prefix: Prefixo do nome das threads.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_wait = max_wait
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._submitted = 0
+        self._waiting = 0
+        self._rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Executa `fn` no pool e aguarda o resultado.
+
+        :param fn: Função síncrona a ser executada.
+        :return: Resultado da função.
+        :raises ExecutorOverloadedError: Se a fila de espera estiver cheia ou a espera passar de `max_wait`.
+        """
+        semaphore = self._get_semaphore()
+        if semaphore.locked():
+            await self._wait_for_worker(semaphore)
+        else:
+            await semaphore.acquire()
+
+        self._submitted += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args, **kwargs))
+        finally:
+            self._submitted -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna a ocupação atual do pool.
+
+        :return: Limites configurados, tarefas em execução, chamadas aguardando vaga e chamadas recusadas.
+        """
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "submitted": self._submitted,
+            "waiting": self._waiting,
+            "rejected": self._rejected,
+        }
+
+    async def _wait_for_worker(self, semaphore: asyncio.Semaphore) -> None:
+        """
+        Aguarda uma thread livre na fila de espera limitada.
+        """
+        if self._waiting >= self.max_pending:
+            self._reject()
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.max_wait if self.max_wait > 0 else None)
+        except asyncio.TimeoutError:
+            self._reject()
+        finally:
+            self._waiting -= 1
+
+    def _reject(self) -> None:
+        """
+        Recusa a chamada, sugerindo aguardar o tempo máximo de espera antes de tentar de novo.
+        """
+        self._rejected += 1
+        raise ExecutorOverloadedError(retry_after=max(1, math.ceil(self.max_wait)))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Retorna o semáforo do event loop corrente (um novo é criado se o loop mudar).
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._semaphore
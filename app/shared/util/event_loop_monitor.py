@@ -0,0 +1,80 @@
+from typing import Dict, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class EventLoopMonitor:
+    """
+    Mede o atraso (lag) do event loop.
+
+    A cada intervalo a tarefa agenda um `sleep` e compara o tempo real decorrido
+    com o esperado: a diferença é o tempo em que o loop ficou ocupado com
+    trabalho síncrono e não pôde atender outras corrotinas.
+    """
+
+    def __init__(self, interval: float, warning_threshold: float):
+        self.interval = interval
+        self.warning_threshold = warning_threshold
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.samples = 0
+        self._total_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Inicia a medição em uma tarefa do event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-loop-monitor")
+
+    async def stop(self) -> None:
+        """
+        Interrompe a medição e aguarda o término da tarefa.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def record(self, lag: float) -> None:
+        """
+        Registra uma medição de lag.
+
+        :param lag: Atraso medido, em segundos.
+        """
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.samples += 1
+        self._total_lag += lag
+
+        if lag >= self.warning_threshold:
+            logger.warning("Event loop bloqueado.", extra={"event_loop_lag_seconds": round(lag, 4)})
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Retorna as medições de lag do event loop, em segundos.
+
+        :return: Último lag, maior lag, lag médio e quantidade de medições.
+        """
+        return {
+            "last_lag_seconds": self.last_lag,
+            "max_lag_seconds": self.max_lag,
+            "mean_lag_seconds": self._total_lag / self.samples if self.samples else 0.0,
+            "samples": self.samples,
+        }
+
+    async def _run(self) -> None:
+        """
+        Laço principal da medição.
+        """
+        while True:
+            started_at = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.record(max(time.perf_counter() - started_at - self.interval, 0.0))
@@ -0,0 +1,41 @@
+from typing import Iterable, Iterator
+import zlib
+from starlette.responses import StreamingResponse
+
+# Tipo de conteúdo e extensão de cada formato de exportação
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+def export_response(chunks: Iterable[bytes], export_format: str, filename: str, compress: bool = False) -> StreamingResponse:
+    """
+    Monta a resposta em streaming de uma exportação.
+
+    O iterador é consumido pelo Starlette em uma thread, parte por parte, então
+    nem a serialização nem a compressão bloqueiam o event loop.
+
+    :param chunks: Partes do arquivo exportado.
+    :param export_format: 'ndjson', 'csv' ou 'parquet'.
+    :param filename: Nome do arquivo, sem extensão.
+    :param compress: Se verdadeiro, comprime com gzip (`Content-Encoding: gzip`).
+    :return: Resposta em streaming.
+    """
+    media_type, extension = EXPORT_FORMATS[export_format]
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{extension}"'}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        chunks = _gzip(chunks)
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Comprime as partes com gzip à medida que são geradas.
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,34 @@
+from typing import List
+import base64
+import binascii
+from pydantic import BaseModel, ValidationError
+
+class PageCursor(BaseModel):
+    """
+    Cursor opaco da paginação: versão do dataset e chave de ordenação da última linha entregue.
+    """
+    version: str
+    key: List[int]
+
+    def encode(self) -> str:
+        """
+        Codifica o cursor em base64 (URL-safe, sem padding).
+
+        :return: Token do cursor.
+        """
+        return base64.urlsafe_b64encode(self.model_dump_json().encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """
+        Decodifica um token gerado por `encode`.
+
+        :param token: Token do cursor.
+        :return: Cursor decodificado.
+        :raises ValueError: Se o token for inválido.
+        """
+        try:
+            content = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            return cls.model_validate_json(content)
+        except (binascii.Error, ValueError, ValidationError) as e:
+            raise ValueError("Cursor inválido.") from e
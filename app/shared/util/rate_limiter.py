@@ -0,0 +1,191 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Tuple
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+class RateLimitDecision(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+
+def _take_token(tokens: float, updated_at: float, now: float, limit: int, window: float) -> Tuple[float, RateLimitDecision]:
+    """
+    Aplica o token bucket: o balde tem `limit` fichas e é reabastecido à taxa de `limit / window` por segundo.
+
+    :param tokens: Fichas no balde na última atualização.
+    :param updated_at: Momento da última atualização.
+    :param now: Momento atual.
+    :param limit: Capacidade do balde.
+    :param window: Tempo, em segundos, para o balde vazio encher.
+    :return: Fichas restantes e a decisão.
+    """
+    rate = limit / window
+    tokens = min(float(limit), tokens + max(now - updated_at, 0.0) * rate)
+    if tokens >= 1.0:
+        tokens -= 1.0
+        return tokens, RateLimitDecision(allowed=True, limit=limit, remaining=int(tokens), retry_after=0.0)
+    return tokens, RateLimitDecision(allowed=False, limit=limit, remaining=0, retry_after=(1.0 - tokens) / rate)
+
+class RateLimitBackend(ABC):
+    """
+    Armazenamento do estado dos baldes de cada chave.
+
+    Um balde parado há `idle_ttl` segundos (no mínimo a janela) já está cheio
+    de novo, então descartá-lo não muda nenhuma decisão: é isso que permite
+    limitar o estado sem afrouxar o limite.
+    """
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        """
+        Consome uma ficha do balde da chave.
+
+        :param key: Chave do balde (cliente e rota).
+        :param limit: Capacidade do balde.
+        :param window: Tempo, em segundos, para o balde vazio encher.
+        :return: Decisão da requisição.
+        """
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Baldes em memória do processo, divididos em shards com lock próprio.
+
+    Cada shard é um LRU: as chaves paradas há mais de `idle_ttl` são removidas
+    do início a cada requisição (custo amortizado O(1)) e, com o shard cheio,
+    a chave usada há mais tempo dá lugar à nova.
+    """
+
+    def __init__(self, max_keys: int, idle_ttl: float, shards: int = 16):
+        self.idle_ttl = idle_ttl
+        self.max_keys_per_shard = max(1, max_keys // shards)
+        self._shards: List[Tuple["OrderedDict[str, Tuple[float, float]]", threading.Lock]] = [
+            (OrderedDict(), threading.Lock()) for _ in range(shards)
+        ]
+
+    def hit(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        now = time.monotonic()
+        entries, lock = self._shards[hash(key) % len(self._shards)]
+        with lock:
+            tokens, updated_at = entries.pop(key, (float(limit), now))
+            tokens, decision = _take_token(tokens, updated_at, now, limit, window)
+            entries[key] = (tokens, now)
+
+            # A chave recém-gravada está no fim e não é removida
+            while len(entries) > self.max_keys_per_shard or now - next(iter(entries.values()))[1] >= self.idle_ttl:
+                entries.popitem(last=False)
+        return decision
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries, _ in self._shards)
+
+class SharedMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Baldes em um arquivo mapeado em memória, compartilhado pelos workers da máquina.
+
+    O arquivo é uma tabela associativa de tamanho fixo: cada chave cai em um
+    conjunto de `WAYS` posições (pelo hash) e ocupa uma posição livre, parada há
+    mais de `idle_ttl` ou, no pior caso, a atualizada há mais tempo. Cada conjunto
+    é protegido por um lock de faixa de bytes (`fcntl.lockf`) entre processos.
+    """
+
+    WAYS = 8
+    _SLOT = struct.Struct("<Qdd")
+    _SET = struct.Struct("<" + "Qdd" * WAYS)
+
+    def __init__(self, path: str, max_keys: int, idle_ttl: float):
+        self.path = path
+        self.idle_ttl = idle_ttl
+        self.sets = max(1, math.ceil(max_keys / self.WAYS))
+        self._lock = threading.Lock()
+
+        size = self.sets * self._SET.size
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            # Um arquivo de outro tamanho (configuração anterior) é zerado pelo primeiro worker
+            if os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+
+    def hit(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        key_hash = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") or 1
+        offset = (key_hash % self.sets) * self._SET.size
+
+        with self._lock:
+            if fcntl is not None:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, self._SET.size, offset)
+            try:
+                # O relógio de parede é o mesmo para todos os processos
+                now = time.time()
+                slots = self._SET.unpack_from(self._map, offset)
+                tokens, updated_at = float(limit), now
+                position, position_updated_at = 0, math.inf
+                for way in range(self.WAYS):
+                    slot_hash, slot_tokens, slot_updated_at = slots[way * 3:way * 3 + 3]
+                    if slot_hash == key_hash:
+                        position, tokens, updated_at = way, slot_tokens, slot_updated_at
+                        break
+                    # Posições vazias ou paradas contam como as mais antigas
+                    if slot_hash == 0 or now - slot_updated_at >= self.idle_ttl:
+                        slot_updated_at = -math.inf
+                    if slot_updated_at < position_updated_at:
+                        position, position_updated_at = way, slot_updated_at
+
+                tokens, decision = _take_token(tokens, updated_at, now, limit, window)
+                self._SLOT.pack_into(self._map, offset + position * self._SLOT.size, key_hash, tokens, now)
+            finally:
+                if fcntl is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN, self._SET.size, offset)
+        return decision
+
+class RateLimiter:
+    """
+    Limita as requisições por cliente, com limites específicos para prefixos de rota.
+
+    Cada cliente tem um balde para as rotas sem limite próprio e um balde para
+    cada prefixo configurado (o mais longo que corresponder ao caminho).
+    """
+
+    def __init__(self, backend: RateLimitBackend, limit: int, window: float, route_limits: Dict[str, int]):
+        self.backend = backend
+        self.limit = limit
+        self.window = window
+        self._route_limits = sorted(route_limits.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def hit(self, client: str, path: str) -> RateLimitDecision:
+        """
+        Registra a requisição do cliente e decide se ela pode seguir.
+
+        :param client: Identificação do cliente (usuário ou IP).
+        :param path: Caminho da requisição.
+        :return: Decisão da requisição.
+        """
+        route, limit = self._match_route(path)
+        return self.backend.hit(f"{client}|{route}", limit, self.window)
+
+    def _match_route(self, path: str) -> Tuple[str, int]:
+        """
+        Retorna o prefixo configurado mais longo que corresponde ao caminho e o seu limite.
+        """
+        for prefix, limit in self._route_limits:
+            if path.startswith(prefix):
+                return prefix, limit
+        return "*", self.limit
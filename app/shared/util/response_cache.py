@@ -0,0 +1,177 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, Tuple, Type
+import hashlib
+import threading
+from fastapi import Request
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+class CachedResponse(NamedTuple):
+    etag: str
+    body: bytes
+
+class ResponseCache:
+    """
+    Cache em memória (por processo) de respostas JSON já codificadas.
+
+    A chave é formada pelo caminho, pelos parâmetros da consulta (em ordem
+    canônica) e pela versão do dataset, de modo que uma atualização do dataset
+    invalida naturalmente as respostas antigas. Cada resposta tem um ETag forte
+    (hash dos bytes): requisições com `If-None-Match` correspondente recebem 304.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, max_age: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    async def serve(
+        self,
+        request: Request,
+        get_version: Callable[[], Awaitable[Optional[str]]],
+        get_data: Callable[[], Awaitable[BaseModel]]
+    ) -> Response:
+        """
+        Responde a partir do cache ou, em uma falta, monta e armazena a resposta.
+
+        Respostas já codificadas para a versão atual do dataset não chamam `get_data`.
+        A resposta montada só é armazenada se o dataset não mudou enquanto ela era montada.
+
+        :param request: Requisição atual.
+        :param get_version: Obtém a versão do dataset em memória (None se desconhecida).
+        :param get_data: Obtém o modelo da resposta.
+        :return: Resposta HTTP com `ETag` (304 se o cliente já tem a mesma versão).
+        """
+        version = await get_version()
+        cached = self.get(request, version)
+        if cached is None:
+            data = await get_data()
+            current_version = await get_version()
+            cached = self.put(request, version=version if version == current_version else None, body=dump_json(data))
+        return self.respond(request, cached)
+
+    def get(self, request: Request, version: Optional[str]) -> Optional[CachedResponse]:
+        """
+        Retorna a resposta em cache para a requisição, se houver.
+
+        :param request: Requisição atual.
+        :param version: Versão do dataset em memória (None se desconhecida).
+        :return: Resposta codificada ou None.
+        """
+        if version is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        key = self._build_key(request, version)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cached
+
+    def put(self, request: Request, version: Optional[str], body: bytes) -> CachedResponse:
+        """
+        Armazena a resposta codificada e retorna-a com o seu ETag.
+
+        Sem versão conhecida, a resposta é devolvida sem ser armazenada.
+
+        :param request: Requisição atual.
+        :param version: Versão do dataset usada para gerar a resposta.
+        :param body: JSON codificado.
+        :return: Resposta com o ETag.
+        """
+        cached = CachedResponse(etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"', body=body)
+        if version is None or len(body) > self.max_bytes:
+            return cached
+
+        key = self._build_key(request, version)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous.body)
+
+            self._entries[key] = cached
+            self._total_bytes += len(body)
+
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, oldest = self._entries.popitem(last=False)
+                self._total_bytes -= len(oldest.body)
+        return cached
+
+    def respond(self, request: Request, cached: CachedResponse) -> Response:
+        """
+        Monta a resposta HTTP: 304 se o cliente já tem a mesma versão, senão os bytes em cache.
+
+        :param request: Requisição atual.
+        :param cached: Resposta codificada.
+        :return: Resposta HTTP com `ETag` e `Cache-Control`.
+        """
+        headers = {
+            "ETag": cached.etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+            # Os dados exigem permissão: caches compartilhados separam as cópias por token
+            "Vary": "Authorization",
+        }
+        if self._matches(request.headers.get("if-none-match"), cached.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached.body, media_type="application/json", headers=headers)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna a ocupação e a taxa de acerto do cache.
+
+        :return: Quantidade de entradas, bytes armazenados, acertos e falhas.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    @staticmethod
+    def _build_key(request: Request, version: str) -> Tuple:
+        """
+        Monta a chave da resposta: caminho, parâmetros ordenados e versão do dataset.
+        """
+        return request.url.path, tuple(sorted(request.query_params.multi_items())), version
+
+    @staticmethod
+    def _matches(if_none_match: Optional[str], etag: str) -> bool:
+        """
+        Compara o cabeçalho `If-None-Match` com o ETag (comparação fraca, como define o RFC 9110).
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        candidates = (candidate.strip() for candidate in if_none_match.split(","))
+        return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def dump_json(data: BaseModel) -> bytes:
+    """
+    Serializa o modelo direto para bytes JSON, sem passar por `str`.
+
+    :param data: Modelo já validado.
+    :return: JSON codificado em UTF-8.
+    """
+    return _json_adapter(type(data)).dump_json(data)
+
+@lru_cache(maxsize=None)
+def _json_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Retorna (e memoriza) o TypeAdapter do modelo.
+    """
+    return TypeAdapter(model)
@@ -0,0 +1,56 @@
+from typing import Any, Callable, Dict, Hashable
+import threading
+
+class _Call:
+    """
+    Chamada em andamento compartilhada pelas threads que aguardam o mesmo resultado.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+class SingleFlight:
+    """
+    Garante que apenas uma execução por chave esteja em andamento no processo.
+
+    As threads que pedem a mesma chave enquanto a execução está em curso
+    aguardam e recebem o mesmo resultado (ou a mesma exceção).
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Executa `fn` uma única vez para as chamadas concorrentes com a mesma chave.
+
+        :param key: Chave que identifica a execução.
+        :param fn: Função a ser executada.
+        :return: Resultado da execução compartilhada.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
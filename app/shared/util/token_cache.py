@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+import hashlib
+import math
+import threading
+import time
+import jwt
+
+class TokenCache:
+    """
+    Cache em memória (por processo) das claims de tokens JWT já verificados.
+
+    A chave é o hash do token (o token em si não é guardado) e cada entrada
+    vale por no máximo `ttl` segundos, nunca além do `exp` do token: depois
+    disso o token é decodificado de novo e o `jwt.decode` acusa a expiração.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, max_entries: int, ttl: float, max_token_age: float):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_token_age = max_token_age
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._invalidated_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        Retorna as claims do token, verificando a assinatura apenas na primeira vez.
+
+        :param token: JWT recebido.
+        :return: Claims do token.
+        :raises jwt.InvalidTokenError: Se o token for inválido ou estiver expirado.
+        """
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and now < entry[1]:
+                self._entries.move_to_end(digest)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        claims = jwt.decode(token, key=self.secret_key, algorithms=[self.algorithm])
+        expires_at = min(now + self.ttl, claims.get("exp", math.inf))
+
+        with self._lock:
+            self._entries[digest] = (claims, expires_at)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return claims
+
+    def invalidate_user(self, login: str) -> None:
+        """
+        Marca as claims dos tokens do usuário emitidos até agora como desatualizadas
+        (ex.: quando as permissões dele mudam). A marca é deste processo apenas.
+
+        :param login: Login do usuário.
+        """
+        now = time.time()
+        with self._lock:
+            # Tokens emitidos antes de `max_token_age` já expiraram e não precisam da marca
+            self._invalidated_at = {
+                user: invalidated_at
+                for user, invalidated_at in self._invalidated_at.items()
+                if now - invalidated_at < self.max_token_age
+            }
+            self._invalidated_at[login] = now
+
+    def is_current(self, claims: Dict[str, Any]) -> bool:
+        """
+        Indica se o token foi emitido depois da última invalidação do usuário.
+
+        :param claims: Claims do token.
+        :return: True se as claims (ex.: permissões) podem ser usadas.
+        """
+        invalidated_at = self._invalidated_at.get(claims.get("sub"))
+        return invalidated_at is None or claims.get("iat", 0) > invalidated_at
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna a ocupação e a taxa de acerto do cache.
+
+        :return: Quantidade de entradas, acertos e falhas.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
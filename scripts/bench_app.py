@@ -0,0 +1,108 @@
+"""
+Benchmark de requisições por segundo na aplicação completa.
+
+Sobe um servidor local que imita a Embrapa (página e CSV sintético de
+produção), aquece o cache e mede `/info/production/` (resposta em cache) e
+`/metrics/` via `httpx.ASGITransport`, com o grafo de dependências do `Container`.
+
+Uso: python scripts/bench_app.py [requisições] [concorrência]
+"""
+import asyncio
+import http.server
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def _build_csv(products: int = 200, years: int = 50) -> bytes:
+    header = "id;control;produto;" + ";".join(str(1970 + year) for year in range(years))
+    lines = [header] + [
+        f"{product};vm_Produto{product};Produto {product};" + ";".join(str(product * 10 + year) for year in range(years))
+        for product in range(1, products + 1)
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+class EmbrapaStubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    csv_content = _build_csv()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/index.php"):
+            body = b'<html><a href="download/Producao.csv" class="footer_content"><span>DOWNLOAD</span></a></html>'
+        else:
+            body = self.csv_content
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def start_stub() -> http.server.ThreadingHTTPServer:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), EmbrapaStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+async def measure(app, path: str, headers: dict, total: int, concurrency: int) -> float:
+    import httpx
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", headers=headers) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request():
+            async with semaphore:
+                response = await client.get(path)
+                assert response.status_code == 200, response.text
+
+        # Aquecimento
+        await asyncio.gather(*(request() for _ in range(200)))
+        started_at = time.perf_counter()
+        await asyncio.gather(*(request() for _ in range(total)))
+        return total / (time.perf_counter() - started_at)
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    stub = start_stub()
+    work_dir = tempfile.mkdtemp(prefix="bench_app_")
+
+    # As configurações são lidas na importação da aplicação
+    os.environ.update({
+        "EMBRAPA_BASE_URL": f"http://127.0.0.1:{stub.server_address[1]}",
+        "CACHE_FOLDER": os.path.join(work_dir, "cache"),
+        "RATE_LIMIT": str(10 ** 9),
+        "RATE_LIMIT_BACKEND": "memory",
+        "REFRESH_SCHEDULER_ENABLED": "false",
+        "CSV_PROCESS_POOL_SIZE": "0",
+        "PASSWORD_HASH_ROUNDS": "4",
+    })
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as client:
+        client.post("/user/sign-up/", json={
+            "login": "bench", "first_name": "Bench", "last_name": "User", "password": "bench",
+            "permissions": ["info_production"]
+        })
+        token = client.post("/user/log-in/", json={"login": "bench", "password": "bench"}).json()["accessToken"]
+        headers = {"Authorization": f"Bearer {token}"}
+        # Carrega o dataset e preenche o cache de respostas
+        for _ in range(3):
+            client.get("/info/production/", headers=headers)
+
+    for _ in range(2):
+        production = asyncio.run(measure(app, "/info/production/", headers, total, concurrency))
+        metrics = asyncio.run(measure(app, "/metrics/", headers, total, concurrency))
+        print(f"/info/production/ (cache) {production:8.0f} req/s   /metrics/ {metrics:8.0f} req/s")
+
+    stub.shutdown()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark do custo dos middlewares por requisição.
+
+Compara uma rota mínima sem middlewares, com a pilha ASGI de
+`app.shared.middleware` e com a mesma lógica escrita com `BaseHTTPMiddleware`
+(a implementação anterior), via `httpx.ASGITransport`, sem rede.
+
+Uso: python scripts/bench_middleware.py [requisições] [concorrência]
+"""
+import asyncio
+import math
+import os
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.shared.middleware import setup_middleware
+from app.shared.util.rate_limiter import MemoryRateLimitBackend, RateLimiter
+from app.shared.util.token_cache import TokenCache
+
+def create_container() -> SimpleNamespace:
+    return SimpleNamespace(
+        rate_limiter=RateLimiter(backend=MemoryRateLimitBackend(max_keys=65536, idle_ttl=60.0), limit=10 ** 9, window=60.0, route_limits={}),
+        token_cache=TokenCache(secret_key="secret", algorithm="HS256", max_entries=1024, ttl=60, max_token_age=60)
+    )
+
+def setup_base_http_middleware(app: FastAPI, container: SimpleNamespace) -> None:
+    """
+    A mesma pilha (rate limiting, Server-Timing e X-Request-ID) com `BaseHTTPMiddleware`.
+    """
+    async def rate_limit(request: Request, call_next):
+        client = request.client.host if request.client else "unknown"
+        decision = container.rate_limiter.hit(f"ip:{client}", request.url.path)
+        if not decision.allowed:
+            return JSONResponse(status_code=429, content={"detail": "Limite excedido."}, headers={"Retry-After": str(math.ceil(decision.retry_after))})
+        return await call_next(request)
+
+    async def timing(request: Request, call_next):
+        started_at = time.perf_counter()
+        response = await call_next(request)
+        response.headers["Server-Timing"] = f"app;dur={(time.perf_counter() - started_at) * 1000:.1f}"
+        return response
+
+    async def request_id(request: Request, call_next):
+        request.state.request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request.state.request_id
+        return response
+
+    app.add_middleware(BaseHTTPMiddleware, dispatch=rate_limit)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=timing)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=request_id)
+
+def create_app(kind: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if kind == "asgi":
+        setup_middleware(app, create_container())
+    elif kind == "base_http":
+        setup_base_http_middleware(app, create_container())
+    return app
+
+async def measure(app: FastAPI, total: int, concurrency: int) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request():
+            async with semaphore:
+                response = await client.get("/ping")
+                assert response.status_code == 200
+
+        # Aquecimento
+        await asyncio.gather(*(request() for _ in range(200)))
+        started_at = time.perf_counter()
+        await asyncio.gather(*(request() for _ in range(total)))
+        return total / (time.perf_counter() - started_at)
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 6000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    for kind in ("none", "asgi", "base_http") * 2:
+        print(f"{kind:<10} {asyncio.run(measure(create_app(kind), total, concurrency)):8.0f} req/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark da montagem e serialização de uma página do dataset.
+
+Compara o caminho anterior (`to_dict(orient="records")`, um modelo por linha
+e `model_dump_json`) com `EmbrapaQueryService.paginate` + `dump_json`.
+
+Uso: python scripts/bench_paginate.py [linhas_do_dataset]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from app.domain.models.entities.embrapa.production import ProductionEntity
+from app.domain.services.embrapa.embrapa_query_service import EmbrapaQueryService
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.util.response_cache import dump_json
+
+def build_dataset(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": np.arange(rows),
+        "control": ["vm_Tinto"] * rows,
+        "product": ["Tinto"] * rows,
+        "category": ["Vinho de Mesa"] * rows,
+        "year": np.arange(rows) % 50 + 1970,
+        "production": np.random.default_rng(0).random(rows) * 1e6,
+    })
+
+def per_row(df: pd.DataFrame, positions: np.ndarray) -> bytes:
+    items = [ProductionEntity(**record) for record in df.iloc[positions].to_dict(orient="records")]
+    page = PageDTO[ProductionEntity](items=items, total=len(df), page=1, page_size=len(positions), pages=1)
+    return page.model_dump_json().encode("utf-8")
+
+def batched(df: pd.DataFrame, positions: np.ndarray) -> bytes:
+    page = EmbrapaQueryService.paginate(df=df, model=ProductionEntity, positions=positions, total=len(df), page=1, page_size=len(positions))
+    return dump_json(page)
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    df = build_dataset(rows)
+
+    for page_size in (100, 10000):
+        positions = np.arange(min(page_size, rows))
+        number = 20 if page_size <= 100 else 2
+        for bench in (per_row, batched):
+            elapsed = min(timeit.repeat(lambda: bench(df, positions), number=number, repeat=5)) / number
+            print(f"page_size={page_size:<6} {bench.__name__:<8} {elapsed * 1000:8.3f} ms")
+
+if __name__ == "__main__":
+    main()
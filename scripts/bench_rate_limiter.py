@@ -0,0 +1,91 @@
+"""
+Benchmark do rate limiting com muitos clientes distintos.
+
+Mede o custo por requisição dos backends em memória e compartilhado (arquivo
+mapeado em memória) com 1 milhão de IPs diferentes e o número de chaves mantidas.
+
+Mede também, no backend compartilhado, quanto tempo cada `hit` bloqueia o
+chamador (o event loop, no middleware) com vários processos disputando o lock
+do mesmo conjunto de chaves, como workers do Gunicorn atendendo o mesmo cliente.
+
+Uso: python scripts/bench_rate_limiter.py [clientes] [processos]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.shared.util.rate_limiter import MemoryRateLimitBackend, RateLimitBackend, SharedMemoryRateLimitBackend
+
+LIMIT = 10
+WINDOW = 60.0
+
+def run(name: str, backend: RateLimitBackend, keys) -> None:
+    block = max(1, len(keys) // 5)
+    costs = []
+    started_at = time.perf_counter()
+    for position, key in enumerate(keys, start=1):
+        backend.hit(key, LIMIT, WINDOW)
+        if position % block == 0:
+            now = time.perf_counter()
+            costs.append(f"{(now - started_at) / block * 1e6:.2f}")
+            started_at = now
+
+    # Clientes que voltam logo em seguida (baldes já existentes)
+    recent = keys[-100_000:]
+    started_at = time.perf_counter()
+    for key in recent:
+        backend.hit(key, LIMIT, WINDOW)
+    repeat_cost = (time.perf_counter() - started_at) / len(recent) * 1e6
+
+    stored = len(backend) if hasattr(backend, "__len__") else "-"
+    print(f"{name:<24} µs/hit por bloco {costs}  repetidos {repeat_cost:.2f} µs  chaves {stored}")
+
+def contend(path: str, seconds: float, latencies) -> None:
+    backend = SharedMemoryRateLimitBackend(path=path, max_keys=65536, idle_ttl=WINDOW)
+    samples = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started_at = time.perf_counter()
+        backend.hit("user:mesmo|*", LIMIT, WINDOW)
+        samples.append(time.perf_counter() - started_at)
+    latencies.extend(samples)
+
+def run_contention(processes: int, seconds: float = 2.0) -> None:
+    with tempfile.TemporaryDirectory() as directory, multiprocessing.Manager() as manager:
+        path = os.path.join(directory, "rate_limit.bin")
+        SharedMemoryRateLimitBackend(path=path, max_keys=65536, idle_ttl=WINDOW)
+        latencies = manager.list()
+        workers = [multiprocessing.Process(target=contend, args=(path, seconds, latencies)) for _ in range(processes)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        samples = sorted(latencies)
+        percentile = lambda p: samples[min(len(samples) - 1, int(len(samples) * p))] * 1e6
+        print(
+            f"shared, {processes} processos na mesma chave ({os.cpu_count()} núcleos): "
+            f"{len(samples)} hits  p50 {percentile(0.5):.1f} µs  p99 {percentile(0.99):.1f} µs  "
+            f"p99.9 {percentile(0.999):.1f} µs  máx {samples[-1] * 1e6:.1f} µs"
+        )
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    keys = [f"ip:10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}|*" for i in range(clients)]
+
+    run("memory max_keys=65536", MemoryRateLimitBackend(max_keys=65536, idle_ttl=WINDOW), keys)
+    run(f"memory max_keys={clients}", MemoryRateLimitBackend(max_keys=clients, idle_ttl=WINDOW), keys)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rate_limit.bin")
+        run(f"shared max_keys={clients}", SharedMemoryRateLimitBackend(path=path, max_keys=clients, idle_ttl=WINDOW), keys)
+
+    for count in (1, processes):
+        run_contention(count)
+
+if __name__ == "__main__":
+    main()
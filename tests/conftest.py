@@ -0,0 +1,4 @@
+import os
+
+# Os testes de rotas fazem várias requisições do mesmo endereço
+os.environ.setdefault("RATE_LIMIT", "1000")
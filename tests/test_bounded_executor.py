@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import httpx
+import pytest
+from app.application.ports.input.iam.log_in_port_in import LogInPortIn
+from app.main import app
+from app.shared.dependencies import get_log_in_adapter_in, get_password_executor
+from app.shared.util.bounded_executor import BoundedExecutor, ExecutorOverloadedError
+
+async def _wait_until(condition):
+    while not condition():
+        await asyncio.sleep(0.001)
+
+def test_rejects_when_waiting_queue_is_full():
+    async def scenario():
+        executor = BoundedExecutor(max_workers=1, max_pending=1)
+        release = threading.Event()
+        running = asyncio.create_task(executor.run(release.wait))
+        waiting = asyncio.create_task(executor.run(lambda: "ok"))
+        await _wait_until(lambda: executor.stats()["waiting"] == 1)
+
+        with pytest.raises(ExecutorOverloadedError):
+            await executor.run(lambda: "rejected")
+
+        stats = executor.stats()
+        release.set()
+        return stats, await running, await waiting, executor.stats()
+
+    stats, _, result, final_stats = asyncio.run(scenario())
+
+    assert stats["submitted"] == 1
+    assert stats["waiting"] == 1
+    assert stats["rejected"] == 1
+    assert result == "ok"
+    assert final_stats["submitted"] == 0
+    assert final_stats["waiting"] == 0
+
+def test_rejects_after_max_wait():
+    async def scenario():
+        executor = BoundedExecutor(max_workers=1, max_pending=4, max_wait=0.05)
+        release = threading.Event()
+        running = asyncio.create_task(executor.run(release.wait))
+        await _wait_until(lambda: executor.stats()["submitted"] == 1)
+
+        with pytest.raises(ExecutorOverloadedError) as error:
+            await executor.run(lambda: "late")
+
+        waiting = executor.stats()["waiting"]
+        release.set()
+        await running
+        # A vaga liberada volta a ser usada normalmente
+        return error.value.retry_after, waiting, await executor.run(lambda: "ok")
+
+    retry_after, waiting, result = asyncio.run(scenario())
+
+    assert retry_after == 1
+    assert waiting == 0
+    assert result == "ok"
+
+class BlockingLogIn(LogInPortIn):
+    def __init__(self):
+        self.release = threading.Event()
+
+    def log_in(self, user):
+        self.release.wait()
+        return {"message": "Usuário logado com sucesso."}
+
+def test_log_in_returns_503_with_retry_after_when_password_pool_is_overloaded():
+    port_in = BlockingLogIn()
+    executor = BoundedExecutor(max_workers=1, max_pending=0, max_wait=2)
+    app.dependency_overrides[get_log_in_adapter_in] = lambda: port_in
+    app.dependency_overrides[get_password_executor] = lambda: executor
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            body = {"login": "user", "password": "secret"}
+            first = asyncio.create_task(client.post("/user/log-in/", json=body))
+            await _wait_until(lambda: executor.stats()["submitted"] == 1)
+            second = await client.post("/user/log-in/", json=body)
+            port_in.release.set()
+            return await first, second
+
+    try:
+        first, second = asyncio.run(scenario())
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert second.status_code == 503
+    assert second.headers["Retry-After"] == "2"
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+from app.domain.exceptions.dataprocessing.cache_exceptions import CorruptedCacheError
+from app.domain.services.dataprocessing.cache_service import CacheService
+from app.shared.config import settings
+
+URL = "http://embrapa.test/index.php?opcao=opt_02"
+
+OLD_DF = pd.DataFrame({"id": [1, 2], "product": ["Tinto", "Branco"], "production": [10.0, 5.0]})
+NEW_DF = pd.DataFrame({"id": [1, 2], "product": ["Tinto", "Branco"], "production": [11.0, 5.0]})
+
+@pytest.fixture(params=["csv", "feather", "parquet"])
+def cache_format(request, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "CACHE_FOLDER", str(tmp_path))
+    monkeypatch.setattr(settings, "CACHE_FORMAT", request.param)
+    return request.param
+
+def _save(service: CacheService, df: pd.DataFrame, chunked: bool) -> str:
+    if chunked:
+        return service.save_dataset_chunks_to_cache(url=URL, chunks=[df.iloc[:1], df.iloc[1:]])
+    return service.save_dataset_to_cache(url=URL, df=df)
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_round_trip(cache_format, chunked):
+    service = CacheService()
+
+    file_path = _save(service, NEW_DF, chunked)
+
+    assert service.is_cache_valid(file_path)
+    pd.testing.assert_frame_equal(service.read_dataset_from_cache(file_path), NEW_DF)
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_old_file_is_rejected_after_new_manifest(cache_format, chunked, monkeypatch):
+    service = CacheService()
+    file_path = _save(service, OLD_DF, chunked)
+
+    # Simula a queda do processo depois da gravação do manifesto e antes da troca do arquivo
+    def crash(tmp_path, target_path):
+        if target_path == file_path:
+            raise OSError("queda simulada")
+        return original_commit(tmp_path, target_path)
+
+    original_commit = service._commit_file
+    monkeypatch.setattr(service, "_commit_file", crash)
+    with pytest.raises(OSError):
+        _save(service, NEW_DF, chunked)
+
+    # Mesmo tamanho e quantidade de linhas: só a conferência com o manifesto recusa o arquivo antigo
+    with pytest.raises(CorruptedCacheError):
+        service.read_dataset_from_cache(file_path)
+
+    monkeypatch.setattr(service, "_commit_file", original_commit)
+    _save(service, NEW_DF, chunked)
+    pd.testing.assert_frame_equal(service.read_dataset_from_cache(file_path), NEW_DF)
@@ -0,0 +1,33 @@
+import asyncio
+from app.shared import dependencies
+from app.shared.container import Container
+
+def _resolve(getter):
+    return asyncio.run(getter())
+
+def test_getters_return_the_same_instances_on_every_call():
+    getters = [
+        dependencies.get_embrapa_executor,
+        dependencies.get_response_cache,
+        dependencies.get_token_cache,
+        dependencies.get_embrapa_service,
+        dependencies.get_production_adapter_in,
+        dependencies.get_log_in_adapter_in,
+    ]
+
+    for getter in getters:
+        assert _resolve(getter) is _resolve(getter)
+
+def test_services_share_the_container_resources():
+    container = dependencies.container
+
+    assert container.jwt_service.token_cache is container.token_cache
+    assert container.embrapa_adapter.service is container.embrapa_service
+    assert container.production_service.embrapa_port is container.embrapa_adapter
+    assert container.refresh_scheduler_service.executor is container.embrapa_executor
+
+def test_each_container_builds_its_own_graph():
+    other = Container()
+
+    assert other.token_cache is not dependencies.container.token_cache
+    assert other.jwt_service.token_cache is other.token_cache
@@ -0,0 +1,79 @@
+import pytest
+import pandas as pd
+from app.domain.models.entities.embrapa.production import ProductionCategoryEnum, ProductionEntity
+from app.domain.services.dataprocessing.csv_service import CSVService
+from app.shared.config import settings
+
+CSV_CONTENT = (
+    "id;control;produto;1970;1971;1972\n"
+    "1;vm_Tinto;Tinto;10;;nd\n"
+    "2;vm_Branco;;5;6;7\n"
+    "3;vm_Rosado;Rosado;;;\n"
+    ";vm_Espumante;Espumante;1;1;1\n"
+)
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "production.csv"
+    path.write_text(CSV_CONTENT, encoding="utf-8")
+    return str(path)
+
+def _process(csv_file):
+    df = CSVService().process_csv_data(
+        file_path=csv_file,
+        model=ProductionEntity,
+        category_enum=ProductionCategoryEnum,
+        value_name_column="production"
+    )
+    return {(row["control"], row["year"]): row for row in df.to_dict(orient="records")}
+
+def test_empty_year_cell_is_kept_as_zero(csv_file):
+    rows = _process(csv_file)
+
+    assert rows[("vm_Tinto", 1970)]["production"] == 10.0
+    assert rows[("vm_Tinto", 1971)]["production"] == 0.0
+    # Marcadores de nulo continuam descartados
+    assert ("vm_Tinto", 1972) not in rows
+
+def test_row_with_all_years_empty_is_kept_with_zeros(csv_file):
+    rows = _process(csv_file)
+
+    assert [rows[("vm_Rosado", year)]["production"] for year in (1970, 1971, 1972)] == [0.0, 0.0, 0.0]
+
+def test_empty_id_cell_is_filled_with_zero(csv_file):
+    rows = _process(csv_file)
+
+    assert rows[("vm_Espumante", 1970)]["id"] == 0
+
+def test_empty_text_cell_is_filled_with_zero(csv_file):
+    rows = _process(csv_file)
+
+    assert [rows[("vm_Branco", year)]["product"] for year in (1970, 1971, 1972)] == ["0", "0", "0"]
+    assert rows[("vm_Branco", 1970)]["category"] == ProductionCategoryEnum.VM.value
+
+def test_chunked_processing_matches_single_pass(csv_file):
+    service = CSVService()
+    chunks = service.iter_csv_data_chunks(
+        file_path=csv_file,
+        model=ProductionEntity,
+        category_enum=ProductionCategoryEnum,
+        value_name_column="production",
+        chunk_rows=1
+    )
+
+    chunked = {(row["control"], row["year"]): row for chunk in chunks for row in chunk.to_dict(orient="records")}
+    assert chunked == _process(csv_file)
+
+def test_process_pool_matches_thread_and_is_shut_down(csv_file, monkeypatch):
+    monkeypatch.setattr(settings, "CSV_PROCESS_POOL_SIZE", 1)
+    service = CSVService()
+    kwargs = dict(file_path=csv_file, model=ProductionEntity, category_enum=ProductionCategoryEnum, value_name_column="production")
+
+    try:
+        pooled = service.process_csv_data_in_pool(**kwargs)
+        assert CSVService._process_pool is not None
+    finally:
+        service.shutdown_process_pool()
+
+    assert CSVService._process_pool is None
+    pd.testing.assert_frame_equal(pooled, service.process_csv_data(**kwargs))
@@ -0,0 +1,167 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from starlette.exceptions import HTTPException
+from app.domain.models.entities.embrapa.embrapa_dataset import PRODUCTION_DATASET
+from app.domain.models.entities.embrapa.production import ProductionEntity
+from app.domain.services.dataprocessing.dataset_index import DatasetIndex
+from app.domain.services.embrapa.embrapa_query_service import EmbrapaQueryService
+from app.shared.dto.embrapa.aggregation_dto import AggregationQueryDTO
+from app.shared.dto.embrapa.filter_dto import FilterDTO
+from app.shared.dto.embrapa.page_dto import PageDTO
+from app.shared.util.response_cache import dump_json
+
+URL = "http://embrapa.test/index.php?opcao=opt_02"
+
+def _dataset(rows):
+    return pd.DataFrame(
+        [
+            {"id": row_id, "control": "vm_Tinto", "product": "Tinto", "category": "Vinho de Mesa", "year": year, "production": 1.0}
+            for row_id, year in rows
+        ]
+    )
+
+class FakeEmbrapaPort:
+    """
+    Porta de saída com o dataset em memória, trocado pelo teste para simular uma atualização.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+    def get_csv_data(self, **kwargs) -> pd.DataFrame:
+        return self.df
+
+    def get_dataset_index(self, url, model, df) -> DatasetIndex:
+        return DatasetIndex(df)
+
+    def get_dataset_version(self, url, model):
+        return None
+
+    def get_last_changed_upstream(self, url):
+        return None
+
+def _products(rows):
+    return pd.DataFrame(
+        [
+            {"id": row_id, "control": control, "product": product, "category": category, "year": year, "production": production}
+            for row_id, (control, product, category, year, production) in enumerate(rows, start=1)
+        ]
+    )
+
+PRODUCTS = _products([
+    ("vm_Tinto", "Tinto", "Vinho de Mesa", 1970, 6.0),
+    ("vm_Branco", "Branco", "Vinho de Mesa", 1970, 4.0),
+    ("vm_Tinto", "Tinto", "Vinho de Mesa", 1971, 10.0),
+    ("vm_Branco", "Branco", "Vinho de Mesa", 1971, 5.0),
+    ("vm_Tinto", "Tinto", "Vinho de Mesa", 1972, 12.0),
+    ("ve_Espumante", "Espumante", "Vinho Especial", 1974, 20.0),
+])
+
+def _keys(page):
+    return [(item.year, item.id) for item in page.items]
+
+def test_cursor_continues_after_last_key():
+    service = EmbrapaQueryService(embrapa_port=FakeEmbrapaPort(_dataset([(1, 1970), (2, 1970), (1, 1971), (2, 1971)])))
+
+    first = service.get_page(url=URL, dataset=PRODUCTION_DATASET, page=1, page_size=2)
+    second = service.get_page(url=URL, dataset=PRODUCTION_DATASET, page=1, page_size=2, cursor=first.next_cursor)
+
+    assert _keys(first) == [(1970, 1), (1970, 2)]
+    assert _keys(second) == [(1971, 1), (1971, 2)]
+    assert second.next_cursor is None
+    assert not second.dataset_changed
+
+def test_cursor_from_previous_version_flags_dataset_changed():
+    port = FakeEmbrapaPort(_dataset([(1, 1970), (2, 1970), (1, 1971), (2, 1971)]))
+    service = EmbrapaQueryService(embrapa_port=port)
+    first = service.get_page(url=URL, dataset=PRODUCTION_DATASET, page=1, page_size=2)
+
+    # Uma linha nova antes da chave do cursor não é entregue; a resposta avisa a mudança
+    port.df = _dataset([(0, 1970), (1, 1970), (2, 1970), (1, 1971), (2, 1971)])
+    second = service.get_page(url=URL, dataset=PRODUCTION_DATASET, page=1, page_size=2, cursor=first.next_cursor)
+
+    assert _keys(second) == [(1971, 1), (1971, 2)]
+    assert second.dataset_changed
+
+def test_paginate_matches_one_model_per_row():
+    df = _dataset([(1, 1970), (2, 1970), (3, 1971)])
+    df.loc[1, "production"] = 2.5
+    positions = np.array([2, 0, 1])
+
+    page = EmbrapaQueryService.paginate(df=df, model=ProductionEntity, positions=positions, total=3, page=1, page_size=3)
+
+    items = [ProductionEntity(**record) for record in df.iloc[positions].to_dict(orient="records")]
+    expected = PageDTO[ProductionEntity](items=items, total=3, page=1, page_size=3, pages=1)
+    assert json.loads(dump_json(page)) == json.loads(expected.model_dump_json())
+    assert dump_json(page) == expected.model_dump_json().encode("utf-8")
+
+def _aggregate(query: AggregationQueryDTO, df: pd.DataFrame = PRODUCTS):
+    service = EmbrapaQueryService(embrapa_port=FakeEmbrapaPort(df))
+    return service.get_aggregation(url=URL, dataset=PRODUCTION_DATASET, query=query)
+
+def test_yoy_compares_consecutive_years():
+    result = _aggregate(AggregationQueryDTO(group_by=["year"], yoy=True))
+
+    assert result.items == [
+        {"year": 1970, "value": 10.0, "yoy": None, "yoy_pct": None},
+        {"year": 1971, "value": 15.0, "yoy": 5.0, "yoy_pct": 50.0},
+        {"year": 1972, "value": 12.0, "yoy": -3.0, "yoy_pct": -20.0},
+        # 1973 não existe: sem ano anterior, sem variação
+        {"year": 1974, "value": 20.0, "yoy": None, "yoy_pct": None},
+    ]
+
+def test_yoy_is_computed_per_group():
+    result = _aggregate(AggregationQueryDTO(group_by=["product", "year"], yoy=True))
+
+    branco = [item for item in result.items if item["product"] == "Branco"]
+    assert [(item["year"], item["yoy"], item["yoy_pct"]) for item in branco] == [(1970, None, None), (1971, 1.0, 25.0)]
+
+def test_top_returns_largest_groups_in_descending_order():
+    result = _aggregate(AggregationQueryDTO(group_by=["product"], top=2))
+
+    assert [(item["product"], item["value"]) for item in result.items] == [("Tinto", 28.0), ("Espumante", 20.0)]
+    # O total conta todos os grupos, não apenas os retornados
+    assert result.total == 3
+
+def test_unknown_dimension_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        _aggregate(AggregationQueryDTO(group_by=["year", "id"]))
+
+    assert error.value.status_code == 400
+    assert "['id']" in error.value.detail
+
+def test_yoy_without_year_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        _aggregate(AggregationQueryDTO(group_by=["product"], yoy=True))
+
+    assert error.value.status_code == 400
+
+def _filtered_ids(**filters):
+    service = EmbrapaQueryService(embrapa_port=FakeEmbrapaPort(PRODUCTS))
+    page = service.get_page(url=URL, dataset=PRODUCTION_DATASET, page=1, page_size=100, filters=FilterDTO(**filters))
+    assert page.total == len(page.items)
+    return [item.id for item in page.items]
+
+def test_filter_by_year_range_is_inclusive():
+    assert _filtered_ids(year_from=1971, year_to=1972) == [3, 4, 5]
+    assert _filtered_ids(year_from=1972) == [5, 6]
+    assert _filtered_ids(year_to=1970) == [1, 2]
+    assert _filtered_ids(year_from=1973, year_to=1973) == []
+
+def test_filter_by_product_ignores_case_and_spaces():
+    assert _filtered_ids(product="tinto") == [1, 3, 5]
+    assert _filtered_ids(product=" BRANCO ") == [2, 4]
+    assert _filtered_ids(product="Tint") == []
+
+def test_filter_by_category():
+    assert _filtered_ids(category="vinho especial") == [6]
+
+def test_filter_by_control_prefix():
+    assert _filtered_ids(control="VM_") == [1, 2, 3, 4, 5]
+    assert _filtered_ids(control="vm_b") == [2, 4]
+    assert _filtered_ids(control="xx") == []
+
+def test_filters_are_combined():
+    assert _filtered_ids(control="vm_", year_from=1971, product="Tinto") == [3, 5]
@@ -0,0 +1,107 @@
+import asyncio
+import gzip
+import io
+import json
+import httpx
+import pandas as pd
+import pytest
+from app.domain.services.embrapa.production_service import ProductionService
+from app.infrastructure.adapters.input.embrapa.production_adapter_in import ProductionAdapterIn
+from app.main import app
+from app.shared.config import settings
+from app.shared.dependencies import get_jwt_adapter_in, get_production_adapter_in
+from tests.test_embrapa_query_service import PRODUCTS, FakeEmbrapaPort
+
+class FakeJWTAdapter:
+    """
+    Autenticação que aceita qualquer token com qualquer permissão.
+    """
+
+    def validate_token(self, token, endpoint_permission):
+        return {"sub": "teste"}
+
+@pytest.fixture
+def client_get(monkeypatch):
+    # Partes pequenas para que a exportação atravesse várias partes
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_ROWS", 2)
+    adapter = ProductionAdapterIn(service=ProductionService(embrapa_port=FakeEmbrapaPort(PRODUCTS)))
+    app.dependency_overrides[get_production_adapter_in] = lambda: adapter
+    app.dependency_overrides[get_jwt_adapter_in] = lambda: FakeJWTAdapter()
+
+    def get(path: str, **params) -> httpx.Response:
+        async def scenario():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.get(path, params=params, headers={"Authorization": "Bearer teste"})
+
+        return asyncio.run(scenario())
+
+    yield get
+    app.dependency_overrides.clear()
+
+def test_aggregate_returns_yoy_per_year(client_get):
+    response = client_get("/info/production/aggregate", group_by="year", yoy="true")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["group_by"] == ["year"]
+    assert body["value_column"] == "production"
+    assert [(item["year"], item["yoy"]) for item in body["items"]] == [(1970, None), (1971, 5.0), (1972, -3.0), (1974, None)]
+
+def test_aggregate_top_orders_by_value(client_get):
+    response = client_get("/info/production/aggregate", group_by="category", top="1")
+
+    assert response.json()["items"] == [{"category": "Vinho de Mesa", "value": 37.0}]
+
+def test_aggregate_rejects_unknown_dimension(client_get):
+    response = client_get("/info/production/aggregate", group_by="id")
+
+    assert response.status_code == 400
+
+def test_aggregate_rejects_yoy_without_year(client_get):
+    response = client_get("/info/production/aggregate", group_by="product", yoy="true")
+
+    assert response.status_code == 400
+    assert "year" in response.json()["detail"]
+
+def _exported_keys(df: pd.DataFrame):
+    return list(zip(df["year"], df["id"]))
+
+def test_export_ndjson(client_get):
+    response = client_get("/info/production/export", format="ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="production.ndjson"'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == json.loads(PRODUCTS.to_json(orient="records"))
+
+def test_export_csv_writes_header_once(client_get):
+    response = client_get("/info/production/export", format="csv")
+
+    assert response.headers["content-disposition"] == 'attachment; filename="production.csv"'
+    assert response.text.count("id,control,product") == 1
+    pd.testing.assert_frame_equal(pd.read_csv(io.StringIO(response.text)), PRODUCTS)
+
+def test_export_parquet(client_get):
+    response = client_get("/info/production/export", format="parquet")
+
+    assert response.headers["content-disposition"] == 'attachment; filename="production.parquet"'
+    pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(response.content)), PRODUCTS)
+
+def test_export_applies_filters(client_get):
+    response = client_get("/info/production/export", format="csv", product="TINTO", year_from="1971")
+
+    assert _exported_keys(pd.read_csv(io.StringIO(response.text))) == [(1971, 3), (1972, 5)]
+
+def test_export_gzip_is_a_valid_stream(client_get):
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            params = {"format": "ndjson", "gzip": "true"}
+            async with client.stream("GET", "/info/production/export", params=params, headers={"Authorization": "Bearer teste"}) as response:
+                return response.headers, b"".join([chunk async for chunk in response.aiter_raw()])
+
+    headers, raw = asyncio.run(scenario())
+
+    assert headers["content-encoding"] == "gzip"
+    rows = [json.loads(line) for line in gzip.decompress(raw).decode("utf-8").splitlines()]
+    assert len(rows) == len(PRODUCTS)
@@ -0,0 +1,229 @@
+import email.utils
+import hashlib
+import http.server
+import os
+import threading
+import time
+import pytest
+from starlette.exceptions import HTTPException
+from app.domain.models.entities.embrapa.production import ProductionCategoryEnum, ProductionEntity
+from app.domain.services.dataprocessing.cache_service import CacheService
+from app.domain.services.dataprocessing.csv_service import CSVService
+from app.domain.services.dataprocessing.dataset_cache_service import DatasetCacheService
+from app.domain.services.embrapa.embrapa_service import EmbrapaService
+from app.infrastructure.adapters.output.dataprocessing.cache_adapter_out import CacheAdapterOut
+from app.infrastructure.adapters.output.dataprocessing.csv_adapter_out import CSVAdapterOut
+from app.infrastructure.adapters.output.dataprocessing.dataset_cache_adapter_out import DatasetCacheAdapterOut
+from app.infrastructure.adapters.output.http.http_adapter_out import HttpAdapterOut
+from app.shared.config import settings
+
+CSV_CONTENT = (
+    "id;control;produto;1970;1971\n"
+    "1;vm_Tinto;Tinto;10;20\n"
+    "2;vm_Branco;Branco;5;6\n"
+).encode("utf-8")
+
+class EmbrapaStub(http.server.ThreadingHTTPServer):
+    """
+    Servidor HTTP local que imita a página e o download de CSV da Embrapa.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), EmbrapaStubHandler)
+        self.files = {"Producao.csv": CSV_CONTENT}
+        self.link = "Producao.csv"
+        self.send_validators = True
+        self.requests = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, path: str, status: int) -> int:
+        return sum(1 for request in self.requests if request["path"] == path and request["status"] == status)
+
+class EmbrapaStubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        stub = self.server
+        if self.path.startswith("/index.php"):
+            anchor = f'<a href="download/{stub.link}" class="footer_content"><span>DOWNLOAD</span></a>' if stub.link else ""
+            body = f"<html>{anchor}</html>".encode("utf-8")
+            self._reply(200, body)
+        elif self.path.startswith("/download/") and self.path[len("/download/"):] in stub.files:
+            content = stub.files[self.path[len("/download/"):]]
+            etag = '"' + hashlib.md5(content).hexdigest() + '"'
+            headers = {}
+            if stub.send_validators:
+                headers = {"ETag": etag, "Last-Modified": email.utils.formatdate(0, usegmt=True)}
+            if stub.send_validators and self.headers.get("If-None-Match") == etag:
+                self._reply(304, b"", headers)
+            else:
+                self._reply(200, content, headers)
+        else:
+            self._reply(404, b"")
+
+    def _reply(self, status: int, body: bytes, headers: dict = None):
+        self.server.requests.append({"path": self.path, "status": status, "headers": dict(self.headers)})
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class CountingCSVAdapter(CSVAdapterOut):
+    """
+    Adapter de CSV que conta quantas vezes o CSV foi processado.
+    """
+
+    def __init__(self):
+        super().__init__(service=CSVService())
+        self.calls = 0
+
+    def process_csv_in_pool(self, *args, **kwargs):
+        self.calls += 1
+        return super().process_csv_in_pool(*args, **kwargs)
+
+    def process_csv_in_chunks(self, *args, **kwargs):
+        self.calls += 1
+        return super().process_csv_in_chunks(*args, **kwargs)
+
+@pytest.fixture
+def stub(monkeypatch, tmp_path):
+    server = EmbrapaStub()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(settings, "EMBRAPA_BASE_URL", server.base_url)
+    monkeypatch.setattr(settings, "CACHE_FOLDER", str(tmp_path))
+    monkeypatch.setattr(settings, "CSV_PROCESS_POOL_SIZE", 0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def csv_adapter():
+    return CountingCSVAdapter()
+
+@pytest.fixture
+def service(csv_adapter):
+    return EmbrapaService(
+        cache_port=CacheAdapterOut(service=CacheService()),
+        csv_port=csv_adapter,
+        dataset_cache_port=DatasetCacheAdapterOut(service=DatasetCacheService()),
+        http_port=HttpAdapterOut()
+    )
+
+def _page_url(stub: EmbrapaStub) -> str:
+    return f"{stub.base_url}/index.php?opcao=opt_02"
+
+def _get(service: EmbrapaService, url: str):
+    return service.get_csv_data(url=url, model=ProductionEntity, category_enum=ProductionCategoryEnum, value_name_column="production")
+
+def _refresh(service: EmbrapaService, url: str):
+    # Envelhece o cache para que a atualização não reaproveite o arquivo recém-gravado
+    file_path = service.cache_port.get_cache_file_path(url=url)
+    os.utime(file_path, (time.time() - 60, time.time() - 60))
+    return service.refresh_csv_data(url=url, model=ProductionEntity, category_enum=ProductionCategoryEnum, value_name_column="production")
+
+def test_fetch_downloads_processes_and_caches_csv(stub, service, csv_adapter):
+    url = _page_url(stub)
+
+    df = _get(service, url)
+
+    assert sorted(df["production"].tolist()) == [5.0, 6.0, 10.0, 20.0]
+    assert stub.count("/download/Producao.csv", 200) == 1
+    assert csv_adapter.calls == 1
+
+    manifest = service.cache_port.get_cache_manifest(service.cache_port.get_cache_file_path(url=url))
+    assert manifest.etag == '"' + hashlib.md5(CSV_CONTENT).hexdigest() + '"'
+    assert manifest.source_checksum == hashlib.sha256(CSV_CONTENT).hexdigest()
+
+    # A segunda leitura vem do cache, sem acessar a Embrapa
+    _get(service, url)
+    assert len(stub.requests) == 2
+
+def test_not_modified_renews_manifest_without_processing(stub, service, csv_adapter):
+    url = _page_url(stub)
+    _get(service, url)
+    file_path = service.cache_port.get_cache_file_path(url=url)
+    manifest = service.cache_port.get_cache_manifest(file_path)
+
+    df = _refresh(service, url)
+
+    conditional = stub.requests[-1]
+    assert conditional["status"] == 304
+    assert conditional["headers"]["If-None-Match"] == manifest.etag
+    assert conditional["headers"]["If-Modified-Since"] == manifest.last_modified
+    assert csv_adapter.calls == 1
+    assert len(df) == 4
+
+    renewed = service.cache_port.get_cache_manifest(file_path)
+    assert renewed.fetched_at > manifest.fetched_at
+    assert service.cache_port.get_cache_mtime(file_path) > time.time() - 60
+
+def test_missing_download_link_is_resolved_again(stub, service, csv_adapter):
+    url = _page_url(stub)
+    _get(service, url)
+
+    # A Embrapa passa a publicar o arquivo em outro endereço, com outro conteúdo
+    stub.files = {"Producao_2.csv": CSV_CONTENT.replace(b";10;", b";11;")}
+    stub.link = "Producao_2.csv"
+
+    df = _refresh(service, url)
+
+    assert stub.count("/download/Producao.csv", 404) == 1
+    assert stub.count("/index.php?opcao=opt_02", 200) == 2
+    assert stub.count("/download/Producao_2.csv", 200) == 1
+    assert sorted(df["production"].tolist()) == [5.0, 6.0, 11.0, 20.0]
+    assert service.cache_port.get_download_link(url=url).endswith("/download/Producao_2.csv")
+
+def test_missing_download_link_is_discarded_when_page_has_no_link(stub, service):
+    url = _page_url(stub)
+    _get(service, url)
+
+    # O arquivo some e a página deixa de publicar o link
+    stub.files = {}
+    stub.link = None
+
+    with pytest.raises(HTTPException) as error:
+        _refresh(service, url)
+
+    assert error.value.status_code == 404
+
+    # O link morto não fica guardado para as próximas tentativas
+    assert service.cache_port.get_download_link(url=url) is None
+    assert stub.count("/download/Producao.csv", 404) == 1
+
+def test_unchanged_source_checksum_skips_rewrite(stub, service, csv_adapter):
+    stub.send_validators = False
+    url = _page_url(stub)
+    _get(service, url)
+    file_path = service.cache_port.get_cache_file_path(url=url)
+    inode = os.stat(file_path).st_ino
+
+    df = _refresh(service, url)
+
+    # Sem validadores a Embrapa responde 200, mas os bytes são os mesmos
+    assert stub.count("/download/Producao.csv", 200) == 2
+    assert "If-None-Match" not in stub.requests[-1]["headers"]
+    assert csv_adapter.calls == 1
+    assert os.stat(file_path).st_ino == inode
+    assert len(df) == 4
+
+def test_in_memory_dataset_skips_manifest_validation(stub, service, monkeypatch):
+    url = _page_url(stub)
+    df = _get(service, url)
+
+    validations = []
+    monkeypatch.setattr(service.cache_port, "is_cache_valid", lambda file_path: validations.append(file_path) or True)
+    monkeypatch.setattr(service.cache_port, "get_cache_manifest", lambda file_path: validations.append(file_path))
+
+    # Com o arquivo inalterado, basta o stat e a busca em memória
+    assert _get(service, url) is df
+    assert validations == []
+    assert len(stub.requests) == 2
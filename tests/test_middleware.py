@@ -0,0 +1,60 @@
+import asyncio
+from types import SimpleNamespace
+import httpx
+from fastapi import FastAPI, Request
+from app.shared.middleware import setup_middleware
+from app.shared.util.rate_limiter import MemoryRateLimitBackend, RateLimiter
+from app.shared.util.token_cache import TokenCache
+
+def _create_app(limit: int = 100) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"request_id": request.state.request_id}
+
+    container = SimpleNamespace(
+        rate_limiter=RateLimiter(backend=MemoryRateLimitBackend(max_keys=1024, idle_ttl=60.0), limit=limit, window=60.0, route_limits={}),
+        token_cache=TokenCache(secret_key="secret", algorithm="HS256", max_entries=16, ttl=60, max_token_age=60)
+    )
+    setup_middleware(app, container)
+    return app
+
+def _get(app: FastAPI, count: int = 1, headers: dict = None):
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return [await client.get("/ping", headers=headers) for _ in range(count)]
+
+    return asyncio.run(scenario())
+
+def _header_names(response: httpx.Response):
+    return [name.decode("latin-1").lower() for name, _ in response.headers.raw]
+
+def test_headers_are_written_from_inner_to_outer_middleware():
+    response, = _get(_create_app())
+
+    names = _header_names(response)
+    assert response.status_code == 200
+    # O Timing envolve o rate limiting e o RequestId, o mais externo, envolve os dois
+    assert names[-2:] == ["server-timing", "x-request-id"]
+    assert response.headers["Server-Timing"].startswith("app;dur=")
+
+def test_rate_limited_response_also_gets_timing_and_request_id():
+    responses = _get(_create_app(limit=1), count=2, headers={"X-Request-ID": "abc-123"})
+
+    limited = responses[-1]
+    assert limited.status_code == 429
+    assert "retry-after" in _header_names(limited)
+    assert _header_names(limited)[-2:] == ["server-timing", "x-request-id"]
+    assert limited.headers["X-Request-ID"] == "abc-123"
+
+def test_request_id_is_kept_when_valid_and_replaced_otherwise():
+    app = _create_app()
+
+    kept, = _get(app, headers={"X-Request-ID": "abc-123"})
+    replaced, = _get(app, headers={"X-Request-ID": "invalid request id"})
+
+    assert kept.headers["X-Request-ID"] == "abc-123"
+    assert kept.json() == {"request_id": "abc-123"}
+    assert replaced.headers["X-Request-ID"] != "invalid request id"
+    assert replaced.json() == {"request_id": replaced.headers["X-Request-ID"]}
@@ -0,0 +1,84 @@
+import pytest
+from app.application.ports.output.iam.db.local_db_port_out import LocalDBPortOut
+from app.domain.exceptions.iam.db.db_exceptions import InvalidPasswordError, UserNotFoundError
+from app.domain.models.entities.iam.user import UserEntity
+from app.domain.services.iam.auth.password_hash_service import PasswordHashService
+from app.domain.services.iam.auth.permissions_service import PermissionsService
+from app.infrastructure.adapters.output.iam.auth.password_hash_adapter_out import PasswordHashAdapterOut
+
+# Custo mínimo do bcrypt, para manter os testes rápidos
+ROUNDS = 4
+
+class FakeLocalDB(LocalDBPortOut):
+    """
+    Cadastro de usuários em memória que registra as trocas de senha.
+    """
+
+    def __init__(self, users):
+        self.users = {user.login: user for user in users}
+        self.updated = []
+
+    def get_user(self, user):
+        return self.users.get(user.login)
+
+    def update_password(self, login, password_hash):
+        self.updated.append(login)
+        self.users[login] = self.users[login].model_copy(update={"password": password_hash})
+
+def _user(login: str, password: str) -> UserEntity:
+    return UserEntity(login=login, password=password, first_name="", last_name="", permissions=["info_production"])
+
+def test_hash_and_verify():
+    service = PasswordHashService(rounds=ROUNDS)
+
+    password_hash = service.hash_password("s3nha")
+
+    assert password_hash.startswith(f"$2b$0{ROUNDS}$")
+    assert service.verify_password("s3nha", password_hash)
+    assert not service.verify_password("outra", password_hash)
+
+def test_passwords_longer_than_72_bytes_are_fully_compared():
+    service = PasswordHashService(rounds=ROUNDS)
+    password = "a" * 100
+
+    password_hash = service.hash_password(password)
+
+    assert service.verify_password(password, password_hash)
+    # Sem o SHA-256 prévio, o bcrypt ignoraria a diferença depois do 72º byte
+    assert not service.verify_password("a" * 99 + "b", password_hash)
+
+@pytest.mark.parametrize("password_hash", ["", "texto-puro", "$2b$04$curto", "$2b$04$çç"])
+def test_malformed_hash_does_not_verify(password_hash):
+    assert not PasswordHashService(rounds=ROUNDS).verify_password("s3nha", password_hash)
+
+def test_needs_rehash_when_cost_changes():
+    password_hash = PasswordHashService(rounds=ROUNDS).hash_password("s3nha")
+
+    assert not PasswordHashService(rounds=ROUNDS).needs_rehash(password_hash)
+    assert PasswordHashService(rounds=ROUNDS + 1).needs_rehash(password_hash)
+    assert PasswordHashService(rounds=ROUNDS).needs_rehash("texto-puro")
+
+def _permissions_service(db: FakeLocalDB, rounds: int) -> PermissionsService:
+    return PermissionsService(local_db_port=db, password_hash_port=PasswordHashAdapterOut(service=PasswordHashService(rounds=rounds)))
+
+def test_login_rehashes_password_generated_with_other_cost():
+    db = FakeLocalDB([_user("ana", PasswordHashService(rounds=ROUNDS).hash_password("s3nha"))])
+
+    _permissions_service(db, rounds=ROUNDS).validate_user(_user("ana", "s3nha"))
+    assert db.updated == []
+
+    _permissions_service(db, rounds=ROUNDS + 1).validate_user(_user("ana", "s3nha"))
+    assert db.updated == ["ana"]
+    assert db.users["ana"].password.startswith(f"$2b$0{ROUNDS + 1}$")
+    assert PasswordHashService(rounds=ROUNDS + 1).verify_password("s3nha", db.users["ana"].password)
+
+def test_login_rejects_wrong_password_and_unknown_user():
+    db = FakeLocalDB([_user("ana", PasswordHashService(rounds=ROUNDS).hash_password("s3nha"))])
+    service = _permissions_service(db, rounds=ROUNDS + 1)
+
+    with pytest.raises(InvalidPasswordError):
+        service.validate_user(_user("ana", "errada"))
+    with pytest.raises(UserNotFoundError):
+        service.validate_user(_user("bia", "s3nha"))
+    # Senha errada não troca o hash
+    assert db.updated == []
@@ -0,0 +1,93 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from app.shared.middleware import RateLimiterMiddleware
+from app.shared.util import rate_limiter as rate_limiter_module
+from app.shared.util.rate_limiter import MemoryRateLimitBackend, RateLimiter, SharedMemoryRateLimitBackend
+from app.shared.util.token_cache import TokenCache
+
+class FakeClock:
+    """
+    Relógio controlado pelo teste, no lugar de `time.monotonic` e `time.time`.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    return clock
+
+@pytest.fixture(params=["memory", "shared"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRateLimitBackend(max_keys=1024, idle_ttl=60.0)
+    return SharedMemoryRateLimitBackend(path=str(tmp_path / "rate_limit.bin"), max_keys=1024, idle_ttl=60.0)
+
+def test_bucket_empties_and_refills(backend, clock):
+    decisions = [backend.hit("user:a|*", limit=4, window=1.0) for _ in range(5)]
+
+    assert [decision.allowed for decision in decisions] == [True, True, True, True, False]
+    assert [decision.remaining for decision in decisions] == [3, 2, 1, 0, 0]
+    # 4 fichas por segundo: a próxima chega em 0,25 s
+    assert decisions[-1].retry_after == pytest.approx(0.25)
+
+    clock.now += 0.25
+    assert backend.hit("user:a|*", limit=4, window=1.0).allowed
+    assert not backend.hit("user:a|*", limit=4, window=1.0).allowed
+
+    # Parado por uma janela inteira, o balde volta cheio (e não passa da capacidade)
+    clock.now += 10.0
+    assert [backend.hit("user:a|*", limit=4, window=1.0).allowed for _ in range(5)] == [True, True, True, True, False]
+
+def test_buckets_are_independent_per_key(backend, clock):
+    for _ in range(2):
+        backend.hit("user:a|*", limit=2, window=60.0)
+
+    assert not backend.hit("user:a|*", limit=2, window=60.0).allowed
+    assert backend.hit("user:b|*", limit=2, window=60.0).allowed
+
+def test_route_limit_uses_longest_prefix(clock):
+    limiter = RateLimiter(
+        backend=MemoryRateLimitBackend(max_keys=1024, idle_ttl=60.0),
+        limit=100,
+        window=60.0,
+        route_limits={"/user": 50, "/user/log-in": 1}
+    )
+
+    assert limiter.hit("ip:1", "/user/log-in/").allowed
+    assert not limiter.hit("ip:1", "/user/log-in/").allowed
+    # As demais rotas usam outros baldes
+    assert limiter.hit("ip:1", "/user/sign-up/").limit == 50
+    assert limiter.hit("ip:1", "/info/production/").limit == 100
+
+def test_middleware_responds_429_with_retry_after(backend, clock):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    limiter = RateLimiter(backend=backend, limit=2, window=60.0, route_limits={})
+    token_cache = TokenCache(secret_key="secret", algorithm="HS256", max_entries=16, ttl=60, max_token_age=60)
+    app.add_middleware(RateLimiterMiddleware, rate_limiter=limiter, token_cache=token_cache)
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return [await client.get("/ping") for _ in range(3)]
+
+    responses = asyncio.run(scenario())
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    # Uma ficha a cada 30 s
+    assert responses[-1].headers["Retry-After"] == "30"
+    assert responses[-1].json() == {"detail": "Limite de requisições excedido. Tente novamente mais tarde."}
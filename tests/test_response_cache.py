@@ -0,0 +1,100 @@
+import asyncio
+import httpx
+from fastapi import FastAPI, Request
+from pydantic import BaseModel
+from app.shared.util.response_cache import ResponseCache
+
+class Item(BaseModel):
+    value: str
+
+class Dataset:
+    """
+    Dataset fictício: versão e conteúdo controlados pelo teste.
+    """
+
+    def __init__(self):
+        self.versions = ["v1"]
+        self.value = "a"
+        self.loads = 0
+
+    async def get_version(self):
+        # Cada consulta consome a próxima versão da lista (a última se repete)
+        return self.versions.pop(0) if len(self.versions) > 1 else self.versions[0]
+
+    async def get_data(self):
+        self.loads += 1
+        return Item(value=self.value * 10)
+
+def _build_app(response_cache: ResponseCache, dataset: Dataset) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request):
+        return await response_cache.serve(request, get_version=dataset.get_version, get_data=dataset.get_data)
+
+    return app
+
+def _get(app: FastAPI, *requests):
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return [await client.get(path, headers=headers) for path, headers in requests]
+
+    return asyncio.run(scenario())
+
+def test_response_has_etag_and_is_served_from_cache():
+    cache = ResponseCache(max_entries=8, max_bytes=1024, max_age=60)
+    dataset = Dataset()
+
+    first, second = _get(_build_app(cache, dataset), ("/items", {}), ("/items", {}))
+
+    assert first.status_code == 200
+    assert first.json() == {"value": "a" * 10}
+    assert first.headers["ETag"].startswith('"')
+    assert first.headers["Cache-Control"] == "public, max-age=60"
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert dataset.loads == 1
+
+def test_matching_if_none_match_returns_304():
+    cache = ResponseCache(max_entries=8, max_bytes=1024, max_age=60)
+    app = _build_app(cache, Dataset())
+    (first,) = _get(app, ("/items", {}))
+
+    not_modified, weak, other = _get(
+        app,
+        ("/items", {"If-None-Match": first.headers["ETag"]}),
+        ("/items", {"If-None-Match": '"x", W/' + first.headers["ETag"]}),
+        ("/items", {"If-None-Match": '"x"'}),
+    )
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == first.headers["ETag"]
+    assert weak.status_code == 304
+    assert other.status_code == 200
+
+def test_response_is_not_cached_when_version_changes_while_building():
+    cache = ResponseCache(max_entries=8, max_bytes=1024, max_age=60)
+    dataset = Dataset()
+    # O dataset muda entre a primeira e a segunda consulta da versão
+    dataset.versions = ["v1", "v2"]
+
+    _get(_build_app(cache, dataset), ("/items", {}))
+
+    assert cache.stats()["entries"] == 0
+
+    _get(_build_app(cache, dataset), ("/items", {}), ("/items", {}))
+    assert dataset.loads == 2
+    assert cache.stats()["entries"] == 1
+
+def test_oldest_responses_are_evicted_over_byte_budget():
+    body_size = len(b'{"value":"aaaaaaaaaa"}')
+    cache = ResponseCache(max_entries=8, max_bytes=2 * body_size, max_age=60)
+    dataset = Dataset()
+
+    _get(_build_app(cache, dataset), ("/items?page=1", {}), ("/items?page=2", {}), ("/items?page=3", {}), ("/items?page=1", {}))
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] == 2 * body_size
+    # A página 1 foi descartada ao guardar a página 3 e precisou ser montada de novo
+    assert dataset.loads == 4
@@ -0,0 +1,96 @@
+import time
+import jwt
+import pytest
+from app.shared.util import token_cache as token_cache_module
+from app.shared.util.token_cache import TokenCache
+
+SECRET = "secret"
+
+class FakeClock:
+    """
+    Relógio controlado pelo teste, no lugar de `time.time` do cache.
+
+    Começa uma hora no passado para que o `iat` dos tokens nunca fique à frente
+    do relógio real usado pelo `jwt.decode`.
+    """
+
+    def __init__(self):
+        self.now = time.time() - 3600
+
+    def time(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(token_cache_module, "time", clock)
+    return clock
+
+@pytest.fixture
+def cache():
+    return TokenCache(secret_key=SECRET, algorithm="HS256", max_entries=2, ttl=60, max_token_age=1800)
+
+def _token(login: str, issued_at: float, expires_in: float = 7200) -> str:
+    return jwt.encode({"sub": login, "iat": int(issued_at), "exp": int(issued_at + expires_in)}, SECRET, algorithm="HS256")
+
+def test_claims_are_cached_until_ttl(cache, clock, monkeypatch):
+    token = _token("ana", clock.now)
+    cache.decode(token)
+
+    decoded = []
+    monkeypatch.setattr(token_cache_module.jwt, "decode", lambda *args, **kwargs: decoded.append(args) or {"sub": "ana"})
+
+    clock.now += 59
+    assert cache.decode(token)["sub"] == "ana"
+    assert decoded == []
+
+    # Depois do TTL a assinatura é verificada de novo
+    clock.now += 2
+    cache.decode(token)
+    assert len(decoded) == 1
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2}
+
+def test_entry_never_outlives_token_expiration(clock):
+    cache = TokenCache(secret_key=SECRET, algorithm="HS256", max_entries=2, ttl=7200, max_token_age=7200)
+    token = _token("ana", clock.now, expires_in=3610)
+    cache.decode(token)
+
+    clock.now += 3609
+    cache.decode(token)
+    # Passado o `exp`, o token volta ao `jwt.decode` mesmo dentro do TTL
+    clock.now += 2
+    cache.decode(token)
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+def test_expired_token_is_rejected(cache):
+    token = _token("ana", time.time() - 120, expires_in=60)
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        cache.decode(token)
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    for login in ("ana", "bia", "caio"):
+        cache.decode(_token(login, clock.now))
+
+    assert cache.stats()["entries"] == 2
+
+def test_invalid_signature_is_rejected(cache, clock):
+    token = jwt.encode({"sub": "ana", "iat": int(clock.now)}, "other-secret", algorithm="HS256")
+
+    with pytest.raises(jwt.InvalidTokenError):
+        cache.decode(token)
+
+def test_invalidate_user_only_affects_tokens_issued_before(cache, clock):
+    old_claims = cache.decode(_token("ana", clock.now))
+    other_claims = cache.decode(_token("bia", clock.now))
+
+    clock.now += 1
+    cache.invalidate_user("ana")
+    clock.now += 1
+    new_claims = cache.decode(_token("ana", clock.now))
+
+    assert not cache.is_current(old_claims)
+    assert cache.is_current(other_claims)
+    assert cache.is_current(new_claims)